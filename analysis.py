@@ -2,12 +2,64 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+import time
+from concurrent.futures import Executor
+from dataclasses import asdict, dataclass, field
+from itertools import repeat
 from typing import Any
 
 import numpy as np
 import pandas as pd
-from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+from pandas.api.types import (
+    infer_dtype,
+    is_bool_dtype,
+    is_datetime64_any_dtype,
+    is_integer_dtype,
+    is_numeric_dtype,
+)
+from pandas.tseries.api import guess_datetime_format
+
+from sketches import KLL_RANK_ERROR, SKETCH_CHUNK_ROWS, HyperLogLog, KLLSketch
+from tracing import traced
+
+PROTECTED_NUMERIC_TOKENS = ("id", "code", "zip", "postal", "phone")
+DATE_TOKENS = ("date", "time", "timestamp", "created", "updated")
+# Inference first converts an evenly spaced sample this large. The slack sends
+# near-threshold columns on to the exact full-column confirm pass, which makes a
+# flipped decision unlikely but not impossible: clustered or periodic failures
+# can slip past an evenly spaced sample. The confirm pass catches a sample that
+# looks cleaner than its column; one that looks worse leaves the column as text.
+INFERENCE_SAMPLE_ROWS = 1_000
+INFERENCE_SAMPLE_SLACK = 0.1
+# Text columns with at most this many distinct values, repeating on average at
+# least twice, are stored as categories.
+CATEGORY_MAX_UNIQUE = 1_000
+CATEGORY_MAX_RATIO = 0.5
+# FNV-1a parameters for folding per-column codes into a row fingerprint.
+FINGERPRINT_OFFSET = np.uint64(0xCBF29CE484222325)
+FINGERPRINT_PRIME = np.uint64(0x100000001B3)
+# Column statistics keep this many most frequent values, and these quartiles of numbers.
+TOP_VALUES = 10
+QUARTILES = (0.25, 0.5, 0.75)
+# Every character str.strip() removes, so the Arrow kernel trims exactly the same.
+PYTHON_WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005"
+    "\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+
+@dataclass(frozen=True)
+class TypeDecision:
+    column: str
+    sample_rows: int
+    decision: str
+
+
+@dataclass(frozen=True)
+class ColumnMemory:
+    column: str
+    bytes_before: int
+    bytes_after: int
 
 
 @dataclass(frozen=True)
@@ -23,10 +75,66 @@ class CleaningReport:
     trimmed_text_columns: int
     numeric_columns_inferred: int
     datetime_columns_inferred: int
-
-    def to_dict(self) -> dict[str, int]:
+    categorical_columns_encoded: int = 0
+    type_decisions: tuple[TypeDecision, ...] = ()
+    column_seconds: tuple[tuple[str, float], ...] = field(default=(), compare=False)
+    integer_columns_downcast: int = 0
+    memory_budget_rows_removed: int = 0
+    column_memory: tuple[ColumnMemory, ...] = field(default=(), compare=False)
+    memory_audited: bool = field(default=False, compare=False)
+
+    @property
+    def bytes_before(self) -> int:
+        return sum(entry.bytes_before for entry in self.column_memory)
+
+    @property
+    def bytes_after(self) -> int:
+        return sum(entry.bytes_after for entry in self.column_memory)
+
+    def to_dict(self) -> dict[str, Any]:
         return asdict(self)
 
+    @classmethod
+    def from_dict(cls, values: dict[str, Any]) -> CleaningReport:
+        timings = tuple((str(column), float(seconds)) for column, seconds in values.get("column_seconds", ()))
+        decisions = tuple(TypeDecision(**decision) for decision in values.get("type_decisions", ()))
+        memory = tuple(ColumnMemory(**entry) for entry in values.get("column_memory", ()))
+        return cls(
+            **{**values, "type_decisions": decisions, "column_seconds": timings, "column_memory": memory}
+        )
+
+
+@dataclass(frozen=True)
+class ColumnStats:
+    """What profiling, role detection and insights read about one column, from a single scan."""
+
+    column: str
+    rows: int
+    null_count: int
+    distinct: int
+    top_values: tuple[tuple[Any, int], ...] = ()
+    example: Any = None
+    minimum: Any = None
+    maximum: Any = None
+    quartiles: tuple[float, ...] = ()
+    outliers: int = 0
+    # Non-zero when ``distinct`` is a HyperLogLog estimate (relative standard
+    # error) or ``quartiles`` come from a KLL sketch (rank error, 99% confidence).
+    distinct_error: float = 0.0
+    rank_error: float = 0.0
+
+    @property
+    def non_null(self) -> int:
+        return self.rows - self.null_count
+
+    @property
+    def missing_rate(self) -> float:
+        return self.null_count / self.rows if self.rows else float("nan")
+
+    @property
+    def unique_ratio(self) -> float:
+        return self.distinct / max(self.non_null, 1)
+
 
 @dataclass(frozen=True)
 class Insight:
@@ -49,7 +157,36 @@ def _make_unique_columns(columns: pd.Index) -> list[str]:
     return result
 
 
+def _strip_text(series: pd.Series) -> pd.Series:
+    """Strip surrounding whitespace from string cells, leaving every other cell untouched."""
+    if isinstance(series.dtype, pd.StringDtype):
+        return series.str.strip()
+    if infer_dtype(series, skipna=True) != "string":
+        return series.map(lambda value: value.strip() if isinstance(value, str) else value)
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        return series.str.strip()
+
+    values = pa.array(series, type=pa.string(), from_pandas=True)
+    trimmed = pc.utf8_trim(values, characters=PYTHON_WHITESPACE)
+    changed = pc.fill_null(pc.not_equal(values, trimmed), False).to_numpy(zero_copy_only=False)
+    if not changed.any():
+        return series
+    if changed.all():
+        return pd.Series(trimmed.to_numpy(zero_copy_only=False), index=series.index, name=series.name)
+    stripped = series.copy()
+    stripped[changed] = trimmed.filter(pa.array(changed)).to_numpy(zero_copy_only=False)
+    return stripped
+
+
 def _looks_like_exported_index(series: pd.Series, name: str) -> bool:
+    """An unnamed column numbering the rows, from zero or by the frame's own row labels.
+
+    A chunk of a larger source is labelled by source row, so its slice of an
+    exported index matches the labels rather than starting at zero.
+    """
     if not name.lower().startswith("unnamed"):
         return False
 
@@ -57,17 +194,319 @@ def _looks_like_exported_index(series: pd.Series, name: str) -> bool:
     if numeric.isna().any():
         return False
 
-    return np.array_equal(numeric.to_numpy(), np.arange(len(series)))
+    values = numeric.to_numpy()
+    return np.array_equal(values, np.arange(len(series))) or (
+        is_integer_dtype(series.index) and np.array_equal(values, series.index.to_numpy())
+    )
+
+
+def _sample_positions(mask: np.ndarray) -> np.ndarray:
+    """Evenly spaced positions of non-null cells, one per stratum of the column."""
+    positions = np.flatnonzero(mask)
+    if len(positions) <= INFERENCE_SAMPLE_ROWS:
+        return positions
+    return positions[np.linspace(0, len(positions) - 1, INFERENCE_SAMPLE_ROWS).astype(int)]
+
+
+def _datetime_format(values: pd.Series) -> str | None:
+    """The format pandas would infer from the first value, guessed once for sample and column."""
+    first = values.dropna()
+    if first.empty or not isinstance(first.iloc[0], str):
+        return None
+    return guess_datetime_format(first.iloc[0])
+
+
+def _normalize_text_column(
+    series: pd.Series, column: str, *, infer_types: bool
+) -> tuple[pd.Series, TypeDecision | None]:
+    """Trim a text column and, when confident, convert it to dates or numbers.
+
+    Each conversion is first tried on a bounded sample. Only columns whose
+    sample comes close to the threshold pay for converting every row.
+    """
+    present = series.notna().to_numpy()
+    non_null_before = int(present.sum())
+    normalized = _strip_text(series).replace("", pd.NA)
+    if non_null_before == 0 or not infer_types:
+        return normalized, None
+
+    positions = _sample_positions(present)
+    sample = normalized.iloc[positions]
+    normalized_name = column.lower()
+    if any(token in normalized_name for token in DATE_TOKENS):
+        date_format = _datetime_format(normalized)
+        parsed_sample = pd.to_datetime(sample, errors="coerce", format=date_format)
+        if parsed_sample.notna().mean() >= 0.8 - INFERENCE_SAMPLE_SLACK:
+            parsed_dates = pd.to_datetime(normalized, errors="coerce", format=date_format)
+            if parsed_dates.notna().sum() / non_null_before >= 0.8:
+                return parsed_dates, TypeDecision(column, len(positions), "datetime")
+
+    if not any(token in normalized_name for token in PROTECTED_NUMERIC_TOKENS):
+        parsed_sample = pd.to_numeric(sample, errors="coerce")
+        if parsed_sample.notna().mean() >= 0.95 - INFERENCE_SAMPLE_SLACK:
+            parsed_numeric = pd.to_numeric(normalized, errors="coerce")
+            if parsed_numeric.notna().sum() / non_null_before >= 0.95:
+                return parsed_numeric, TypeDecision(column, len(positions), "numeric")
+            return normalized, TypeDecision(column, len(positions), "text after full check")
+    return normalized, TypeDecision(column, len(positions), "text")
+
+
+def column_kinds(dataframe: pd.DataFrame) -> dict[str, str]:
+    """Each column's kind as cleaning left it: ``numeric``, ``datetime``, ``text``, or ``other``."""
+    kinds: dict[str, str] = {}
+    for column in dataframe.columns:
+        values = dataframe[column]
+        if is_datetime64_any_dtype(values):
+            kinds[column] = "datetime"
+        elif is_bool_dtype(values):
+            kinds[column] = "other"
+        elif is_numeric_dtype(values):
+            kinds[column] = "numeric"
+        else:
+            kinds[column] = "text"
+    return kinds
+
+
+def conform_types(dataframe: pd.DataFrame, kinds: dict[str, str]) -> None:
+    """Convert a chunk's columns in place to the kinds the first chunk settled on.
+
+    A value that does not convert becomes missing, as it would had the whole
+    column been inferred at once. Columns the first chunk did not have keep
+    the kind they arrive with, which later chunks are then held to.
+    """
+    for column, kind in column_kinds(dataframe).items():
+        target = kinds.setdefault(column, kind)
+        if kind == target or target == "other":
+            continue
+        values = dataframe[column]
+        if target == "numeric":
+            dataframe[column] = pd.to_numeric(values, errors="coerce")
+        elif target == "datetime":
+            dataframe[column] = pd.to_datetime(values, errors="coerce", format=_datetime_format(values))
+        else:
+            dataframe[column] = values.astype(object).where(values.isna(), values.astype(str))
+
+
+def _duplicate_mask(dataframe: pd.DataFrame) -> np.ndarray:
+    """Rows that repeat an earlier row, found from one 64-bit fingerprint per row.
 
+    Fingerprints fold each column's factorized codes, so equal rows always share
+    one. Only rows whose fingerprint repeats are compared exactly, which settles
+    any hash collision.
+    """
+    fingerprints = np.full(len(dataframe), FINGERPRINT_OFFSET, dtype=np.uint64)
+    for _, column in dataframe.items():
+        codes, _ = pd.factorize(column)
+        fingerprints ^= codes.astype(np.uint64)
+        fingerprints *= FINGERPRINT_PRIME
 
-def clean_dataframe(dataframe: pd.DataFrame) -> tuple[pd.DataFrame, CleaningReport]:
-    """Apply conservative, explainable cleaning and return an audit report."""
+    mask = np.zeros(len(dataframe), dtype=bool)
+    candidates = pd.Series(fingerprints).duplicated(keep=False).to_numpy()
+    if candidates.any():
+        mask[candidates] = dataframe.loc[candidates].duplicated().to_numpy()
+    return mask
+
+
+def _encode_categories(dataframe: pd.DataFrame) -> int:
+    """Store repetitive text columns as integer codes plus a dictionary, in place."""
+    encoded = 0
+    for column in dataframe.select_dtypes(include=["object", "string"]).columns:
+        series = dataframe[column]
+        limit = min(CATEGORY_MAX_UNIQUE, CATEGORY_MAX_RATIO * series.notna().sum())
+        # A prefix already over the limit rules the column out without hashing all of it.
+        if series.iloc[: CATEGORY_MAX_UNIQUE * 10].nunique(dropna=True) > limit:
+            continue
+        codes, categories = pd.factorize(series, sort=True)
+        if 0 < len(categories) <= limit and infer_dtype(categories, skipna=False) == "string":
+            dataframe[column] = pd.Categorical.from_codes(codes, categories=categories)
+            encoded += 1
+    return encoded
+
+
+def _downcast_integers(dataframe: pd.DataFrame) -> int:
+    """Store 64-bit integer columns in the smallest signed type that holds every value, in place.
+
+    Sums and group-by sums accumulate small integers in 64 bits, so totals are
+    unchanged. Floats keep 64 bits: float32 would round values and totals.
+    """
+    downcast = 0
+    for column in dataframe.select_dtypes(include=["int64"]).columns:
+        smaller = pd.to_numeric(dataframe[column], downcast="integer")
+        if smaller.dtype != dataframe[column].dtype:
+            dataframe[column] = smaller
+            downcast += 1
+    return downcast
+
+
+def ranked_counts(series: pd.Series, *, normalize: bool = False) -> pd.Series:
+    """``value_counts`` with the same ranking and tie order for text and categorical columns.
+
+    Categorical counts come from the integer codes and skip unused categories,
+    so a filtered column never reports values it no longer holds.
+    """
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        return series.value_counts(normalize=normalize, dropna=True)
+    codes = pd.Series(series.cat.codes.to_numpy())
+    counts = codes[codes >= 0].value_counts(normalize=normalize)
+    counts.index = pd.Index(series.cat.categories.take(counts.index.to_numpy()), name=series.name)
+    return counts
+
+
+def _numeric_stats(values: np.ndarray, **common: Any) -> ColumnStats:
+    """Distinct values, top values, range, quartiles and 1.5×IQR outliers from one sort."""
+    values = np.sort(values.astype(np.float64) if values.dtype == object else values)
+    if not len(values):
+        return ColumnStats(**common, distinct=0)
+
+    starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+    counts = np.diff(np.r_[starts, len(values)])
+
+    first_quartile, median, third_quartile = (float(value) for value in np.quantile(values, QUARTILES))
+    iqr = third_quartile - first_quartile
+    outliers = int(
+        np.searchsorted(values, first_quartile - 1.5 * iqr, "left")
+        + len(values)
+        - np.searchsorted(values, third_quartile + 1.5 * iqr, "right")
+    )
+    ranked = np.argsort(-counts, kind="stable")[:TOP_VALUES]
+    return ColumnStats(
+        **common,
+        distinct=len(starts),
+        top_values=tuple((values[starts[index]], int(counts[index])) for index in ranked),
+        minimum=values[0],
+        maximum=values[-1],
+        quartiles=(first_quartile, median, third_quartile),
+        outliers=outliers,
+    )
+
+
+def _sketched_stats(values: np.ndarray, present: np.ndarray, **common: Any) -> ColumnStats:
+    """Distinct count, range, quartiles and outliers of a very large numeric column, chunk by chunk.
+
+    Nothing column-sized is allocated: the distinct count and quartiles come
+    from sketches, and outliers are counted exactly against the sketched fences.
+    """
+    distinct, quantiles = HyperLogLog(), KLLSketch()
+    bounds = (slice(start, start + SKETCH_CHUNK_ROWS) for start in range(0, len(values), SKETCH_CHUNK_ROWS))
+    chunks = [bound for bound in bounds if present[bound].any()]
+    if not chunks:
+        return ColumnStats(**common, distinct=0)
+
+    def chunk_values(bound: slice) -> np.ndarray:
+        chunk = values[bound][present[bound]]
+        return chunk.astype(np.float64) if chunk.dtype == object else chunk
+
+    minimum = maximum = None
+    for bound in chunks:
+        chunk = chunk_values(bound)
+        distinct.update(chunk)
+        quantiles.update(chunk)
+        minimum = chunk.min() if minimum is None else min(minimum, chunk.min())
+        maximum = chunk.max() if maximum is None else max(maximum, chunk.max())
+
+    first_quartile, median, third_quartile = quantiles.quantiles(QUARTILES)
+    iqr = third_quartile - first_quartile
+    lower, upper = first_quartile - 1.5 * iqr, third_quartile + 1.5 * iqr
+    outliers = 0
+    for bound in chunks:
+        chunk = chunk_values(bound)
+        outliers += int(np.count_nonzero((chunk < lower) | (chunk > upper)))
+    return ColumnStats(
+        **common,
+        distinct=min(max(round(distinct.estimate()), 1), quantiles.count),
+        minimum=minimum,
+        maximum=maximum,
+        quartiles=(first_quartile, median, third_quartile),
+        outliers=outliers,
+        distinct_error=distinct.relative_error,
+        rank_error=KLL_RANK_ERROR,
+    )
+
+
+def column_stats(series: pd.Series, *, sketch_rows: int | None = None) -> ColumnStats:
+    """Null count, distinct and top values, range and quartiles of one column in one scan.
+
+    Numbers are sorted once and everything is read off the sorted values; other
+    columns are counted once with ``ranked_counts``. Numeric top values break
+    ties by value, other columns by first appearance. Numeric columns longer
+    than ``sketch_rows`` are summarized by sketches instead of a sort, keep no
+    top values, and record the error bounds of their estimates.
+    """
+    present = series.notna().to_numpy()
+    non_null = int(present.sum())
+    common = {
+        "column": str(series.name),
+        "rows": len(series),
+        "null_count": len(series) - non_null,
+        "example": series.iloc[int(present.argmax())] if non_null else None,
+    }
+    if is_numeric_dtype(series) and not is_bool_dtype(series):
+        if sketch_rows is not None and len(series) > sketch_rows:
+            return _sketched_stats(series.to_numpy(), present, **common)
+        return _numeric_stats(series.to_numpy()[present], **common)
+
+    counts = ranked_counts(series)
+    minimum = maximum = None
+    if is_datetime64_any_dtype(series) and non_null:
+        minimum, maximum = counts.index.min(), counts.index.max()
+    return ColumnStats(
+        **common,
+        distinct=len(counts),
+        top_values=tuple(counts.head(TOP_VALUES).items()),
+        minimum=minimum,
+        maximum=maximum,
+    )
+
+
+def _sketch_disclosure(stats: ColumnStats) -> str:
+    if not stats.rank_error:
+        return "."
+    return f", with quartiles estimated to within ±{stats.rank_error:.2%} of rank."
+
+
+@traced
+def frame_stats(dataframe: pd.DataFrame, *, sketch_rows: int | None = None) -> dict[str, ColumnStats]:
+    """``column_stats`` for every column, computed once and shared by every consumer."""
+    return {column: column_stats(series, sketch_rows=sketch_rows) for column, series in dataframe.items()}
+
+
+def _timed_normalize(
+    series: pd.Series, column: str, infer_types: bool
+) -> tuple[pd.Series, TypeDecision | None, float]:
+    started = time.perf_counter()
+    normalized, decision = _normalize_text_column(series, column, infer_types=infer_types)
+    return normalized, decision, time.perf_counter() - started
+
+
+@traced
+def clean_dataframe(
+    dataframe: pd.DataFrame,
+    *,
+    infer_types: bool = True,
+    executor: Executor | None = None,
+    encode_categories: bool = True,
+    downcast: bool = False,
+    memory_audit: bool = False,
+) -> tuple[pd.DataFrame, CleaningReport]:
+    """Apply conservative, explainable cleaning and return an audit report.
+
+    ``infer_types=False`` skips date and number inference for sources such as
+    Parquet whose column types are already authoritative. With an ``executor``
+    (thread or process pool), text columns are normalized concurrently; the
+    result is identical to the sequential run. Low-cardinality text columns are
+    stored as ``category`` unless ``encode_categories`` is False, and with
+    ``downcast`` integer columns shrink to the smallest type that holds them.
+    The report records each column's memory before and after cleaning; only a
+    ``memory_audit`` counts the bytes behind text values, which costs a pass
+    over every string.
+    """
     if dataframe.empty or len(dataframe.columns) == 0:
         raise ValueError("The CSV does not contain any rows and columns to analyze.")
 
     cleaned = dataframe.copy()
     original_rows, original_columns = cleaned.shape
     cleaned.columns = _make_unique_columns(cleaned.columns)
+    bytes_before = cleaned.memory_usage(index=False, deep=memory_audit)
 
     empty_columns = [column for column in cleaned.columns if cleaned[column].isna().all()]
     cleaned = cleaned.drop(columns=empty_columns)
@@ -85,35 +524,30 @@ def clean_dataframe(dataframe: pd.DataFrame) -> tuple[pd.DataFrame, CleaningRepo
     numeric_columns_inferred = 0
     datetime_columns_inferred = 0
 
-    protected_numeric_tokens = ("id", "code", "zip", "postal", "phone")
-    date_tokens = ("date", "time", "timestamp", "created", "updated")
-
-    for column in cleaned.select_dtypes(include=["object", "string"]).columns:
-        series = cleaned[column]
-        non_null_before = int(series.notna().sum())
-        cleaned[column] = series.map(lambda value: value.strip() if isinstance(value, str) else value)
-        cleaned[column] = cleaned[column].replace("", pd.NA)
+    type_decisions: list[TypeDecision] = []
+    column_seconds: list[tuple[str, float]] = []
+    text_columns = cleaned.select_dtypes(include=["object", "string"]).columns.tolist()
+    arguments = ([cleaned[column] for column in text_columns], text_columns, repeat(infer_types))
+    if executor is not None and len(text_columns) > 1:
+        results = list(executor.map(_timed_normalize, *arguments))
+    else:
+        results = list(map(_timed_normalize, *arguments))
+
+    # Results are merged in column order, so the frame and report do not depend on scheduling.
+    for column, (series, decision, seconds) in zip(text_columns, results, strict=True):
+        cleaned[column] = series
+        column_seconds.append((column, seconds))
         trimmed_text_columns += 1
+        if decision is not None:
+            type_decisions.append(decision)
+            numeric_columns_inferred += decision.decision == "numeric"
+            datetime_columns_inferred += decision.decision == "datetime"
 
-        if non_null_before == 0:
-            continue
-
-        normalized_name = column.lower()
-        if any(token in normalized_name for token in date_tokens):
-            parsed_dates = pd.to_datetime(cleaned[column], errors="coerce")
-            if parsed_dates.notna().sum() / non_null_before >= 0.8:
-                cleaned[column] = parsed_dates
-                datetime_columns_inferred += 1
-                continue
-
-        if not any(token in normalized_name for token in protected_numeric_tokens):
-            parsed_numeric = pd.to_numeric(cleaned[column], errors="coerce")
-            if parsed_numeric.notna().sum() / non_null_before >= 0.95:
-                cleaned[column] = parsed_numeric
-                numeric_columns_inferred += 1
-
-    duplicate_rows = int(cleaned.duplicated().sum())
-    cleaned = cleaned.drop_duplicates().reset_index(drop=True)
+    duplicate_mask = _duplicate_mask(cleaned)
+    duplicate_rows = int(duplicate_mask.sum())
+    cleaned = cleaned.loc[~duplicate_mask].reset_index(drop=True)
+    categorical_columns = _encode_categories(cleaned) if encode_categories else 0
+    integer_columns = _downcast_integers(cleaned) if downcast else 0
 
     if cleaned.empty or len(cleaned.columns) == 0:
         raise ValueError("No analyzable data remained after removing empty rows and columns.")
@@ -130,36 +564,51 @@ def clean_dataframe(dataframe: pd.DataFrame) -> tuple[pd.DataFrame, CleaningRepo
         trimmed_text_columns=trimmed_text_columns,
         numeric_columns_inferred=numeric_columns_inferred,
         datetime_columns_inferred=datetime_columns_inferred,
+        categorical_columns_encoded=categorical_columns,
+        type_decisions=tuple(type_decisions),
+        column_seconds=tuple(column_seconds),
+        integer_columns_downcast=integer_columns,
+        column_memory=_column_memory(bytes_before, cleaned.memory_usage(index=False, deep=memory_audit)),
+        memory_audited=memory_audit,
     )
     return cleaned, report
 
 
-def column_profile(dataframe: pd.DataFrame) -> pd.DataFrame:
+def _column_memory(before: pd.Series, after: pd.Series) -> tuple[ColumnMemory, ...]:
+    """Pair each source column's bytes with its cleaned bytes; removed columns end at zero."""
+    return tuple(
+        ColumnMemory(column=str(column), bytes_before=int(size), bytes_after=int(after.get(column, 0)))
+        for column, size in before.items()
+    )
+
+
+def column_profile(dataframe: pd.DataFrame, stats: dict[str, ColumnStats] | None = None) -> pd.DataFrame:
     """Build a compact data dictionary suitable for display or export."""
+    stats = stats or frame_stats(dataframe)
     rows: list[dict[str, Any]] = []
 
     for column in dataframe.columns:
         series = dataframe[column]
-        non_null = series.dropna()
-        sample = "—" if non_null.empty else str(non_null.iloc[0])[:80]
+        column_stat = stats[column]
+        sample = "—" if column_stat.non_null == 0 else str(column_stat.example)[:80]
 
         if is_datetime64_any_dtype(series):
             semantic_type = "datetime"
         elif is_numeric_dtype(series):
             semantic_type = "numeric"
         else:
-            unique_ratio = series.nunique(dropna=True) / max(len(non_null), 1)
-            semantic_type = "category" if series.nunique(dropna=True) <= 50 or unique_ratio <= 0.2 else "text"
+            category = column_stat.distinct <= 50 or column_stat.unique_ratio <= 0.2
+            semantic_type = "category" if category else "text"
 
         rows.append(
             {
                 "Column": column,
                 "Type": semantic_type,
                 "Pandas dtype": str(series.dtype),
-                "Non-null": int(series.notna().sum()),
-                "Missing": int(series.isna().sum()),
-                "Missing %": round(float(series.isna().mean() * 100), 2),
-                "Unique": int(series.nunique(dropna=True)),
+                "Non-null": column_stat.non_null,
+                "Missing": column_stat.null_count,
+                "Missing %": round(float(column_stat.missing_rate * 100), 2),
+                "Unique": column_stat.distinct,
                 "Example": sample,
             }
         )
@@ -167,12 +616,17 @@ def column_profile(dataframe: pd.DataFrame) -> pd.DataFrame:
     return pd.DataFrame(rows)
 
 
-def generate_insights(dataframe: pd.DataFrame, limit: int = 6) -> list[Insight]:
+def generate_insights(
+    dataframe: pd.DataFrame, limit: int = 6, stats: dict[str, ColumnStats] | None = None
+) -> list[Insight]:
     """Generate factual, reproducible observations without an external model."""
+    stats = stats or frame_stats(dataframe)
     insights: list[Insight] = []
     row_count = len(dataframe)
 
-    missing = dataframe.isna().mean().sort_values(ascending=False)
+    missing = pd.Series(
+        {column: stats[column].missing_rate for column in dataframe.columns}, dtype="float64"
+    ).sort_values(ascending=False)
     if not missing.empty and missing.iloc[0] > 0:
         column = str(missing.index[0])
         rate = float(missing.iloc[0] * 100)
@@ -202,23 +656,22 @@ def generate_insights(dataframe: pd.DataFrame, limit: int = 6) -> list[Insight]:
 
     outlier_candidates: list[tuple[str, int, float]] = []
     for column in numeric_columns:
-        series = dataframe[column].dropna()
-        if len(series) < 8 or series.nunique() < 3:
+        column_stat = stats[column]
+        if column_stat.non_null < 8 or column_stat.distinct < 3:
             continue
-        first_quartile, third_quartile = series.quantile([0.25, 0.75])
-        iqr = third_quartile - first_quartile
-        if iqr == 0:
+        first_quartile, _, third_quartile = column_stat.quartiles
+        if third_quartile - first_quartile == 0:
             continue
-        count = int(((series < first_quartile - 1.5 * iqr) | (series > third_quartile + 1.5 * iqr)).sum())
-        if count:
-            outlier_candidates.append((column, count, count / len(series) * 100))
+        if count := column_stat.outliers:
+            outlier_candidates.append((column, count, count / column_stat.non_null * 100))
 
     if outlier_candidates:
         column, count, rate = max(outlier_candidates, key=lambda candidate: candidate[2])
         insights.append(
             Insight(
                 "Potential outliers",
-                f"{column} contains {count:,} values ({rate:.1f}%) outside the standard 1.5×IQR range.",
+                f"{column} contains {count:,} values ({rate:.1f}%) outside the standard 1.5×IQR range"
+                + _sketch_disclosure(stats[column]),
                 "warning",
             )
         )
@@ -226,9 +679,10 @@ def generate_insights(dataframe: pd.DataFrame, limit: int = 6) -> list[Insight]:
     non_numeric_columns = [column for column in dataframe.columns if column not in numeric_columns]
     dominance_candidates: list[tuple[str, str, float]] = []
     for column in non_numeric_columns:
-        counts = dataframe[column].value_counts(normalize=True, dropna=True)
-        if not counts.empty and dataframe[column].nunique(dropna=True) <= 100:
-            dominance_candidates.append((column, str(counts.index[0]), float(counts.iloc[0] * 100)))
+        column_stat = stats[column]
+        if column_stat.top_values and column_stat.distinct <= 100:
+            value, count = column_stat.top_values[0]
+            dominance_candidates.append((column, str(value), float(count / column_stat.non_null * 100)))
 
     if dominance_candidates:
         column, value, share = max(dominance_candidates, key=lambda candidate: candidate[2])
@@ -242,13 +696,13 @@ def generate_insights(dataframe: pd.DataFrame, limit: int = 6) -> list[Insight]:
 
     datetime_columns = dataframe.select_dtypes(include=["datetime", "datetimetz"]).columns.tolist()
     if datetime_columns:
-        column = datetime_columns[0]
-        values = dataframe[column].dropna()
-        if not values.empty:
+        column_stat = stats[datetime_columns[0]]
+        if column_stat.non_null:
             insights.append(
                 Insight(
                     "Time coverage",
-                    f"{column} spans {values.min():%Y-%m-%d} through {values.max():%Y-%m-%d}.",
+                    f"{column_stat.column} spans {column_stat.minimum:%Y-%m-%d} "
+                    f"through {column_stat.maximum:%Y-%m-%d}.",
                 )
             )
 
@@ -282,7 +736,7 @@ def build_markdown_report(
         "",
         f"- Rows: {len(dataframe):,}",
         f"- Columns: {len(dataframe.columns):,}",
-        f"- Missing cells: {int(dataframe.isna().sum().sum()):,}",
+        f"- Missing cells: {int(profile['Missing'].sum()):,}",
         f"- Duplicate rows removed: {cleaning_report.duplicate_rows_removed:,}",
         "",
         "## Key observations",
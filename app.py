@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import hashlib
+import multiprocessing
 import os
 import secrets
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import pandas as pd
 import streamlit as st
@@ -19,19 +22,43 @@ from ai_insights import (
     narrative_to_markdown,
     plan_query_with_ai,
 )
-from analysis import column_profile
-from business_insights import BusinessBrief, analyze_business, build_business_report
+from analysis import column_profile, frame_stats
+from business_insights import (
+    BusinessBrief,
+    ColumnRoles,
+    aggregate_cube,
+    analyze_business,
+    build_business_report,
+)
 from demo_data import make_demo_data
-from file_io import list_excel_sheets, read_tabular_file
-from nlq import QueryAnswer, answer_question, execute_plan, suggested_questions
+from file_io import list_excel_sheets
+from nlq import (
+    AnswerCache,
+    QueryAnswer,
+    QueryExecutor,
+    QuestionIndex,
+    answer_question,
+    build_question_index,
+    execute_plan,
+    suggested_questions,
+)
+from parse_cache import ParseCache
 from pipeline import (
+    SAMPLING_MODES,
+    PreparedAnalysis,
     apply_focus,
     apply_role_selection,
     cleaning_audit_frame,
     focus_options,
+    memory_audit_frame,
+    parse_audit_frame,
     prepare_analysis,
+    prepare_upload,
     schema_frame,
+    trace_frame,
+    type_inference_frame,
 )
+from tracing import Trace, activate
 from ui import (
     inject_styles,
     render_ai_narrative,
@@ -52,6 +79,46 @@ from ui import (
 
 MAX_UPLOAD_BYTES = 25 * 1024 * 1024
 MAX_ANALYSIS_ROWS = 250_000
+PARSE_CACHE = ParseCache.from_environment()
+ARROW_DTYPES = os.getenv("ADA_ARROW_DTYPES", "").strip().lower() in {"1", "true", "yes"}
+
+
+def _environment_int(name: str, default: int) -> int:
+    """A non-negative whole-number setting; a malformed value warns and keeps the default."""
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        warnings.warn(
+            f"Ignoring {name}={value!r}: expected a whole number of 0 or more; using {default}.", stacklevel=2
+        )
+        return default
+    return number
+
+
+def _environment_choice(name: str, choices: tuple[str, ...], default: str) -> str:
+    """One of ``choices``; an unknown value warns and keeps the default."""
+    value = os.getenv(name, "").strip().lower()
+    if not value:
+        return default
+    if value in choices:
+        return value
+    warnings.warn(
+        f"Ignoring {name}={value!r}: expected one of {', '.join(choices)}; using {default}.", stacklevel=2
+    )
+    return default
+
+
+CLEANING_WORKERS = _environment_int("ADA_CLEANING_WORKERS", 1)
+EVIDENCE_WORKERS = _environment_int("ADA_EVIDENCE_WORKERS", 1)
+MEMORY_BUDGET_MB = _environment_int("ADA_MEMORY_BUDGET_MB", 0)
+SKETCH_ROWS = _environment_int("ADA_SKETCH_ROWS", 0) or None
+SAMPLING = _environment_choice("ADA_SAMPLING", SAMPLING_MODES, "head")
+TRACE = os.getenv("ADA_TRACE", "").strip().lower()
 
 st.set_page_config(
     page_title="ADA | AI Business Dashboard from CSV & Excel",
@@ -66,9 +133,61 @@ st.set_page_config(
 )
 
 
+@st.cache_resource(show_spinner=False)
+def cleaning_executor() -> ProcessPoolExecutor | None:
+    """A long-lived process pool, so wide uploads clean on every core without per-upload startup."""
+    if CLEANING_WORKERS <= 1:
+        return None
+    return ProcessPoolExecutor(max_workers=CLEANING_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+
+
+@st.cache_resource(show_spinner=False)
+def evidence_executor() -> ThreadPoolExecutor | None:
+    """A shared thread pool for the brief's evidence builders, whose pandas kernels release the GIL."""
+    if EVIDENCE_WORKERS <= 1:
+        return None
+    return ThreadPoolExecutor(max_workers=EVIDENCE_WORKERS, thread_name_prefix="ada-evidence")
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def question_index(version: str, roles: ColumnRoles, _dataframe: pd.DataFrame) -> QuestionIndex:
+    """The chat's phrase index, built once per dataset version, focus, and role selection."""
+    return build_question_index(_dataframe, roles)
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def query_executor(version: str, roles: ColumnRoles, _dataframe: pd.DataFrame) -> QueryExecutor:
+    """The chat's executor, so follow-up questions reuse its column codes and filter masks."""
+    return QueryExecutor(_dataframe, roles)
+
+
+@st.cache_resource(show_spinner=False)
+def answer_cache() -> AnswerCache:
+    """Chat answers shared by every session, keyed by dataset version, so repeats skip execution."""
+    return AnswerCache()
+
+
+@st.cache_data(show_spinner=False)
+def prepare_demo() -> PreparedAnalysis:
+    return prepare_analysis(make_demo_data(), row_limit=MAX_ANALYSIS_ROWS, sketch_rows=SKETCH_ROWS, sampling=SAMPLING)
+
+
 @st.cache_data(show_spinner=False)
-def read_uploaded_file(contents: bytes, filename: str, sheet_name: str | None = None) -> pd.DataFrame:
-    return read_tabular_file(contents, filename, sheet_name)
+def prepare_uploaded_file(
+    contents: bytes, filename: str, sheet_name: str | None = None
+) -> PreparedAnalysis:
+    return prepare_upload(
+        contents,
+        filename,
+        row_limit=MAX_ANALYSIS_ROWS,
+        sheet_name=sheet_name,
+        cache=PARSE_CACHE,
+        arrow_dtypes=ARROW_DTYPES,
+        executor=cleaning_executor(),
+        memory_budget=MEMORY_BUDGET_MB * 1024 * 1024 or None,
+        sketch_rows=SKETCH_ROWS,
+        sampling=SAMPLING,
+    )
 
 
 def get_openai_api_key() -> str:
@@ -173,6 +292,8 @@ def answer_with_ai_planner(
     dataframe: pd.DataFrame,
     roles,
     api_key: str,
+    executor: QueryExecutor | None = None,
+    fingerprint: str | None = None,
 ) -> QueryAnswer | None:
     """Plan with the model over schema only, then execute locally."""
     try:
@@ -185,7 +306,10 @@ def answer_with_ai_planner(
         )
         if plan is None:
             return None
-        executed = execute_plan(plan, dataframe, roles)
+        if fingerprint is None:
+            executed = execute_plan(plan, dataframe, roles, executor)
+        else:
+            executed = answer_cache().execute(fingerprint, plan, dataframe, roles, executor)
     except Exception:  # A planner outage must never break the chat.
         return None
     return QueryAnswer(
@@ -198,11 +322,20 @@ def answer_with_ai_planner(
     )
 
 
-def render_ask_ada(dataframe: pd.DataFrame, roles, source_name: str, api_key: str) -> None:
+def render_ask_ada(
+    dataframe: pd.DataFrame,
+    roles,
+    source_name: str,
+    api_key: str,
+    index: QuestionIndex | None = None,
+    executor: QueryExecutor | None = None,
+    fingerprint: str | None = None,
+    sample_rows: int | None = None,
+) -> None:
     """Chat over the analyzed dataset; every answer is a local calculation."""
-    fingerprint = f"{source_name}:{len(dataframe)}:{','.join(dataframe.columns)}"
-    if st.session_state.get("chat_fingerprint") != fingerprint:
-        st.session_state.chat_fingerprint = fingerprint
+    history_key = fingerprint or f"{source_name}:{len(dataframe)}:{','.join(dataframe.columns)}"
+    if st.session_state.get("chat_fingerprint") != history_key:
+        st.session_state.chat_fingerprint = history_key
         st.session_state.chat_history = []
 
     suggestions = suggested_questions(dataframe, roles)
@@ -215,10 +348,12 @@ def render_ask_ada(dataframe: pd.DataFrame, roles, source_name: str, api_key: st
     typed = st.chat_input("Ask about this data — try “top 5 by revenue” or “which segment grew fastest?”")
     question = typed or question
     if question:
-        result = answer_question(question, dataframe, roles)
+        result = answer_question(
+            question, dataframe, roles, index, executor, cache=answer_cache(), fingerprint=fingerprint
+        )
         if result is None and api_key:
             with st.spinner("Planning the calculation…"):
-                result = answer_with_ai_planner(question, dataframe, roles, api_key)
+                result = answer_with_ai_planner(question, dataframe, roles, api_key, executor, fingerprint)
         st.session_state.chat_history.append({"question": question, "result": result})
 
     if not st.session_state.chat_history:
@@ -232,11 +367,19 @@ def render_ask_ada(dataframe: pd.DataFrame, roles, source_name: str, api_key: st
             st.markdown(entry["question"])
         with st.chat_message("assistant"):
             if entry["result"] is not None:
-                render_chat_answer(entry["result"])
+                render_chat_answer(entry["result"], sample_rows)
             else:
                 render_chat_fallback(suggestions)
 
 
+trace = None
+if TRACE in {"1", "true", "yes", "time"}:
+    if "ada_trace" not in st.session_state:
+        st.session_state.ada_trace = Trace(memory=TRACE != "time")
+    trace = st.session_state.ada_trace
+    trace.new_run()
+activate(trace)
+
 inject_styles()
 render_nav()
 render_landing()
@@ -254,9 +397,10 @@ uploaded_file = None
 business_context = ""
 if source_mode == "Upload your file":
     uploaded_file = st.file_uploader(
-        "Upload a CSV or Excel workbook",
-        type=["csv", "xlsx", "xlsm"],
-        help="Maximum file size: 25 MB. ADA analyzes the first worksheet.",
+        "Upload a CSV, Excel, Parquet, or Feather file",
+        type=["csv", "gz", "zst", "zip", "xlsx", "xlsm", "parquet", "feather"],
+        help="Maximum file size: 25 MB. Compressed CSV (.csv.gz, .csv.zst, single-file .zip) is "
+        "decompressed as a stream, up to 1 GB. ADA analyzes the first worksheet.",
     )
     business_context = st.text_input(
         "Optional business context",
@@ -270,7 +414,7 @@ if source_mode == "Upload your file":
 
 try:
     if source_mode == "Explore the live demo":
-        raw_dataframe = make_demo_data()
+        prepared = prepare_demo()
         source_name = "Acme operating data · demo"
         business_context = "Two years of orders across products, regions, and sales channels."
     else:
@@ -287,19 +431,24 @@ try:
                 worksheets,
                 help="The workbook has several sheets; ADA analyzes one at a time.",
             )
-        raw_dataframe = read_uploaded_file(contents, uploaded_file.name, selected_sheet)
+        prepared = prepare_uploaded_file(contents, uploaded_file.name, selected_sheet)
         source_name = (
             f"{uploaded_file.name} · {selected_sheet}" if selected_sheet else uploaded_file.name
         )
-
-    prepared = prepare_analysis(raw_dataframe, row_limit=MAX_ANALYSIS_ROWS)
 except (pd.errors.EmptyDataError, pd.errors.ParserError, UnicodeDecodeError, ValueError, ImportError) as error:
     st.error(f"ADA could not read this file: {error}")
     st.stop()
 
-if prepared.truncated_rows:
+if prepared.truncated_rows and SAMPLING != "head":
+    exact = " Trends, growth, and anomalies use exact totals of every row." if prepared.period_totals else ""
+    st.info(
+        f"ADA analyzed a {SAMPLING} sample of {len(prepared.dataframe):,} rows for predictable performance "
+        f"and left out {prepared.truncated_rows:,}.{exact}"
+    )
+elif prepared.truncated_rows:
+    limit = f"{MAX_ANALYSIS_ROWS:,} rows" + (f" or {MEMORY_BUDGET_MB:,} MB" if MEMORY_BUDGET_MB else "")
     st.warning(
-        f"ADA analyzed the first {MAX_ANALYSIS_ROWS:,} rows for predictable performance "
+        f"ADA analyzed the leading rows within its {limit} limit for predictable performance "
         f"and skipped {prepared.truncated_rows:,}."
     )
 
@@ -356,8 +505,15 @@ if focus_values:
     if choice != everything:
         focus_value = choice
 
+version = f"{prepared.version}:{roles.dimension}={focus_value}" if focus_value else prepared.version
 dataframe, roles = apply_focus(dataframe, roles, focus_value)
-brief = analyze_business(dataframe, roles)
+if dataframe is prepared.dataframe:
+    stats = prepared.column_stats
+    totals = prepared.period_totals.get(roles.date) if roles.date else None
+else:
+    stats, totals = frame_stats(dataframe, sketch_rows=SKETCH_ROWS), None
+cube = aggregate_cube(dataframe, roles, version=version)
+brief = analyze_business(dataframe, roles, stats, totals, cube, executor=evidence_executor())
 
 render_dataset_bar(source_name, dataframe, roles, focus=focus_value)
 render_brief(brief)
@@ -418,7 +574,16 @@ with ask_tab:
         "Questions become transparent pandas calculations that run locally. "
         "No question or answer leaves the session, and every reply shows its math.",
     )
-    render_ask_ada(dataframe, roles, source_name, api_key)
+    render_ask_ada(
+        dataframe,
+        roles,
+        source_name,
+        api_key,
+        index=question_index(version, roles, dataframe),
+        executor=query_executor(version, roles, dataframe),
+        fingerprint=version,
+        sample_rows=len(dataframe) if prepared.truncated_rows and SAMPLING != "head" else None,
+    )
 
 with dashboard_tab:
     render_section_heading(
@@ -426,7 +591,7 @@ with dashboard_tab:
         "The shape of the business",
         "Trend, contribution, distribution, and the strongest measurable relationship—generated without chart configuration.",
     )
-    render_dashboard(dataframe, roles)
+    render_dashboard(dataframe, roles, stats, totals, cube)
 
 with evidence_tab:
     render_section_heading(
@@ -476,19 +641,44 @@ with data_tab:
         "Duplicates removed",
         f"{prepared.cleaning_report.duplicate_rows_removed:,}",
     )
-    quality_columns[3].metric("Missing cells", f"{int(dataframe.isna().sum().sum()):,}")
+    quality_columns[3].metric("Missing cells", f"{sum(column.null_count for column in stats.values()):,}")
 
     with st.expander("Cleaning audit"):
+        if prepared.csv_dialect is not None:
+            st.dataframe(parse_audit_frame(prepared.csv_dialect), hide_index=True, width="stretch")
         st.dataframe(
             cleaning_audit_frame(prepared.cleaning_report),
             hide_index=True,
             width="stretch",
         )
+        if prepared.cleaning_report.type_decisions:
+            st.dataframe(type_inference_frame(prepared.cleaning_report), hide_index=True, width="stretch")
+        if prepared.cleaning_report.memory_audited:
+            st.dataframe(memory_audit_frame(prepared.cleaning_report), hide_index=True, width="stretch")
 
     st.subheader("Cleaned data")
     st.dataframe(dataframe.head(1_000), width="stretch", height=420)
     st.caption("Preview limited to 1,000 rows. The download includes every analyzed row.")
     st.subheader("Data dictionary")
-    st.dataframe(column_profile(dataframe), hide_index=True, width="stretch")
+    st.dataframe(column_profile(dataframe, stats), hide_index=True, width="stretch")
+
+    if trace is not None:
+        st.subheader("Performance trace")
+        st.dataframe(trace_frame(trace.latest()), hide_index=True, width="stretch")
+        st.caption(
+            "Wall time, process CPU time, and peak traced allocation per stage of this run. "
+            "Stages served from Streamlit's cache do not appear."
+        )
+        answers = answer_cache()
+        st.caption(
+            f"Ask ADA answer cache: {answers.hits:,} hits, {answers.misses:,} misses, "
+            f"{len(answers):,} of {answers.max_entries:,} answers held across sessions."
+        )
+        st.download_button(
+            "Download trace (JSON)",
+            data=trace.to_json(),
+            file_name="ada_trace.json",
+            mime="application/json",
+        )
 
 render_footer()
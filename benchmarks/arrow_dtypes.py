@@ -0,0 +1,101 @@
+"""Latency and memory of the upload pipeline with NumPy object text versus Arrow-backed text.
+
+Run from the repository root::
+
+    python -m benchmarks.arrow_dtypes --rows 250000
+
+The demo data is scaled to ``--rows`` and written to CSV, and each mode runs in
+a fresh interpreter so every peak resident set size belongs to that mode
+alone. Each run prepares the upload, builds the brief, and answers the
+suggested questions plus one filtered question per segment.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from demo_data import make_demo_data
+from nlq import answer_question, suggested_questions
+from pipeline import prepare_upload
+
+MODES = ("numpy", "arrow")
+
+
+def _measure(mode: str, path: Path) -> dict[str, float]:
+    contents = path.read_bytes()
+    timings: dict[str, float] = {}
+
+    started = time.perf_counter()
+    prepared = prepare_upload(contents, path.name, row_limit=len(contents), arrow_dtypes=mode == "arrow")
+    timings["prepare"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    prepared.analyze()
+    timings["brief"] = time.perf_counter() - started
+
+    roles = prepared.detected_roles
+    questions = suggested_questions(prepared.dataframe, roles)
+    if roles.dimension and roles.measure:
+        segments = prepared.dataframe[roles.dimension].dropna().unique()
+        questions += [f"total {roles.measure} for {segment}" for segment in segments]
+    started = time.perf_counter()
+    for question in questions:
+        answer_question(question, prepared.dataframe, roles)
+    timings["questions"] = time.perf_counter() - started
+
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    frame_mb = prepared.dataframe.memory_usage(deep=True).sum() / 1024 / 1024
+    return {**timings, "frame_mb": frame_mb, "peak_rss_mb": peak_kib / 1024}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=250_000)
+    parser.add_argument("--mode", choices=(*MODES, "generate"), help=argparse.SUPPRESS)
+    parser.add_argument("--path", type=Path, help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    if arguments.mode == "generate":
+        make_demo_data(rows=arguments.rows).to_csv(arguments.path, index=False)
+        return
+    if arguments.mode:
+        print(json.dumps(_measure(arguments.mode, arguments.path)))
+        return
+
+    def run(mode: str, path: Path) -> str:
+        return subprocess.run(
+            [
+                sys.executable, "-m", "benchmarks.arrow_dtypes", "--mode", mode,
+                "--path", str(path), "--rows", str(arguments.rows),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "orders.csv"
+        run("generate", path)
+        size_mb = path.stat().st_size / 1024 / 1024
+        print(f"{arguments.rows:,} rows · {size_mb:,.1f} MB")
+        print(
+            f"{'mode':<8}{'prepare s':>11}{'brief s':>10}{'questions s':>13}"
+            f"{'frame MB':>10}{'peak RSS MB':>13}"
+        )
+        for mode in MODES:
+            result = json.loads(run(mode, path))
+            print(
+                f"{mode:<8}{result['prepare']:>11.2f}{result['brief']:>10.2f}{result['questions']:>13.2f}"
+                f"{result['frame_mb']:>10.1f}{result['peak_rss_mb']:>13.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
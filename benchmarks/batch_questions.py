@@ -0,0 +1,102 @@
+"""Latency of a reporting pack of questions, asked one by one versus as one batch.
+
+Run from the repository root::
+
+    python -m benchmarks.batch_questions --rows 250000 --questions 200
+
+The pack mixes totals, averages, ranks, breakdowns, trends, growth, and
+counts over the demo data, scoped by segment value, year, and month the way
+standard report questions are, with some questions repeated. The loop is
+timed as is and with one question index and executor shared across the
+pack. All paths must give the same answers; every timing is the best of
+``--repeat`` runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import time
+from collections.abc import Callable
+
+from business_insights import ColumnRoles
+from demo_data import make_demo_data
+from nlq import QueryAnswer, QueryExecutor, answer_question, answer_questions, build_question_index
+from pipeline import prepare_analysis
+
+TEMPLATES = (
+    "total {measure}{scope}",
+    "average {measure} by {dimension}{scope}",
+    "top 3 {dimension} by {measure}{scope}",
+    "bottom 2 {dimension} by {measure}{scope}",
+    "{measure} by {dimension}{scope}",
+    "monthly {measure} trend{scope}",
+    "which {dimension} grew fastest{scope}",
+    "how many orders{scope}",
+)
+
+
+def _pack(dataframe, roles: ColumnRoles, size: int) -> list[str]:
+    scopes = ["", " in 2024", " in march 2025"]
+    for column in roles.dimensions:
+        scopes += [f" for {value}" for value in dataframe[column].dropna().unique()[:3]]
+    combinations = itertools.product(TEMPLATES, roles.numeric, roles.dimensions, scopes)
+    questions = [
+        template.format(measure=measure, dimension=dimension, scope=scope)
+        for template, measure, dimension, scope in combinations
+    ]
+    # Spread the pack over every template and scope, as a report would.
+    step = max(len(questions) // size, 1)
+    return [questions[(position * step) % len(questions)] for position in range(size)]
+
+
+def _summary(answer: QueryAnswer | None) -> tuple[str, str] | None:
+    return None if answer is None else (answer.answer, answer.calculation)
+
+
+def _best(run: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=250_000)
+    parser.add_argument("--questions", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    prepared = prepare_analysis(make_demo_data(rows=arguments.rows), row_limit=arguments.rows)
+    dataframe, roles = prepared.dataframe, prepared.detected_roles
+    questions = _pack(dataframe, roles, arguments.questions)
+
+    def one_by_one() -> list[QueryAnswer | None]:
+        return [answer_question(question, dataframe, roles) for question in questions]
+
+    batch = answer_questions(questions, dataframe, roles)
+    if [_summary(answer) for answer in one_by_one()] != [_summary(answer) for answer in batch.answers]:
+        raise SystemExit("batch answers differ from answer_question")
+
+    def one_by_one_shared() -> list[QueryAnswer | None]:
+        index, executor = build_question_index(dataframe, roles), QueryExecutor(dataframe, roles)
+        return [answer_question(question, dataframe, roles, index, executor) for question in questions]
+
+    loop = _best(one_by_one, arguments.repeat)
+    shared = _best(one_by_one_shared, arguments.repeat)
+    batched = _best(lambda: answer_questions(questions, dataframe, roles), arguments.repeat)
+    answered = sum(answer is not None for answer in batch.answers)
+    print(
+        f"{len(questions)} questions ({answered} answered, {batch.distinct_plans} distinct plans, "
+        f"{batch.group_passes} shared group-bys) over {len(dataframe):,} rows · best of {arguments.repeat}"
+    )
+    print(f"{'loop over answer_question':<36}{loop * 1000:>10.0f} ms")
+    print(f"{'  sharing one index and executor':<36}{shared * 1000:>10.0f} ms{loop / shared:>9.1f}×")
+    print(f"{'answer_questions':<36}{batched * 1000:>10.0f} ms{loop / batched:>9.1f}×")
+
+
+if __name__ == "__main__":
+    main()
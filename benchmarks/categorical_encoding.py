@@ -0,0 +1,97 @@
+"""Memory and latency of the analysis with text dimensions as objects versus categories.
+
+Run from the repository root::
+
+    python -m benchmarks.categorical_encoding --rows 250000
+
+The demo data is scaled to ``--rows``, and each mode runs in a fresh
+interpreter so every peak resident set size belongs to that mode alone. Each
+run cleans the data, builds the brief, drills into every segment, and answers
+the suggested questions plus a grouped question per segment.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from analysis import clean_dataframe
+from business_insights import analyze_business, detect_roles
+from demo_data import make_demo_data
+from nlq import answer_question, suggested_questions
+from pipeline import apply_focus, focus_options
+
+MODES = ("object", "category")
+
+
+def _measure(mode: str, rows: int) -> dict[str, float]:
+    raw = make_demo_data(rows=rows)
+    timings: dict[str, float] = {}
+
+    started = time.perf_counter()
+    dataframe, _ = clean_dataframe(raw, encode_categories=mode == "category")
+    timings["clean"] = time.perf_counter() - started
+    del raw
+    roles = detect_roles(dataframe)
+
+    started = time.perf_counter()
+    analyze_business(dataframe, roles)
+    timings["brief"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for focus in focus_options(dataframe, roles):
+        analyze_business(*apply_focus(dataframe, roles, focus))
+    timings["drill_down"] = time.perf_counter() - started
+
+    questions = suggested_questions(dataframe, roles)
+    if roles.dimension and roles.measure:
+        segments = dataframe[roles.dimension].dropna().unique()
+        questions += [f"{roles.measure} by channel for {segment}" for segment in segments]
+    started = time.perf_counter()
+    for question in questions:
+        answer_question(question, dataframe, roles)
+    timings["questions"] = time.perf_counter() - started
+
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    frame_mb = dataframe.memory_usage(deep=True).sum() / 1024 / 1024
+    return {**timings, "frame_mb": frame_mb, "peak_rss_mb": peak_kib / 1024}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=250_000)
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    if arguments.mode:
+        print(json.dumps(_measure(arguments.mode, arguments.rows)))
+        return
+
+    print(f"{arguments.rows:,} demo rows")
+    print(
+        f"{'mode':<10}{'clean s':>9}{'brief s':>9}{'drill s':>9}{'questions s':>13}"
+        f"{'frame MB':>10}{'peak RSS MB':>13}"
+    )
+    for mode in MODES:
+        output = subprocess.run(
+            [
+                sys.executable, "-m", "benchmarks.categorical_encoding",
+                "--mode", mode, "--rows", str(arguments.rows),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output)
+        print(
+            f"{mode:<10}{result['clean']:>9.2f}{result['brief']:>9.2f}{result['drill_down']:>9.2f}"
+            f"{result['questions']:>13.2f}{result['frame_mb']:>10.1f}{result['peak_rss_mb']:>13.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
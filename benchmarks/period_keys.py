@@ -0,0 +1,60 @@
+"""Latency of period keys from ``to_period`` versus datetime64 arithmetic, cold and memoized.
+
+Run from the repository root::
+
+    python -m benchmarks.period_keys --rows 2000000
+
+Each grain buckets ``--rows`` timestamps spread over three years, one in fifty
+missing. Every timing is the best of ``--repeat`` runs; the memoized column
+is a rerun over the same dataset version, after its keys were derived once.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+
+from business_insights import PERIOD_GRAINS, period_start
+
+
+def _best(run: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    seconds = np.random.default_rng(0).integers(0, 3 * 365 * 86_400, arguments.rows)
+    dates = pd.Series(pd.Timestamp("2023-01-01") + pd.to_timedelta(seconds, unit="s"), name="Order Date")
+    dates[::50] = pd.NaT
+
+    print(f"{arguments.rows:,} timestamps · best of {arguments.repeat}")
+    print(f"{'grain':<7}{'to_period ms':>14}{'arithmetic ms':>15}{'memoized ms':>13}{'speed-up':>10}")
+    for grain in PERIOD_GRAINS:
+        expected = dates.dt.to_period(grain).dt.to_timestamp()
+        pd.testing.assert_series_equal(period_start(dates, grain), expected)
+        period_start(dates, grain, version="benchmark")
+
+        baseline = _best(lambda grain=grain: dates.dt.to_period(grain).dt.to_timestamp(), arguments.repeat)
+        cold = _best(lambda grain=grain: period_start(dates, grain), arguments.repeat)
+        warm = _best(lambda grain=grain: period_start(dates, grain, version="benchmark"), arguments.repeat)
+        print(
+            f"{grain:<7}{baseline * 1000:>14.1f}{cold * 1000:>15.1f}{warm * 1000:>13.2f}"
+            f"{baseline / cold:>9.1f}×"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Parse time and peak RSS of a truncated CSV upload, with and without pushdown.
+
+Run from the repository root::
+
+    python -m benchmarks.row_limit_pushdown --rows 2000000
+
+The file is generated and each mode runs in a fresh interpreter, so every
+peak resident set size belongs to that mode alone. ``full`` is the pre-pushdown behavior: parse every
+row, then keep the first ``--limit`` rows. ``pushdown`` hands the limit to the
+parser, and ``projection`` also reads only the columns the brief needs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from demo_data import make_demo_data
+from file_io import read_tabular_data, read_tabular_file
+
+MODES = ("full", "pushdown", "projection")
+PROJECTED_COLUMNS = ["Order Date", "Product", "Revenue"]
+
+
+def _measure(mode: str, path: Path, limit: int) -> dict[str, float]:
+    contents = path.read_bytes()
+    started = time.perf_counter()
+    if mode == "full":
+        dataframe = read_tabular_file(contents, path.name).head(limit).copy()
+    elif mode == "pushdown":
+        dataframe = read_tabular_data(contents, path.name, row_limit=limit).dataframe
+    else:
+        dataframe = read_tabular_data(
+            contents, path.name, row_limit=limit, columns=PROJECTED_COLUMNS
+        ).dataframe
+    elapsed = time.perf_counter() - started
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {"seconds": elapsed, "peak_rss_mb": peak_kib / 1024, "rows": len(dataframe)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--limit", type=int, default=250_000)
+    parser.add_argument("--mode", choices=(*MODES, "generate"), help=argparse.SUPPRESS)
+    parser.add_argument("--path", type=Path, help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    if arguments.mode == "generate":
+        make_demo_data(rows=arguments.rows).to_csv(arguments.path, index=False)
+        return
+    if arguments.mode:
+        print(json.dumps(_measure(arguments.mode, arguments.path, arguments.limit)))
+        return
+
+    def run(mode: str, path: Path) -> str:
+        return subprocess.run(
+            [
+                sys.executable, "-m", "benchmarks.row_limit_pushdown", "--mode", mode,
+                "--path", str(path), "--rows", str(arguments.rows), "--limit", str(arguments.limit),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "orders.csv"
+        run("generate", path)
+        size_mb = path.stat().st_size / 1024 / 1024
+        print(f"{arguments.rows:,} rows · {size_mb:,.1f} MB · limit {arguments.limit:,}")
+        print(f"{'mode':<12}{'seconds':>10}{'peak RSS MB':>14}{'rows':>12}")
+        for mode in MODES:
+            result = json.loads(run(mode, path))
+            print(f"{mode:<12}{result['seconds']:>10.2f}{result['peak_rss_mb']:>14.0f}{result['rows']:>12,}")
+
+
+if __name__ == "__main__":
+    main()
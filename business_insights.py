@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import contextvars
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
 
 import numpy as np
 import pandas as pd
-from pandas.api.types import is_datetime64_any_dtype
+from pandas.api.types import infer_dtype, is_datetime64_any_dtype
 
+from analysis import ColumnStats, frame_stats
 from anomalies import detect_anomalies, format_period
+from tracing import stage, traced
 
 
 @dataclass(frozen=True)
@@ -58,6 +67,107 @@ class BusinessBrief:
     recommendations: tuple[Recommendation, ...]
 
 
+@dataclass(frozen=True)
+class PeriodTotals:
+    """Exact per-day sums of every numeric column, and dated row counts, for one date column.
+
+    They are taken from every cleaned row before a sample is drawn, so trends,
+    growth and anomalies stay exact when the analyzed frame is a sample.
+    """
+
+    date: str
+    first: pd.Timestamp
+    last: pd.Timestamp
+    sums: pd.DataFrame
+    rows: pd.Series
+
+    def covers(self, roles: ColumnRoles) -> bool:
+        return self.date == roles.date and (not roles.measure or roles.measure in self.sums.columns)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "date": self.date,
+            "first": self.first.isoformat(),
+            "last": self.last.isoformat(),
+            "days": [day.isoformat() for day in self.rows.index],
+            "sums": {str(column): values.tolist() for column, values in self.sums.items()},
+            "rows": self.rows.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, values: dict[str, Any]) -> PeriodTotals:
+        days = pd.DatetimeIndex(pd.to_datetime(values["days"]), name=values["date"])
+        return cls(
+            date=values["date"],
+            first=pd.Timestamp(values["first"]),
+            last=pd.Timestamp(values["last"]),
+            sums=pd.DataFrame(values["sums"], index=days),
+            rows=pd.Series(values["rows"], index=days, dtype="int64"),
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class AggregateCube:
+    """Period × segment aggregates of one measure (or row counts) at one time grain.
+
+    The period key of every dated row is derived once, when the cube is built.
+    The trend, the per-segment totals and the segment × period cells are each
+    grouped on first use and then shared by every evidence and chart function
+    that is handed the cube.
+    """
+
+    date: str | None
+    grain: str | None
+    natural_grain: str | None
+    measure: str | None
+    dimension: str | None
+    dataframe: pd.DataFrame
+    dated: np.ndarray
+    period: pd.Series | None
+
+    def serves(self, roles: ColumnRoles, grain: str | None = None) -> bool:
+        return (self.date, self.measure, self.dimension) == (roles.date, roles.measure, roles.dimension) and (
+            grain or self.natural_grain
+        ) == self.grain
+
+    @cached_property
+    def trend(self) -> pd.DataFrame:
+        if self.period is None:
+            return pd.DataFrame(columns=["Period", "Value"])
+        if self.measure:
+            result = self.dataframe[self.measure][self.dated].groupby(self.period).sum()
+        else:
+            result = self.period.groupby(self.period).size()
+        return pd.DataFrame({"Period": result.index, "Value": result.to_numpy()})
+
+    @cached_property
+    def segments(self) -> pd.DataFrame:
+        """Unranked per-segment totals over every row with a segment, dated or not."""
+        if not self.dimension or self.dataframe[self.dimension].isna().all():
+            return pd.DataFrame(columns=["Segment", "Value"])
+        grouped = self.dataframe.groupby(self.dimension, as_index=False, observed=True)
+        result = grouped[self.measure].sum() if self.measure else grouped.size()
+        return result.rename(columns={self.dimension: "Segment", self.measure or "size": "Value"})
+
+    @cached_property
+    def cells(self) -> pd.DataFrame:
+        """Value and measured-row count per (segment, period) of the dated rows."""
+        if self.period is None or not self.dimension:
+            return pd.DataFrame(columns=["Value", "Measured"])
+        keys = [self.dataframe[self.dimension][self.dated], self.period]
+        if self.measure:
+            grouped = self.dataframe[self.measure][self.dated].groupby(keys, observed=True)
+            return pd.DataFrame({"Value": grouped.sum(), "Measured": grouped.count()})
+        rows = self.period.groupby(keys, observed=True).size()
+        return pd.DataFrame({"Value": rows, "Measured": rows})
+
+    @cached_property
+    def spans(self) -> pd.DataFrame:
+        """First and last date of each segment's dated rows."""
+        dates = self.dataframe[self.date][self.dated]
+        return dates.groupby(self.dataframe[self.dimension][self.dated], observed=True).agg(["min", "max"])
+
+
 MEASURE_KEYWORDS = {
     "revenue": 14,
     "sales": 14,
@@ -113,25 +223,45 @@ CURRENCY_TOKENS = (
 IDENTIFIER_TOKENS = ("id", "uuid", "key", "code", "number", "invoice", "order")
 TIME_PART_TOKENS = ("year", "month", "week", "day", "hour", "minute", "quarter")
 
+PERIOD_GRAINS = ("D", "W", "M", "Q", "Y")
+PERIOD_CACHE_ENTRIES = 8
+NANOSECONDS_PER_DAY = 86_400_000_000_000
+_PERIOD_KEYS: OrderedDict[tuple[str, Any, str], np.ndarray] = OrderedDict()
+_PERIOD_KEYS_LOCK = threading.Lock()
+
 
 def _normalized(name: str) -> str:
     return " ".join(name.lower().replace("_", " ").replace("-", " ").split())
 
 
+def text_values(series: pd.Series) -> pd.Series:
+    """A column as strings for matching.
+
+    Arrow-backed text and categories of text are used as is, without a copy;
+    categorical comparisons then run on the integer codes.
+    """
+    if isinstance(series.dtype, pd.StringDtype):
+        return series
+    if isinstance(series.dtype, pd.CategoricalDtype) and infer_dtype(series.cat.categories) == "string":
+        return series
+    return series.astype(str)
+
+
 def _keyword_score(name: str, keywords: dict[str, int]) -> int:
     normalized = _normalized(name)
     return max((score for token, score in keywords.items() if token in normalized), default=0)
 
 
-def _looks_like_identifier(name: str, series: pd.Series) -> bool:
+def _looks_like_identifier(name: str, stats: ColumnStats) -> bool:
     normalized = _normalized(name)
     token_match = any(token in normalized.split() for token in IDENTIFIER_TOKENS)
-    unique_ratio = series.nunique(dropna=True) / max(int(series.notna().sum()), 1)
-    return token_match and unique_ratio >= 0.8
+    return token_match and stats.unique_ratio >= 0.8
 
 
-def detect_roles(dataframe: pd.DataFrame) -> ColumnRoles:
+@traced
+def detect_roles(dataframe: pd.DataFrame, stats: dict[str, ColumnStats] | None = None) -> ColumnRoles:
     """Infer likely business roles from names, types, and cardinality."""
+    stats = stats or frame_stats(dataframe)
     numeric = dataframe.select_dtypes(include=np.number).columns.tolist()
     date_columns = [
         column for column in dataframe.columns if is_datetime64_any_dtype(dataframe[column])
@@ -141,21 +271,20 @@ def detect_roles(dataframe: pd.DataFrame) -> ColumnRoles:
         date_columns,
         key=lambda column: (
             1 if any(token in _normalized(column) for token in ("date", "time", "created")) else 0,
-            int(dataframe[column].notna().sum()),
+            stats[column].non_null,
         ),
         default=None,
     )
 
     measure_candidates: list[tuple[int, float, str]] = []
     for column in numeric:
-        series = dataframe[column]
         name = _normalized(column)
         score = _keyword_score(column, MEASURE_KEYWORDS)
-        if _looks_like_identifier(column, series):
+        if _looks_like_identifier(column, stats[column]):
             score -= 20
         if any(token == name or name.endswith(f" {token}") for token in TIME_PART_TOKENS):
             score -= 15
-        non_null_ratio = float(series.notna().mean())
+        non_null_ratio = stats[column].non_null / max(stats[column].rows, 1)
         measure_candidates.append((score, non_null_ratio, column))
 
     measure = None
@@ -167,9 +296,8 @@ def detect_roles(dataframe: pd.DataFrame) -> ColumnRoles:
     for column in dataframe.columns:
         if column == date or column in numeric:
             continue
-        series = dataframe[column]
-        unique = int(series.nunique(dropna=True))
-        non_null = int(series.notna().sum())
+        unique = stats[column].distinct
+        non_null = stats[column].non_null
         if unique < 2 or unique > 100 or unique / max(non_null, 1) > 0.65:
             continue
         dimensions.append(column)
@@ -186,7 +314,7 @@ def detect_roles(dataframe: pd.DataFrame) -> ColumnRoles:
     identifier_candidates = [
         column
         for column in dataframe.columns
-        if _looks_like_identifier(column, dataframe[column])
+        if _looks_like_identifier(column, stats[column])
     ]
     identifier = identifier_candidates[0] if identifier_candidates else None
 
@@ -258,53 +386,182 @@ def preferred_frequency(date_series: pd.Series) -> str:
     return _period_frequency(date_series.dropna())[0]
 
 
+def _floor_days(days: np.ndarray, grain: str) -> np.ndarray:
+    """Day number (since 1970-01-01) of the start of each day's period."""
+    if grain == "D":
+        return days
+    if grain == "W":
+        return days - (days + 3) % 7  # 1970-01-01 was a Thursday; weeks start on Monday
+    months = days.view("datetime64[D]").astype("datetime64[M]").view(np.int64)
+    months = months - months % {"M": 1, "Q": 3, "Y": 12}[grain]
+    return months.view("datetime64[M]").astype("datetime64[D]").view(np.int64)
+
+
+def _period_starts(dates: pd.Series, grain: str) -> np.ndarray:
+    """First instant of each date's period, by integer arithmetic on datetime64 values.
+
+    A date column usually spans far fewer days than it has rows, so each day
+    of the span is bucketed once and the rows gather from that table. Weeks
+    start on Monday and time zones fall back to wall-clock time, as in
+    ``to_period``. Grains outside ``PERIOD_GRAINS`` go through ``to_period``.
+    """
+    if grain not in PERIOD_GRAINS:
+        return dates.dt.to_period(grain).dt.to_timestamp().to_numpy()
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        dates = dates.dt.tz_localize(None)
+    values = dates.to_numpy(dtype="datetime64[ns]")
+    missing = np.isnat(values)
+    if missing.all():
+        return values.copy()
+    days = values.view(np.int64) // NANOSECONDS_PER_DAY
+    low = int(days.min(initial=np.iinfo(np.int64).max, where=~missing))
+    high = int(days.max(initial=np.iinfo(np.int64).min, where=~missing))
+    days[missing] = low
+    if grain != "D" and high - low < len(days):
+        first = _floor_days(np.arange(low, high + 1), grain)[days - low]
+    else:
+        first = _floor_days(days, grain)
+    starts = (first * NANOSECONDS_PER_DAY).view("datetime64[ns]")
+    starts[missing] = np.datetime64("NaT")
+    return starts
+
+
+def period_start(dates: pd.Series, grain: str, version: str | None = None) -> pd.Series:
+    """Each date's period start at ``grain``, equal to ``dt.to_period(grain).dt.to_timestamp()``.
+
+    With a dataset ``version``, the keys are memoized per (version, column,
+    grain), so reruns over the same prepared data do not derive them again.
+    """
+    key = (version, dates.name, grain)
+    starts = None
+    if version is not None:
+        with _PERIOD_KEYS_LOCK:
+            starts = _PERIOD_KEYS.get(key)
+            if starts is not None:
+                _PERIOD_KEYS.move_to_end(key)
+    if starts is None or len(starts) != len(dates):
+        starts = _period_starts(dates, grain)
+        starts.flags.writeable = False
+        if version is not None:
+            with _PERIOD_KEYS_LOCK:
+                _PERIOD_KEYS[key] = starts
+                while len(_PERIOD_KEYS) > PERIOD_CACHE_ENTRIES:
+                    _PERIOD_KEYS.popitem(last=False)
+    return pd.Series(starts, index=dates.index, name=dates.name)
+
+
+def period_totals(dataframe: pd.DataFrame) -> dict[str, PeriodTotals]:
+    """Exact daily totals for every date column, to keep beside a sample of the rows."""
+    numeric = dataframe.select_dtypes(include=np.number).columns.tolist()
+    totals: dict[str, PeriodTotals] = {}
+    for column in dataframe.columns:
+        dates = dataframe[column]
+        if not is_datetime64_any_dtype(dates) or dates.isna().all():
+            continue
+        dated = dates.notna()
+        grouped = dataframe.loc[dated, numeric].groupby(dates[dated].dt.floor("D"))
+        totals[column] = PeriodTotals(
+            date=column, first=dates.min(), last=dates.max(), sums=grouped.sum(), rows=grouped.size()
+        )
+    return totals
+
+
+def combine_period_totals(parts: Sequence[dict[str, PeriodTotals]]) -> dict[str, PeriodTotals]:
+    """Add up the period totals of disjoint chunks of one dataset, date column by date column."""
+    combined: dict[str, PeriodTotals] = {}
+    for date in dict.fromkeys(column for part in parts for column in part):
+        pieces = [part[date] for part in parts if date in part]
+        combined[date] = PeriodTotals(
+            date=date,
+            first=min(piece.first for piece in pieces),
+            last=max(piece.last for piece in pieces),
+            sums=pd.concat([piece.sums for piece in pieces]).groupby(level=0).sum(),
+            rows=pd.concat([piece.rows for piece in pieces]).groupby(level=0).sum(),
+        )
+    return combined
+
+
+def aggregate_cube(
+    dataframe: pd.DataFrame, roles: ColumnRoles, grain: str | None = None, version: str | None = None
+) -> AggregateCube:
+    """Derive the period key of every dated row once, at ``grain`` or the span's natural grain.
+
+    ``version`` identifies the prepared dataset, so its period keys are reused
+    across reruns; see ``period_start``.
+    """
+    dated = np.zeros(len(dataframe), dtype=bool)
+    natural_grain = period = None
+    if roles.date:
+        dates = dataframe[roles.date]
+        dated = dates.notna().to_numpy()
+        if dated.any():
+            natural_grain = _period_frequency(dates[dated])[0]
+            grain = grain or natural_grain
+            period = period_start(dates, grain, version)[dated].rename("Period")
+    return AggregateCube(
+        date=roles.date,
+        grain=grain if period is not None else None,
+        natural_grain=natural_grain,
+        measure=roles.measure,
+        dimension=roles.dimension,
+        dataframe=dataframe,
+        dated=dated,
+        period=period,
+    )
+
+
+def _shared_cube(
+    dataframe: pd.DataFrame, roles: ColumnRoles, cube: AggregateCube | None, grain: str | None = None
+) -> AggregateCube:
+    if cube is not None and cube.serves(roles, grain):
+        return cube
+    return aggregate_cube(dataframe, roles, grain)
+
+
+def _totals_trend(totals: PeriodTotals, roles: ColumnRoles, frequency: str | None) -> pd.DataFrame:
+    frequency = frequency or _period_frequency(pd.Series([totals.first, totals.last]))[0]
+    values = totals.sums[roles.measure] if roles.measure else totals.rows
+    result = values.groupby(period_start(values.index.to_series(), frequency).to_numpy()).sum()
+    return pd.DataFrame({"Period": result.index, "Value": result.to_numpy()})
+
+
 def trend_frame(
     dataframe: pd.DataFrame,
     roles: ColumnRoles,
     frequency: str | None = None,
+    totals: PeriodTotals | None = None,
+    cube: AggregateCube | None = None,
 ) -> pd.DataFrame:
-    """Aggregate the selected measure over a human-sized time grain."""
+    """Aggregate the selected measure over a human-sized time grain.
+
+    With ``totals`` for the date role, the trend comes from those exact daily
+    totals instead of the rows of ``dataframe``. A ``cube`` built from
+    ``dataframe`` for the same roles and grain is read instead of regrouping.
+    """
     if not roles.date:
         return pd.DataFrame(columns=["Period", "Value"])
+    if totals is not None and totals.covers(roles):
+        return _totals_trend(totals, roles, frequency)
+    return _shared_cube(dataframe, roles, cube, frequency).trend.copy()
 
-    columns = [roles.date] + ([roles.measure] if roles.measure else [])
-    working = dataframe[columns].dropna(subset=[roles.date]).copy()
-    if working.empty:
-        return pd.DataFrame(columns=["Period", "Value"])
 
-    frequency = frequency or _period_frequency(working[roles.date])[0]
-    working["Period"] = working[roles.date].dt.to_period(frequency).dt.to_timestamp()
-    if roles.measure:
-        result = working.groupby("Period", as_index=False)[roles.measure].sum()
-        result = result.rename(columns={roles.measure: "Value"})
-    else:
-        result = working.groupby("Period", as_index=False).size().rename(columns={"size": "Value"})
-    return result.sort_values("Period").reset_index(drop=True)
-
-
-def segment_frame(dataframe: pd.DataFrame, roles: ColumnRoles, limit: int = 12) -> pd.DataFrame:
+def segment_frame(
+    dataframe: pd.DataFrame, roles: ColumnRoles, limit: int = 12, cube: AggregateCube | None = None
+) -> pd.DataFrame:
     """Rank the selected business segment by the selected measure or record count."""
     if not roles.dimension:
         return pd.DataFrame(columns=["Segment", "Value"])
-
-    working = dataframe.dropna(subset=[roles.dimension]).copy()
-    if working.empty:
-        return pd.DataFrame(columns=["Segment", "Value"])
-
-    if roles.measure:
-        result = working.groupby(roles.dimension, as_index=False)[roles.measure].sum()
-        result = result.rename(columns={roles.dimension: "Segment", roles.measure: "Value"})
-    else:
-        result = (
-            working.groupby(roles.dimension, as_index=False)
-            .size()
-            .rename(columns={roles.dimension: "Segment", "size": "Value"})
-        )
+    result = _shared_cube(dataframe, roles, cube).segments
     return result.sort_values("Value", ascending=False).head(limit).reset_index(drop=True)
 
 
-def _growth_evidence(dataframe: pd.DataFrame, roles: ColumnRoles) -> Evidence | None:
-    trend = trend_frame(dataframe, roles)
+def _growth_evidence(
+    dataframe: pd.DataFrame,
+    roles: ColumnRoles,
+    totals: PeriodTotals | None = None,
+    cube: AggregateCube | None = None,
+) -> Evidence | None:
+    trend = trend_frame(dataframe, roles, totals=totals, cube=cube)
     if len(trend) < 2:
         return None
 
@@ -325,28 +582,33 @@ def _growth_evidence(dataframe: pd.DataFrame, roles: ColumnRoles) -> Evidence |
             f"({period}), from {format_number(previous, roles.measure)} to "
             f"{format_number(current, roles.measure)}."
         ),
-        calculation="(Latest period − previous period) ÷ |previous period|",
+        calculation="(Latest period − previous period) ÷ |previous period|"
+        + (
+            f"; period totals cover all {int(totals.rows.sum()):,} dated rows, not only the sample"
+            if totals is not None and totals.covers(roles)
+            else ""
+        ),
         tone="positive" if change >= 0 else "negative",
     )
 
 
 def _segment_period_change(
-    dataframe: pd.DataFrame, roles: ColumnRoles
+    dataframe: pd.DataFrame, roles: ColumnRoles, cube: AggregateCube | None = None
 ) -> tuple[pd.DataFrame, pd.Timestamp, pd.Timestamp] | None:
     """Per-segment totals for the latest two periods, or None when unavailable."""
     if not roles.date or not roles.measure or not roles.dimension:
         return None
 
-    trend = trend_frame(dataframe, roles)
+    cube = _shared_cube(dataframe, roles, cube)
+    trend = cube.trend
     if len(trend) < 2:
         return None
     previous_period = trend.iloc[-2]["Period"]
     current_period = trend.iloc[-1]["Period"]
-    frequency, _ = _period_frequency(dataframe[roles.date].dropna())
-    working = dataframe[[roles.date, roles.measure, roles.dimension]].dropna().copy()
-    working["Period"] = working[roles.date].dt.to_period(frequency).dt.to_timestamp()
-    comparison = working[working["Period"].isin([previous_period, current_period])]
-    grouped = comparison.groupby([roles.dimension, "Period"])[roles.measure].sum().unstack(fill_value=0)
+    cells = cube.cells
+    periods = cells.index.get_level_values("Period")
+    comparison = cells[(cells["Measured"] > 0) & periods.isin([previous_period, current_period])]
+    grouped = comparison["Value"].unstack(fill_value=0)
     if previous_period not in grouped or current_period not in grouped:
         return None
 
@@ -354,9 +616,11 @@ def _segment_period_change(
     return grouped, previous_period, current_period
 
 
-def driver_frame(dataframe: pd.DataFrame, roles: ColumnRoles, limit: int = 9) -> pd.DataFrame:
+def driver_frame(
+    dataframe: pd.DataFrame, roles: ColumnRoles, limit: int = 9, cube: AggregateCube | None = None
+) -> pd.DataFrame:
     """Waterfall-ready per-segment change between the latest two periods."""
-    result = _segment_period_change(dataframe, roles)
+    result = _segment_period_change(dataframe, roles, cube)
     if result is None:
         return pd.DataFrame(columns=["Segment", "Change"])
     grouped, _, _ = result
@@ -370,30 +634,36 @@ def driver_frame(dataframe: pd.DataFrame, roles: ColumnRoles, limit: int = 9) ->
     return frame
 
 
-def heatmap_frame(dataframe: pd.DataFrame, roles: ColumnRoles, limit: int = 8) -> pd.DataFrame:
-    """Segment × period matrix of the measure (or row counts) for the top segments."""
+def heatmap_frame(
+    dataframe: pd.DataFrame, roles: ColumnRoles, limit: int = 8, cube: AggregateCube | None = None
+) -> pd.DataFrame:
+    """Segment × period matrix of the measure (or row counts) for the top segments.
+
+    The grain follows the date span of those segments alone, so it can differ
+    from the trend's; only then is a second cube built at that grain.
+    """
     if not roles.date or not roles.dimension:
         return pd.DataFrame()
 
-    top_segments = segment_frame(dataframe, roles, limit=limit)["Segment"]
-    columns = [roles.date, roles.dimension] + ([roles.measure] if roles.measure else [])
-    working = dataframe[columns].dropna(subset=[roles.date, roles.dimension]).copy()
-    working = working[working[roles.dimension].isin(top_segments)]
-    if working.empty:
+    cube = _shared_cube(dataframe, roles, cube)
+    top_segments = segment_frame(dataframe, roles, limit=limit, cube=cube)["Segment"]
+    if cube.period is None:
+        return pd.DataFrame()
+    spans = cube.spans[cube.spans.index.isin(top_segments)]
+    if spans.empty:
         return pd.DataFrame()
 
-    frequency, _ = _period_frequency(working[roles.date])
-    working["Period"] = working[roles.date].dt.to_period(frequency).dt.to_timestamp()
-    if roles.measure:
-        pivot = working.groupby([roles.dimension, "Period"])[roles.measure].sum().unstack(fill_value=0)
-    else:
-        pivot = working.groupby([roles.dimension, "Period"]).size().unstack(fill_value=0)
+    frequency, _ = _period_frequency(pd.Series([spans["min"].min(), spans["max"].max()]))
+    cells = _shared_cube(dataframe, roles, cube, frequency).cells
+    pivot = cells.loc[cells.index.get_level_values(0).isin(top_segments), "Value"].unstack(fill_value=0)
     return pivot.loc[pivot.sum(axis=1).sort_values(ascending=False).index]
 
 
-def _change_driver_evidence(dataframe: pd.DataFrame, roles: ColumnRoles) -> Evidence | None:
+def _change_driver_evidence(
+    dataframe: pd.DataFrame, roles: ColumnRoles, cube: AggregateCube | None = None
+) -> Evidence | None:
     """Identify the segment contributing most to the latest net movement."""
-    result = _segment_period_change(dataframe, roles)
+    result = _segment_period_change(dataframe, roles, cube)
     if result is None:
         return None
     grouped, previous_period, current_period = result
@@ -430,13 +700,20 @@ def _change_driver_evidence(dataframe: pd.DataFrame, roles: ColumnRoles) -> Evid
     )
 
 
-def _anomaly_evidence(dataframe: pd.DataFrame, roles: ColumnRoles) -> Evidence | None:
+def _anomaly_evidence(
+    dataframe: pd.DataFrame,
+    roles: ColumnRoles,
+    totals: PeriodTotals | None = None,
+    cube: AggregateCube | None = None,
+) -> Evidence | None:
     if not roles.date:
         return None
-    anomalies = detect_anomalies(trend_frame(dataframe, roles))
+    cube = _shared_cube(dataframe, roles, cube)
+    anomalies = detect_anomalies(trend_frame(dataframe, roles, totals=totals, cube=cube))
     if not anomalies:
         return None
-    grain = preferred_frequency(dataframe[roles.date])
+    covered = totals is not None and totals.covers(roles)
+    grain = preferred_frequency(pd.Series([totals.first, totals.last])) if covered else cube.natural_grain
     worst = anomalies[0]
     measure = roles.measure or "Records"
     label = format_period(worst.period, grain)
@@ -457,8 +734,10 @@ def _anomaly_evidence(dataframe: pd.DataFrame, roles: ColumnRoles) -> Evidence |
     )
 
 
-def _segment_evidence(dataframe: pd.DataFrame, roles: ColumnRoles) -> tuple[Evidence, Evidence] | tuple[()]:
-    segments = segment_frame(dataframe, roles, limit=100)
+def _segment_evidence(
+    dataframe: pd.DataFrame, roles: ColumnRoles, cube: AggregateCube | None = None
+) -> tuple[Evidence, Evidence] | tuple[()]:
+    segments = segment_frame(dataframe, roles, limit=100, cube=cube)
     if segments.empty:
         return ()
 
@@ -497,11 +776,13 @@ def _segment_evidence(dataframe: pd.DataFrame, roles: ColumnRoles) -> tuple[Evid
     )
 
 
-def _relationship_evidence(dataframe: pd.DataFrame, roles: ColumnRoles) -> Evidence | None:
+def _relationship_evidence(
+    dataframe: pd.DataFrame, roles: ColumnRoles, stats: dict[str, ColumnStats]
+) -> Evidence | None:
     usable = [
         column
         for column in roles.numeric
-        if not _looks_like_identifier(column, dataframe[column])
+        if not _looks_like_identifier(column, stats[column])
         and not any(token == _normalized(column) for token in TIME_PART_TOKENS)
     ]
     if len(usable) < 2:
@@ -528,22 +809,19 @@ def _relationship_evidence(dataframe: pd.DataFrame, roles: ColumnRoles) -> Evide
     )
 
 
-def _outlier_evidence(dataframe: pd.DataFrame, roles: ColumnRoles) -> Evidence | None:
+def _outlier_evidence(roles: ColumnRoles, stats: dict[str, ColumnStats]) -> Evidence | None:
     if not roles.measure:
         return None
-    series = dataframe[roles.measure].dropna()
-    if len(series) < 12 or series.nunique() < 4:
+    measure = stats[roles.measure]
+    if measure.non_null < 12 or measure.distinct < 4 or not measure.quartiles:
         return None
-    first_quartile, third_quartile = series.quantile([0.25, 0.75])
-    iqr = third_quartile - first_quartile
-    if iqr == 0:
+    first_quartile, _, third_quartile = measure.quartiles
+    if third_quartile - first_quartile == 0:
         return None
-    outlier_count = int(
-        ((series < first_quartile - 1.5 * iqr) | (series > third_quartile + 1.5 * iqr)).sum()
-    )
+    outlier_count = measure.outliers
     if outlier_count == 0:
         return None
-    rate = outlier_count / len(series) * 100
+    rate = outlier_count / measure.non_null * 100
     return Evidence(
         kind="outliers",
         title="Exceptional records",
@@ -552,14 +830,19 @@ def _outlier_evidence(dataframe: pd.DataFrame, roles: ColumnRoles) -> Evidence |
             f"{outlier_count:,} {roles.measure} values ({rate:.1f}% of non-missing records) "
             "sit outside the standard 1.5×IQR range."
         ),
-        calculation="Values below Q1 − 1.5×IQR or above Q3 + 1.5×IQR",
+        calculation="Values below Q1 − 1.5×IQR or above Q3 + 1.5×IQR"
+        + (
+            f"; Q1 and Q3 from a KLL sketch, within ±{measure.rank_error:.2%} of rank at 99% confidence"
+            if measure.rank_error
+            else ""
+        ),
         tone="warning",
     )
 
 
-def _quality_evidence(dataframe: pd.DataFrame) -> Evidence | None:
+def _quality_evidence(dataframe: pd.DataFrame, stats: dict[str, ColumnStats]) -> Evidence | None:
     total_cells = dataframe.shape[0] * dataframe.shape[1]
-    missing_cells = int(dataframe.isna().sum().sum())
+    missing_cells = sum(column.null_count for column in stats.values())
     if total_cells == 0 or missing_cells == 0:
         return None
     rate = missing_cells / total_cells * 100
@@ -720,44 +1003,81 @@ def _recommendations(evidence: list[Evidence], roles: ColumnRoles) -> tuple[Reco
     return tuple(recommendations[:4])
 
 
-def analyze_business(dataframe: pd.DataFrame, roles: ColumnRoles | None = None) -> BusinessBrief:
-    """Create an executive brief from explainable calculations and rule-based interpretation."""
-    roles = roles or detect_roles(dataframe)
-    evidence: list[Evidence] = []
+def _staged_evidence(name: str, build: Callable[[], Any]) -> Any:
+    with stage(f"{name}_evidence"):
+        return build()
 
-    growth = _growth_evidence(dataframe, roles)
-    if growth:
-        evidence.append(growth)
-    change_driver = _change_driver_evidence(dataframe, roles)
-    if change_driver:
-        evidence.append(change_driver)
-    evidence.extend(_segment_evidence(dataframe, roles))
-    for optional_evidence in (
-        _anomaly_evidence(dataframe, roles),
-        _relationship_evidence(dataframe, roles),
-        _outlier_evidence(dataframe, roles),
-        _quality_evidence(dataframe),
-    ):
-        if optional_evidence:
-            evidence.append(optional_evidence)
+
+@traced
+def analyze_business(
+    dataframe: pd.DataFrame,
+    roles: ColumnRoles | None = None,
+    stats: dict[str, ColumnStats] | None = None,
+    totals: PeriodTotals | None = None,
+    cube: AggregateCube | None = None,
+    executor: Executor | None = None,
+) -> BusinessBrief:
+    """Create an executive brief from explainable calculations and rule-based interpretation.
+
+    ``stats`` are the frame's column statistics when the caller already has
+    them; otherwise the columns are scanned once here. ``totals`` are exact
+    daily totals of the full data when ``dataframe`` is a sample of it.
+    ``cube`` is the frame's aggregate cube for ``roles``, so the dashboard can
+    reuse the one the brief was built from.
+
+    With an ``executor`` (a thread pool, since every builder reads the same
+    frame and cube), the evidence builders run concurrently and a slow one such
+    as the correlation matrix no longer holds up the rest. Results are merged
+    in builder order, so the brief is identical to the sequential run. Each
+    builder is a trace stage; pooled builders run in a copy of the caller's
+    context, so they record into the caller's trace.
+    """
+    stats = stats or frame_stats(dataframe)
+    roles = roles or detect_roles(dataframe, stats)
+    cube = _shared_cube(dataframe, roles, cube)
+    builders: dict[str, Callable[[], Any]] = {
+        "growth": lambda: _growth_evidence(dataframe, roles, totals, cube),
+        "driver": lambda: _change_driver_evidence(dataframe, roles, cube),
+        "segment": lambda: _segment_evidence(dataframe, roles, cube),
+        "anomaly": lambda: _anomaly_evidence(dataframe, roles, totals, cube),
+        "relationship": lambda: _relationship_evidence(dataframe, roles, stats),
+        "outlier": lambda: _outlier_evidence(roles, stats),
+        "quality": lambda: _quality_evidence(dataframe, stats),
+    }
+    if executor is not None:
+        futures = {
+            name: executor.submit(contextvars.copy_context().run, _staged_evidence, name, build)
+            for name, build in builders.items()
+        }
+        built = {name: future.result() for name, future in futures.items()}
+    else:
+        built = {name: _staged_evidence(name, build) for name, build in builders.items()}
+
+    growth = built["growth"]
+    evidence: list[Evidence] = [item for item in (growth, built["driver"]) if item]
+    evidence.extend(built["segment"])
+    evidence.extend(
+        item for name in ("anomaly", "relationship", "outlier", "quality") if (item := built[name])
+    )
 
     kpis: list[KPI] = []
     if roles.measure:
         measure_values = dataframe[roles.measure].dropna()
         total = float(measure_values.sum())
         average = float(measure_values.mean())
+        total_note, average_note = "Across all analyzed records", "Per non-missing record"
+        if totals is not None and totals.covers(roles):
+            # The frame is a sample; its own sum would understate the whole file's.
+            total = float(totals.sums[roles.measure].sum())
+            total_note = f"Across all {int(totals.rows.sum()):,} dated records"
+            average_note = "Per non-missing record in the sample"
+        elif totals is not None:
+            total_note = f"Across the {len(dataframe):,}-row sample"
+            average_note = "Per non-missing record in the sample"
         kpis.extend(
             [
-                KPI(
-                    f"Total {roles.measure}",
-                    format_number(total, roles.measure),
-                    "Across all analyzed records",
-                ),
-                KPI(
-                    f"Average {roles.measure}",
-                    format_number(average, roles.measure),
-                    "Per non-missing record",
-                ),
+                KPI(f"Total {roles.measure}", format_number(total, roles.measure), total_note),
+                KPI(f"Average {roles.measure}", format_number(average, roles.measure), average_note),
             ]
         )
 
@@ -779,14 +1099,19 @@ def analyze_business(dataframe: pd.DataFrame, roles: ColumnRoles | None = None)
             kpis.append(
                 KPI(
                     f"Distinct {roles.identifier}",
-                    f"{dataframe[roles.identifier].nunique(dropna=True):,}",
-                    "Unique entities in the dataset",
+                    f"{stats[roles.identifier].distinct:,}",
+                    (
+                        f"HyperLogLog estimate, ±{stats[roles.identifier].distinct_error:.1%} standard error"
+                        if stats[roles.identifier].distinct_error
+                        else "Unique entities in the dataset"
+                    ),
                 )
             )
         elif not any(item.label == "Records analyzed" for item in kpis):
             kpis.append(KPI("Records analyzed", f"{len(dataframe):,}", "After conservative cleaning"))
         else:
-            completeness = 1 - dataframe.isna().sum().sum() / max(dataframe.size, 1)
+            missing_cells = sum(column.null_count for column in stats.values())
+            completeness = 1 - missing_cells / max(dataframe.size, 1)
             kpis.append(KPI("Data completeness", f"{completeness * 100:.1f}%", "Share of populated cells"))
     kpis = kpis[:4]
 
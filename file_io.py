@@ -2,67 +2,724 @@
 
 from __future__ import annotations
 
-from io import BytesIO
+import codecs
+import csv
+import gzip
+import posixpath
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, replace
+from io import BufferedReader, BytesIO, RawIOBase, StringIO
+from itertools import islice
 from pathlib import Path
-from zipfile import BadZipFile
+from typing import Any, BinaryIO
+from xml.etree import ElementTree
+from zipfile import BadZipFile, ZipFile
 
+import numpy as np
 import pandas as pd
+from openpyxl import load_workbook
+from pandas.api.types import infer_dtype
 
-SUPPORTED_SUFFIXES = {".csv", ".xlsx", ".xlsm"}
+from tracing import traced
+
+SUPPORTED_SUFFIXES = {".csv", ".csv.gz", ".csv.zst", ".zip", ".xlsx", ".xlsm", ".parquet", ".feather"}
 EXCEL_SUFFIXES = {".xlsx", ".xlsm"}
+COLUMNAR_SUFFIXES = {".parquet", ".feather"}
+CSV_COMPRESSION = {".csv.gz": "gzip", ".csv.zst": "zstd", ".zip": "zip"}
+CSV_CHUNK_ROWS = 50_000
+CSV_SAMPLE_BYTES = 64 * 1024
+MAX_DECOMPRESSED_BYTES = 1024 * 1024 * 1024
+CSV_DELIMITERS = (",", ";", "\t", "|")
+
+_PACKAGE_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_RELATIONSHIP_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_SPREADSHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+@dataclass(frozen=True)
+class CsvDialect:
+    """How a CSV file is laid out, sniffed once from a bounded sample.
+
+    ``skip_rows`` counts preamble lines (report titles, export notes) above the header.
+    The header fixes the width: trailing delimiters and surplus fields are dropped.
+    """
+
+    encoding: str
+    delimiter: str
+    quotechar: str
+    skip_rows: int
+    has_header: bool
+
+    def read_options(self, usecols: Sequence[str] | Sequence[int] | None = None) -> dict[str, object]:
+        return {
+            "encoding": self.encoding,
+            "sep": self.delimiter,
+            "quotechar": self.quotechar,
+            "skiprows": self.skip_rows,
+            "header": 0 if self.has_header else None,
+            "index_col": False,
+            # A column selection, even one of every column, lets the C engine skip surplus fields.
+            "usecols": _every_column if usecols is None else usecols,
+            "engine": "c",
+        }
+
+
+def _every_column(_name: object) -> bool:
+    return True
+
+
+@dataclass(frozen=True)
+class TabularData:
+    """A parsed table plus the number of data rows its source holds.
+
+    ``typed`` marks self-describing formats whose column types need no inference;
+    ``dialect`` records the choices made for a CSV source.
+    """
+
+    dataframe: pd.DataFrame
+    source_rows: int
+    typed: bool = False
+    dialect: CsvDialect | None = None
+
+
+# Arrow-backed text whose missing values stay NaN, so the analysis produces the same results either way.
+ARROW_STRING = pd.StringDtype("pyarrow", na_value=np.nan)
+
+
+@dataclass(frozen=True)
+class TabularStream:
+    """An upload as bounded row chunks, for callers that must see every row but not hold them all.
+
+    Chunks are labelled by source row, so the numbering continues from one
+    chunk to the next. ``typed`` and ``dialect`` mean what they do on ``TabularData``.
+    """
+
+    chunks: Iterator[pd.DataFrame]
+    typed: bool = False
+    dialect: CsvDialect | None = None
+
+
+def _is_text(values: pd.Series | pd.Index) -> bool:
+    return values.dtype == object and infer_dtype(values, skipna=True) == "string"
+
+
+def arrow_text(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """Store text columns, and the categories of categorical ones, as Arrow-backed strings in place.
+
+    Only this frame changes; no pandas option is set, so concurrent sessions
+    reading without Arrow text are unaffected.
+    """
+    for position, (_, column) in enumerate(dataframe.items()):
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            if _is_text(column.cat.categories):
+                categories = column.cat.categories.astype(ARROW_STRING)
+                dataframe.isetitem(position, column.cat.rename_categories(categories))
+        elif _is_text(column):
+            dataframe.isetitem(position, column.astype(ARROW_STRING))
+    return dataframe
+
+
+def _arrow_types(data_type: object) -> pd.api.extensions.ExtensionDtype | None:
+    """``to_pandas`` type mapper that builds Arrow text straight from Arrow string columns."""
+    import pyarrow as pa
+
+    return ARROW_STRING if data_type in (pa.string(), pa.large_string()) else None
 
 
 def _validate(contents: bytes, filename: str) -> str:
-    suffix = Path(filename).suffix.lower()
-    if suffix not in SUPPORTED_SUFFIXES:
-        raise ValueError("ADA supports CSV, XLSX, and XLSM files.")
+    name = Path(filename).name.lower()
+    suffix = next(
+        (ending for ending in sorted(SUPPORTED_SUFFIXES, key=len, reverse=True) if name.endswith(ending)),
+        None,
+    )
+    if suffix is None:
+        raise ValueError(
+            "ADA supports CSV (plain, .csv.gz, .csv.zst, or zipped), XLSX, XLSM, Parquet, and Feather files."
+        )
     if not contents:
         raise ValueError("The uploaded file is empty.")
     return suffix
 
 
+def _workbook_sheet_names(contents: bytes) -> list[str]:
+    """Worksheet names in tab order, read from the workbook part alone."""
+    with ZipFile(BytesIO(contents)) as archive:
+        package = ElementTree.fromstring(archive.read("_rels/.rels"))
+        workbook_path = next(
+            relation.get("Target", "").lstrip("/")
+            for relation in package.iter(f"{_PACKAGE_NS}Relationship")
+            if relation.get("Type", "").endswith("/officeDocument")
+        )
+        folder, _, name = workbook_path.rpartition("/")
+        workbook = ElementTree.fromstring(archive.read(workbook_path))
+        relations = ElementTree.fromstring(archive.read(posixpath.join(folder, "_rels", f"{name}.rels")))
+    worksheet_ids = {
+        relation.get("Id")
+        for relation in relations.iter(f"{_PACKAGE_NS}Relationship")
+        if relation.get("Type", "").endswith("/worksheet")
+    }
+    return [
+        str(sheet.get("name"))
+        for sheet in workbook.iter(f"{_SPREADSHEET_NS}sheet")
+        if sheet.get(f"{_RELATIONSHIP_NS}id") in worksheet_ids
+    ]
+
+
 def list_excel_sheets(contents: bytes, filename: str) -> list[str]:
-    """Worksheet names of a workbook; empty for CSV files."""
+    """Worksheet names of a workbook; empty for CSV files. No worksheet is loaded."""
     suffix = _validate(contents, filename)
     if suffix not in EXCEL_SUFFIXES:
         return []
     try:
-        with pd.ExcelFile(BytesIO(contents), engine="openpyxl") as workbook:
-            return [str(name) for name in workbook.sheet_names]
-    except BadZipFile as error:
+        return _workbook_sheet_names(contents)
+    except (BadZipFile, KeyError, StopIteration, ElementTree.ParseError) as error:
         raise ValueError("The file is not a valid Excel workbook.") from error
 
 
-def read_tabular_file(
+class _BoundedReader(RawIOBase):
+    """A decompressed stream that fails once it yields more than ``limit`` bytes."""
+
+    def __init__(self, stream: BinaryIO, limit: int) -> None:
+        self._stream = stream
+        self._remaining = limit
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        size = self._stream.readinto(buffer)
+        self._remaining -= size
+        if self._remaining < 0:
+            raise ValueError(
+                f"The file expands to more than {MAX_DECOMPRESSED_BYTES // (1024 * 1024):,} MB "
+                "when decompressed. Upload a smaller extract."
+            )
+        return size
+
+    def close(self) -> None:
+        self._stream.close()
+        super().close()
+
+
+def _open_csv(contents: bytes, compression: str | None) -> BinaryIO:
+    """A stream of the decompressed CSV bytes, capped at ``MAX_DECOMPRESSED_BYTES``."""
+    if compression is None:
+        return BytesIO(contents)
+    if compression == "gzip":
+        stream: BinaryIO = gzip.GzipFile(fileobj=BytesIO(contents))
+    elif compression == "zip":
+        archive = ZipFile(BytesIO(contents))
+        members = [info for info in archive.infolist() if not info.is_dir()]
+        if len(members) != 1:
+            raise ValueError("A ZIP upload must contain exactly one CSV file.")
+        stream = archive.open(members[0])
+    else:
+        import zstandard
+
+        stream = zstandard.ZstdDecompressor().stream_reader(BytesIO(contents))
+    return BufferedReader(_BoundedReader(stream, MAX_DECOMPRESSED_BYTES))
+
+
+def _csv_head(contents: bytes, compression: str | None) -> tuple[bytes, bool]:
+    """The first sample bytes of the (decompressed) CSV and whether that is all of it."""
+    with _open_csv(contents, compression) as stream:
+        head = b""
+        while len(head) <= CSV_SAMPLE_BYTES:
+            block = stream.read(CSV_SAMPLE_BYTES + 1 - len(head))
+            if not block:
+                return head, True
+            head += block
+    return head[:CSV_SAMPLE_BYTES], False
+
+
+def _csv_sample(contents: bytes, compression: str | None = None) -> bytes:
+    """Leading bytes for sniffing, cut at a line boundary when the file is longer."""
+    sample, complete = _csv_head(contents, compression)
+    if not complete and b"\n" in sample:
+        sample = sample[: sample.rindex(b"\n") + 1]
+    return sample
+
+
+def detect_encoding(contents: bytes, compression: str | None = None) -> str:
+    """Pick a CSV encoding from a byte sample instead of trial-parsing the whole file."""
+    sample, complete = _csv_head(contents, compression)
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=complete)
+    except UnicodeDecodeError:
+        return "latin-1"
+    return "utf-8-sig"
+
+
+def _sniff_quotechar(text: str) -> str:
+    try:
+        quotechar = csv.Sniffer().sniff(text, delimiters="".join(CSV_DELIMITERS)).quotechar
+    except csv.Error:
+        return '"'
+    return quotechar if quotechar in {'"', "'"} else '"'
+
+
+def _records(text: str, delimiter: str, quotechar: str) -> list[tuple[int, int, int]]:
+    """(line offset, field count, filled width) of every non-blank record in the sample.
+
+    The filled width stops at the last non-empty field, so trailing delimiters
+    do not make a row look wider than its header.
+    """
+    reader = csv.reader(StringIO(text), delimiter=delimiter, quotechar=quotechar)
+    records: list[tuple[int, int, int]] = []
+    offset = 0
+    try:
+        for row in reader:
+            filled = [position for position, field in enumerate(row, start=1) if field.strip()]
+            if filled:
+                records.append((offset, len(row), filled[-1]))
+            offset = reader.line_num
+    except csv.Error:
+        pass
+    return records
+
+
+def _layout_score(records: list[tuple[int, int, int]]) -> tuple[bool, float, int]:
+    """Prefer delimiters that split rows into a consistent number of fields above one."""
+    if not records:
+        return False, 0.0, 0
+    counts = Counter(fields for _, fields, _ in records)
+    width, rows = max(counts.items(), key=lambda item: (item[1], item[0]))
+    return width > 1, rows / len(records), width
+
+
+def _header_offset(records: list[tuple[int, int, int]]) -> int:
+    """Line offset of the header: leading records narrower than a typical row are a preamble.
+
+    Rows are compared by filled width, and ties go to the narrower layout, so
+    data rows with trailing delimiters or extra fields never outrank the header.
+    """
+    if not records:
+        return 0
+    counts = Counter(filled for _, _, filled in records)
+    width = max(counts.items(), key=lambda item: (item[1], -item[0]))[0]
+    return next((offset for offset, fields, _ in records if fields >= width), 0)
+
+
+def _is_year_label(value: str) -> bool:
+    return value.isdigit() and 1900 <= int(value) <= 2100
+
+
+def _looks_numeric(value: str) -> bool:
+    try:
+        float(value.replace(",", ""))
+    except ValueError:
+        return False
+    return True
+
+
+def sniff_csv(contents: bytes, compression: str | None = None) -> CsvDialect:
+    """Choose encoding, delimiter, quote character and header row from one bounded sample."""
+    encoding = detect_encoding(contents, compression)
+    text = _csv_sample(contents, compression).decode(encoding, errors="replace")
+    quotechar = _sniff_quotechar(text)
+    candidates = {delimiter: _records(text, delimiter, quotechar) for delimiter in CSV_DELIMITERS}
+    delimiter = max(CSV_DELIMITERS, key=lambda candidate: _layout_score(candidates[candidate]))
+    if not _layout_score(candidates[delimiter])[0]:
+        delimiter = ","
+    records = candidates[delimiter]
+    skip_rows = _header_offset(records)
+
+    # A first record made only of numbers is data, unless the numbers are distinct
+    # years: a pivot exported with year columns keeps its header, as pandas would.
+    lines = text.splitlines()[skip_rows : skip_rows + 1]
+    first = [field.strip() for field in next(csv.reader(lines, delimiter=delimiter, quotechar=quotechar), [])]
+    year_labels = all(_is_year_label(field) for field in first) and len(set(first)) == len(first)
+    has_header = (
+        len(records) < 2
+        or year_labels
+        or not all(field and _looks_numeric(field) for field in first)
+    )
+    return CsvDialect(
+        encoding=encoding,
+        delimiter=delimiter,
+        quotechar=quotechar,
+        skip_rows=skip_rows,
+        has_header=has_header,
+    )
+
+
+def _csv_chunks(
+    contents: bytes,
+    dialect: CsvDialect,
+    *,
+    compression: str | None = None,
+    nrows: int | None = None,
+    usecols: Sequence[str] | Sequence[int] | None = None,
+) -> Iterator[pd.DataFrame]:
+    with (
+        _open_csv(contents, compression) as stream,
+        pd.read_csv(stream, chunksize=CSV_CHUNK_ROWS, nrows=nrows, **dialect.read_options(usecols)) as reader,
+    ):
+        yield from reader
+
+
+def iter_csv_chunks(
+    contents: bytes,
+    *,
+    encoding: str | None = None,
+    compression: str | None = None,
+    row_limit: int | None = None,
+    columns: Sequence[str] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield bounded row chunks of CSV bytes, stopping once ``row_limit`` rows are out.
+
+    The dialect is sniffed once from a byte sample, and compressed input is
+    decompressed as a stream. A decode error past the sample surfaces as
+    ``UnicodeDecodeError`` so callers can restart the stream.
+    """
+    dialect = sniff_csv(contents, compression)
+    if encoding is not None:
+        dialect = replace(dialect, encoding=encoding)
+    yield from _csv_chunks(contents, dialect, compression=compression, nrows=row_limit, usecols=columns)
+
+
+def _count_csv_rows(contents: bytes, dialect: CsvDialect, compression: str | None) -> int:
+    """Count data records with a one-column pass so skipped rows are never materialized."""
+    return sum(
+        len(chunk) for chunk in _csv_chunks(contents, dialect, compression=compression, usecols=[0])
+    )
+
+
+def _mixed_type_columns(chunks: list[pd.DataFrame]) -> list[int]:
+    """Positions of columns whose values were inferred differently across chunks."""
+    positions: list[int] = []
+    for position in range(len(chunks[0].columns)):
+        kinds = {
+            chunk.iloc[:, position].dtype.kind for chunk in chunks if chunk.iloc[:, position].notna().any()
+        }
+        if len(kinds) > 1 and not kinds <= {"i", "u", "f"}:
+            positions.append(position)
+    return positions
+
+
+def _read_csv(
+    contents: bytes,
+    dialect: CsvDialect,
+    compression: str | None,
+    row_limit: int | None,
+    columns: Sequence[str] | None,
+) -> TabularData:
+    chunks = list(
+        _csv_chunks(contents, dialect, compression=compression, nrows=row_limit, usecols=columns)
+    )
+    mixed = _mixed_type_columns(chunks) if len(chunks) > 1 else []
+    dataframe = pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+    del chunks
+    if mixed:
+        # A whole-file parse would have kept these columns as text; re-read just those to match it.
+        names = [dataframe.columns[position] for position in mixed]
+        with _open_csv(contents, compression) as stream:
+            text = pd.read_csv(stream, dtype=str, nrows=len(dataframe), **dialect.read_options(names))
+        for position, name in zip(mixed, names, strict=True):
+            dataframe.isetitem(position, text[name])
+
+    source_rows = len(dataframe)
+    if row_limit is not None and source_rows >= row_limit:
+        source_rows = _count_csv_rows(contents, dialect, compression)
+    return TabularData(dataframe=dataframe, source_rows=source_rows, dialect=dialect)
+
+
+def _missing_columns(missing: list[str]) -> ValueError:
+    return ValueError(f"Usecols do not match columns, columns expected but not found: {missing}")
+
+
+def _columnar_reader(contents: bytes, suffix: str, columns: Sequence[str] | None) -> Any:
+    """Open a Parquet file, or a Feather (Arrow IPC) file, and check ``columns`` against its schema."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    buffer = pa.BufferReader(contents)
+    try:
+        if suffix == ".parquet":
+            reader = pq.ParquetFile(buffer)
+            names = reader.schema_arrow.names
+        else:
+            reader = pa.ipc.open_file(buffer)
+            names = reader.schema.names
+    except (OSError, pa.ArrowInvalid) as error:
+        raise ValueError(f"The file is not a valid {suffix.lstrip('.').title()} file.") from error
+    if columns is not None:
+        missing = [column for column in columns if column not in names]
+        if missing:
+            raise _missing_columns(missing)
+    return reader
+
+
+def _columnar_frame(table: Any, arrow_dtypes: bool) -> pd.DataFrame:
+    dataframe = table.to_pandas(types_mapper=_arrow_types if arrow_dtypes else None)
+    if not isinstance(dataframe.index, pd.RangeIndex):
+        # A stored index (for example a date) is data, so it becomes a column again.
+        dataframe = dataframe.reset_index()
+    return dataframe
+
+
+def _read_columnar(
+    contents: bytes,
+    suffix: str,
+    row_limit: int | None,
+    columns: Sequence[str] | None,
+    arrow_dtypes: bool = False,
+) -> TabularData:
+    """Read Parquet or Feather through a zero-copy Arrow buffer with column projection."""
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    reader = _columnar_reader(contents, suffix, columns)
+    if suffix == ".feather":
+        table = feather.read_table(pa.BufferReader(contents), columns=columns, memory_map=False)
+        source_rows = table.num_rows
+        table = table.slice(0, row_limit) if row_limit is not None else table
+    elif row_limit is None or row_limit >= reader.metadata.num_rows:
+        source_rows = reader.metadata.num_rows
+        table = reader.read(columns=columns)
+    else:
+        # Row groups past the limit are never decoded.
+        source_rows = reader.metadata.num_rows
+        batches = []
+        remaining = row_limit
+        for batch in reader.iter_batches(batch_size=CSV_CHUNK_ROWS, columns=columns):
+            batches.append(batch.slice(0, remaining))
+            remaining -= len(batches[-1])
+            if remaining <= 0:
+                break
+        table = pa.Table.from_batches(batches, schema=batches[0].schema if batches else None)
+
+    return TabularData(dataframe=_columnar_frame(table, arrow_dtypes), source_rows=source_rows, typed=True)
+
+
+def _columnar_chunks(
+    contents: bytes, suffix: str, columns: Sequence[str] | None, arrow_dtypes: bool
+) -> Iterator[pd.DataFrame]:
+    reader = _columnar_reader(contents, suffix, columns)
+    if suffix == ".parquet":
+        batches = reader.iter_batches(batch_size=CSV_CHUNK_ROWS, columns=columns)
+    else:
+        batches = (
+            reader.get_batch(position).select(columns) if columns is not None else reader.get_batch(position)
+            for position in range(reader.num_record_batches)
+        )
+
+    def chunks() -> Iterator[pd.DataFrame]:
+        for batch in batches:
+            # A Feather batch can hold the whole table; convert it a slice at a time.
+            for offset in range(0, len(batch), CSV_CHUNK_ROWS):
+                yield _columnar_frame(batch.slice(offset, CSV_CHUNK_ROWS), arrow_dtypes)
+
+    return chunks()
+
+
+def _header_names(header: tuple[object, ...]) -> list[object]:
+    """Column labels as ``pd.read_excel`` names them: blanks and duplicates made unique."""
+    names: list[object] = []
+    seen: set[object] = set()
+    for position, value in enumerate(header):
+        name = f"Unnamed: {position}" if value is None else value
+        candidate, copy = name, 0
+        while candidate in seen:
+            copy += 1
+            candidate = f"{name}.{copy}"
+        seen.add(candidate)
+        names.append(candidate)
+    return names
+
+
+def _typed_column(values: tuple[object, ...]) -> pd.Series:
+    array = np.array(values, dtype=object)
+    missing = pd.isna(array)
+    array[missing] = np.nan
+    column = pd.Series(array, dtype=object).infer_objects()
+    if missing.any() and infer_dtype(column, skipna=True) == "boolean":
+        # pd.read_excel reads a boolean column with blanks as 1.0/0.0/NaN; keep that contract.
+        column = column.astype(float)
+    return column
+
+
+def _read_excel(
+    contents: bytes,
+    sheet_name: str | None,
+    row_limit: int | None,
+    columns: Sequence[str] | None,
+) -> TabularData:
+    """Stream worksheet rows in read-only mode and build the frame column by column."""
+    workbook = load_workbook(BytesIO(contents), read_only=True, data_only=True)
+    try:
+        if sheet_name is None:
+            worksheet = workbook.worksheets[0]
+        elif sheet_name in workbook.sheetnames:
+            worksheet = workbook[sheet_name]
+        else:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+
+        # Iterate the rows actually stored: a stale dimension would silently cut the read short.
+        declared_rows = worksheet.max_row
+        worksheet.reset_dimensions()
+        rows = worksheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return TabularData(dataframe=pd.DataFrame(), source_rows=0)
+        limit = row_limit + 1 if row_limit is not None else None
+        records = list(islice(rows, limit))
+        truncated = row_limit is not None and len(records) > row_limit
+        last_row = declared_rows if truncated else None
+        if truncated and (last_row is None or last_row <= len(records)):
+            # The sheet dimension is missing or stale; count the rest of the rows instead.
+            last_row = 1 + len(records) + sum(1 for _ in rows)
+    finally:
+        workbook.close()
+
+    if truncated:
+        records.pop()
+    else:
+        while records and all(value is None for value in records[-1]):
+            records.pop()
+    width = max(
+        (
+            next((position + 1 for position in range(len(row) - 1, -1, -1) if row[position] is not None), 0)
+            for row in (header, *records)
+        ),
+        default=0,
+    )
+    names = _header_names(tuple(header[:width]) + (None,) * (width - len(header)))
+    selected = list(range(width))
+    if columns is not None:
+        missing = [column for column in columns if column not in names]
+        if missing:
+            raise _missing_columns(missing)
+        selected = [position for position, name in enumerate(names) if name in columns]
+
+    padded = [tuple(row[:width]) + (None,) * (width - len(row)) for row in records]
+    cells = list(zip(*padded, strict=True)) if padded else [()] * width
+    dataframe = pd.DataFrame(
+        {names[position]: _typed_column(cells[position]) for position in selected},
+        columns=[names[position] for position in selected],
+    )
+    source_rows = len(dataframe)
+    if truncated:
+        # The sheet dimension is workbook metadata; when it is sound no rows past the limit are parsed.
+        source_rows = max(source_rows + 1, (last_row or 0) - 1)
+    return TabularData(dataframe=dataframe, source_rows=source_rows)
+
+
+@traced
+def read_tabular_data(
     contents: bytes,
     filename: str,
     sheet_name: str | None = None,
-) -> pd.DataFrame:
-    """Read CSV bytes, or the chosen (default: first) worksheet of a workbook."""
+    *,
+    row_limit: int | None = None,
+    columns: Sequence[str] | None = None,
+    arrow_dtypes: bool = False,
+) -> TabularData:
+    """Read at most ``row_limit`` rows, optionally only ``columns``, and count the source rows.
+
+    Both limits are pushed into the parser, so rows and columns ADA would
+    discard are never materialized. ``arrow_dtypes`` reads text as Arrow-backed
+    strings.
+    """
+    data = _read_tabular_data(contents, filename, sheet_name, row_limit, columns, arrow_dtypes)
+    if arrow_dtypes:
+        arrow_text(data.dataframe)
+    return data
+
+
+def _read_tabular_data(
+    contents: bytes,
+    filename: str,
+    sheet_name: str | None,
+    row_limit: int | None,
+    columns: Sequence[str] | None,
+    arrow_dtypes: bool,
+) -> TabularData:
     suffix = _validate(contents, filename)
     if suffix in EXCEL_SUFFIXES:
         try:
-            return pd.read_excel(
-                BytesIO(contents),
-                engine="openpyxl",
-                sheet_name=sheet_name if sheet_name is not None else 0,
-            )
+            return _read_excel(contents, sheet_name, row_limit, columns)
         except BadZipFile as error:
             raise ValueError("The file is not a valid Excel workbook.") from error
 
-    parse_errors: list[Exception] = []
-    for encoding in ("utf-8-sig", "utf-8", "latin-1"):
+    if suffix in COLUMNAR_SUFFIXES:
+        return _read_columnar(contents, suffix, row_limit, columns, arrow_dtypes)
+
+    compression = CSV_COMPRESSION.get(suffix)
+    try:
+        dialect = sniff_csv(contents, compression)
         try:
-            parsed = pd.read_csv(BytesIO(contents), encoding=encoding, low_memory=False)
-            sample = contents[:4096]
-            if len(parsed.columns) == 1 and any(separator in sample for separator in (b";", b"\t")):
-                parsed = pd.read_csv(
-                    BytesIO(contents),
-                    encoding=encoding,
-                    sep=None,
-                    engine="python",
-                )
-            return parsed
-        except (UnicodeDecodeError, pd.errors.ParserError) as error:
-            parse_errors.append(error)
-    raise ValueError("The file could not be parsed as CSV.") from parse_errors[-1]
+            return _read_csv(contents, dialect, compression, row_limit, columns)
+        except UnicodeDecodeError:
+            # The sample looked like UTF-8 but a later byte did not; Latin-1 decodes anything.
+            return _read_csv(contents, replace(dialect, encoding="latin-1"), compression, row_limit, columns)
+    except (UnicodeDecodeError, pd.errors.ParserError, BadZipFile, EOFError, gzip.BadGzipFile) as error:
+        raise ValueError("The file could not be parsed as CSV.") from error
+
+
+def _csv_stream(
+    contents: bytes, dialect: CsvDialect, compression: str | None, columns: Sequence[str] | None
+) -> Iterator[pd.DataFrame]:
+    try:
+        yield from _csv_chunks(contents, dialect, compression=compression, usecols=columns)
+    except (pd.errors.ParserError, BadZipFile, EOFError, gzip.BadGzipFile) as error:
+        raise ValueError("The file could not be parsed as CSV.") from error
+
+
+def _numbered(chunks: Iterator[pd.DataFrame], arrow_dtypes: bool) -> Iterator[pd.DataFrame]:
+    start = 0
+    for chunk in chunks:
+        chunk.index = pd.RangeIndex(start, start + len(chunk))
+        start += len(chunk)
+        yield arrow_text(chunk) if arrow_dtypes else chunk
+
+
+def stream_tabular_data(
+    contents: bytes,
+    filename: str,
+    sheet_name: str | None = None,
+    *,
+    columns: Sequence[str] | None = None,
+    arrow_dtypes: bool = False,
+    encoding: str | None = None,
+) -> TabularStream:
+    """Read every row of an upload as chunks of at most ``CSV_CHUNK_ROWS`` rows.
+
+    CSV, compressed CSV, Parquet and Feather are decoded one chunk at a time.
+    A worksheet is read whole; Excel caps it at 1,048,576 rows. ``encoding``
+    overrides the sniffed CSV encoding, for a caller restarting the stream
+    after a ``UnicodeDecodeError`` past the sample.
+    """
+    suffix = _validate(contents, filename)
+    if suffix in EXCEL_SUFFIXES:
+        data = _read_tabular_data(contents, filename, sheet_name, None, columns, arrow_dtypes)
+        return TabularStream(chunks=_numbered(iter([data.dataframe]), arrow_dtypes))
+    if suffix in COLUMNAR_SUFFIXES:
+        chunks = _columnar_chunks(contents, suffix, columns, arrow_dtypes)
+        return TabularStream(chunks=_numbered(chunks, arrow_dtypes), typed=True)
+
+    compression = CSV_COMPRESSION.get(suffix)
+    try:
+        dialect = sniff_csv(contents, compression)
+    except (UnicodeDecodeError, BadZipFile, EOFError, gzip.BadGzipFile) as error:
+        raise ValueError("The file could not be parsed as CSV.") from error
+    if encoding is not None:
+        dialect = replace(dialect, encoding=encoding)
+    chunks = _csv_stream(contents, dialect, compression, columns)
+    return TabularStream(chunks=_numbered(chunks, arrow_dtypes), dialect=dialect)
+
+
+def read_tabular_file(
+    contents: bytes,
+    filename: str,
+    sheet_name: str | None = None,
+    *,
+    row_limit: int | None = None,
+    columns: Sequence[str] | None = None,
+    arrow_dtypes: bool = False,
+) -> pd.DataFrame:
+    """Read CSV bytes, or the chosen (default: first) worksheet of a workbook."""
+    return read_tabular_data(
+        contents, filename, sheet_name, row_limit=row_limit, columns=columns, arrow_dtypes=arrow_dtypes
+    ).dataframe
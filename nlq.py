@@ -10,12 +10,26 @@ rules cannot parse, and it goes through the same local executor.
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, replace
+from itertools import groupby, pairwise
 from typing import Literal
 
+import numpy as np
 import pandas as pd
 
-from business_insights import ColumnRoles, format_number, preferred_frequency, trend_frame
+from business_insights import (
+    ColumnRoles,
+    format_number,
+    period_start,
+    preferred_frequency,
+    text_values,
+    trend_frame,
+)
+from tracing import traced
 
 Intent = Literal["aggregate", "count", "rank", "breakdown", "trend", "growth"]
 Aggregation = Literal["sum", "mean", "median", "min", "max", "count"]
@@ -59,6 +73,7 @@ GROWTH_WORDS = (
     "increase", "increased", "decrease", "decreased",
     "decline", "declined", "dropped", "drop", "shrank", "fell",
 )
+
 TREND_WORDS = ("over time", "trend", "timeline", "history", "trajectory")
 GRAIN_WORDS = {
     "daily": "D",
@@ -95,7 +110,9 @@ MONTH_NAMES = {
     for name in names
 }
 
-MAX_FILTER_CANDIDATES = 200
+MAX_FILTER_CANDIDATES = 50_000
+MASK_CACHE_ENTRIES = 64
+ANSWER_CACHE_ENTRIES = 256
 BREAKDOWN_LIMIT = 12
 
 
@@ -136,6 +153,12 @@ def _norm(text: str) -> str:
     return " ".join(cleaned.split())
 
 
+def _norm_values(labels: list[str]) -> list[str]:
+    """``_norm`` over many labels at once."""
+    cleaned = pd.Series(labels, dtype=object).str.lower().str.replace(r"[^0-9a-z]+", " ", regex=True)
+    return cleaned.str.strip().tolist()
+
+
 def _word_variants(normalized_name: str) -> set[str]:
     variants = {normalized_name, f"{normalized_name}s", f"{normalized_name}es"}
     if normalized_name.endswith("s"):
@@ -143,95 +166,175 @@ def _word_variants(normalized_name: str) -> set[str]:
     return variants
 
 
-def _mentioned(normalized_name: str, question: str) -> bool:
-    return any(
-        re.search(rf"\b{re.escape(variant)}\b", question)
-        for variant in _word_variants(normalized_name)
-        if variant
-    )
+@dataclass(frozen=True)
+class _Target:
+    """A column or value a question can mention; the lowest ``rank`` wins among matches."""
 
+    kind: Literal["measure", "dimension", "countable", "value"]
+    rank: tuple[int, ...]
+    column: str
+    value: str | None = None
 
-def _match_column(question: str, columns: list[str]) -> str | None:
-    """Return the column with the longest name mentioned in the question."""
-    matches = [column for column in columns if _mentioned(_norm(column), question)]
-    return max(matches, key=lambda column: len(_norm(column))) if matches else None
 
+@dataclass(frozen=True)
+class QuestionIndex:
+    """Every column name and column value of one dataset, keyed by its normalized phrase.
+
+    Build it once per dataset with ``build_question_index``. A question is then
+    read in a single pass over its word n-grams, so parsing costs the same for
+    a five-column table as for one with hundreds of columns and tens of
+    thousands of values.
+    """
+
+    targets: tuple[_Target, ...]
+    phrases: dict[str, tuple[int, ...]]
+    prefixes: frozenset[str]
+
+    def matches(self, question: str) -> list[_Target]:
+        """Targets mentioned in a ``_norm``-alized question, in no particular order."""
+        starts = [0, *(offset + 1 for offset, character in enumerate(question) if character == " ")]
+        ends = [offset - 1 for offset in starts[1:]] + [len(question)]
+        found: set[int] = set()
+        for first, start in enumerate(starts):
+            for end in ends[first:]:
+                phrase = question[start:end]
+                found.update(self.phrases.get(phrase, ()))
+                if phrase not in self.prefixes:
+                    break
+        return [self.targets[target] for target in found]
+
+
+def _leading_words(phrase: str) -> Iterator[str]:
+    """The phrase's proper word prefixes: "a b c" gives "a" and "a b"."""
+    offset = phrase.find(" ")
+    while offset != -1:
+        yield phrase[:offset]
+        offset = phrase.find(" ", offset + 1)
+
+
+@traced
+def build_question_index(dataframe: pd.DataFrame, roles: ColumnRoles) -> QuestionIndex:
+    """Index the columns, and the values of text columns, that questions refer to."""
+    targets: list[_Target] = []
+    phrases: dict[str, list[int]] = {}
+
+    def add(normalized_name: str, target: _Target) -> None:
+        targets.append(target)
+        for variant in _word_variants(normalized_name):
+            if variant and not variant.endswith(" "):
+                phrases.setdefault(variant, []).append(len(targets) - 1)
+
+    for kind, columns in (("measure", roles.numeric), ("dimension", roles.dimensions)):
+        present = [column for column in columns if column in dataframe.columns]
+        for position, column in enumerate(present):
+            add(_norm(column), _Target(kind, (-len(_norm(column)), position), column))
 
-def _match_countable(question: str, roles: ColumnRoles) -> str | None:
-    """Match 'how many <entities>' to an identifier or dimension column."""
     candidates = [column for column in (roles.identifier, *roles.dimensions) if column]
-    for column in candidates:
-        tokens = {_norm(column), _norm(column).split(" ")[0]}
-        if any(_mentioned(token, question) for token in tokens if token):
-            return column
-    return None
-
-
-def _detect_value_filters(
-    question: str,
-    dataframe: pd.DataFrame,
-    roles: ColumnRoles,
-    *,
-    exclude: tuple[str | None, ...] = (),
-) -> tuple[ValueFilter, ...]:
-    filters: list[ValueFilter] = []
-    for column in roles.dimensions:
-        if column in exclude or column not in dataframe.columns:
-            continue
+    for position, column in enumerate(candidates):
+        for token in {_norm(column), _norm(column).split(" ")[0]}:
+            if token:
+                add(token, _Target("countable", (position,), column))
+
+    # Detected dimensions first, then every other text column (customers, SKUs, ...).
+    # Those can hold tens of thousands of values, so purely numeric ones are left
+    # to the year and top-N rules rather than read as filters.
+    dimensions = [column for column in roles.dimensions if column in dataframe.columns]
+    text_columns = dataframe.select_dtypes(include=["object", "string", "category"]).columns
+    extra = [column for column in text_columns if column not in dimensions]
+    for position, column in enumerate([*dimensions, *extra]):
         uniques = dataframe[column].dropna().unique()
         if len(uniques) > MAX_FILTER_CANDIDATES:
             continue
-        matched = [
-            str(value)
-            for value in uniques
-            if len(_norm(value)) >= 3 and _mentioned(_norm(value), question)
-        ]
-        if matched:
-            filters.append(ValueFilter(column=column, values=tuple(matched)))
-    return tuple(filters)
+        labels = [str(value) for value in uniques]
+        numeric_allowed = position < len(dimensions)
+        for order, (label, name) in enumerate(zip(labels, _norm_values(labels), strict=True)):
+            if len(name) < 3 or (not numeric_allowed and name.replace(" ", "").isdigit()):
+                continue
+            add(name, _Target("value", (position, order), column, label))
+
+    prefixes = frozenset(prefix for phrase in phrases for prefix in _leading_words(phrase))
+    return QuestionIndex(
+        targets=tuple(targets),
+        phrases={phrase: tuple(ids) for phrase, ids in phrases.items()},
+        prefixes=prefixes,
+    )
+
+
+def _match_column(found: list[_Target], kind: str) -> str | None:
+    """Return the matched column of ``kind`` with the longest name, or the first of equals."""
+    matches = [target for target in found if target.kind == kind]
+    return min(matches, key=lambda target: target.rank).column if matches else None
+
+
+def _detect_value_filters(found: list[_Target], *, exclude: str | None) -> tuple[ValueFilter, ...]:
+    matched = sorted(
+        (target for target in found if target.kind == "value" and target.column != exclude),
+        key=lambda target: target.rank,
+    )
+    return tuple(
+        ValueFilter(column=column, values=tuple(str(target.value) for target in targets))
+        for column, targets in groupby(matched, key=lambda target: target.column)
+    )
 
 
-def _detect_time_filter(question: str) -> tuple[int | None, int | None]:
-    year_match = re.search(r"\b(19|20)\d{2}\b", question)
-    year = int(year_match.group()) if year_match else None
-    month = next(
-        (number for name, number in MONTH_NAMES.items() if re.search(rf"\b{name}\b", question)),
+def _detect_time_filter(tokens: list[str]) -> tuple[int | None, int | None]:
+    year = next(
+        (int(token) for token in tokens if len(token) == 4 and token.isdigit() and token[:2] in ("19", "20")),
         None,
     )
+    month = next((number for name, number in MONTH_NAMES.items() if name in tokens), None)
     return year, month
 
 
-def _detect_grain(question: str) -> str | None:
+def _detect_grain(words: set[str]) -> str | None:
     for word, grain in GRAIN_WORDS.items():
-        if re.search(rf"\b{word}(ly)?\b", question):
+        if word in words or f"{word}ly" in words:
             return grain
     return None
 
 
-def parse_question(question: str, dataframe: pd.DataFrame, roles: ColumnRoles) -> QueryPlan | None:
-    """Turn a plain-English question into an explicit plan, or None if unsupported."""
+def _detect_top(tokens: list[str]) -> tuple[str, int] | None:
+    for word, count in pairwise(tokens):
+        if word in ("top", "bottom") and len(count) <= 3 and count.isdigit():
+            return word, int(count)
+    return None
+
+
+def parse_question(
+    question: str,
+    dataframe: pd.DataFrame,
+    roles: ColumnRoles,
+    index: QuestionIndex | None = None,
+) -> QueryPlan | None:
+    """Turn a plain-English question into an explicit plan, or None if unsupported.
+
+    Pass the dataset's ``QuestionIndex`` to skip rebuilding it for every question.
+    """
     q = _norm(question)
     if not q:
         return None
+    if index is None:
+        index = build_question_index(dataframe, roles)
 
-    numeric_columns = [column for column in roles.numeric if column in dataframe.columns]
-    dimension_columns = [column for column in roles.dimensions if column in dataframe.columns]
+    tokens = q.split(" ")
+    words = set(tokens)
+    found = index.matches(q)
 
-    measure = _match_column(q, numeric_columns)
-    dimension = _match_column(q, dimension_columns)
-    year, month = _detect_time_filter(q)
-    grain = _detect_grain(q)
-    filters = _detect_value_filters(q, dataframe, roles, exclude=(dimension,))
+    measure = _match_column(found, "measure")
+    dimension = _match_column(found, "dimension")
+    year, month = _detect_time_filter(tokens)
+    grain = _detect_grain(words)
+    filters = _detect_value_filters(found, exclude=dimension)
 
     aggregation: Aggregation | None = next(
-        (AGGREGATION_WORDS[word] for word in AGGREGATION_WORDS if re.search(rf"\b{word}\b", q)),
+        (AGGREGATION_WORDS[word] for word in AGGREGATION_WORDS if word in words),
         None,
     )
-    top_match = re.search(r"\b(top|bottom)\s+(\d{1,3})\b", q)
-    superlative = any(re.search(rf"\b{word}\b", q) for word in SUPERLATIVE_WORDS)
-    wants_breakdown = bool(re.search(r"\b(by|per|across|breakdown|split|each)\b", q))
-    wants_count = bool(re.search(r"\b(how many|count|number of)\b", q))
-    wants_growth = any(re.search(rf"\b{word}\b", q) for word in GROWTH_WORDS)
+    top_match = _detect_top(tokens)
+    superlative = not words.isdisjoint(SUPERLATIVE_WORDS)
+    wants_breakdown = not words.isdisjoint(("by", "per", "across", "breakdown", "split", "each"))
+    wants_count = "count" in words or any(f" {phrase} " in f" {q} " for phrase in ("how many", "number of"))
+    wants_growth = not words.isdisjoint(GROWTH_WORDS)
     wants_trend = grain is not None or any(phrase in q for phrase in TREND_WORDS)
 
     base = {
@@ -245,22 +348,23 @@ def parse_question(question: str, dataframe: pd.DataFrame, roles: ColumnRoles) -
     if wants_count and not wants_growth:
         if dimension and wants_breakdown:
             return QueryPlan(intent="breakdown", aggregation="count", dimension=dimension, **base)
-        countable = _match_countable(q, roles)
+        countable = _match_column(found, "countable")
         return QueryPlan(intent="count", aggregation="count", count_column=countable, **base)
 
     if wants_growth and roles.date:
         wants_ranked_growth = superlative or any(word in q for word in ("which", "fastest", "slowest"))
         rank_dimension = dimension or (roles.dimension if wants_ranked_growth else None)
-        ascending = bool(re.search(r"\b(slowest|least|declined|decreased|dropped|fell|shrank|worst)\b", q))
+        ascending = not words.isdisjoint(
+            ("slowest", "least", "declined", "decreased", "dropped", "fell", "shrank", "worst")
+        )
         return QueryPlan(intent="growth", dimension=rank_dimension, ascending=ascending, **base)
 
     if (top_match or superlative) and dimension:
         if top_match:
-            top_n = int(top_match.group(2))
-            ascending = top_match.group(1) == "bottom"
+            ascending, top_n = top_match[0] == "bottom", top_match[1]
         else:
             top_n = 1
-            ascending = bool(re.search(r"\b(worst|lowest|smallest|bottom)\b", q))
+            ascending = not words.isdisjoint(("worst", "lowest", "smallest", "bottom"))
         return QueryPlan(
             intent="rank",
             aggregation=aggregation if aggregation in ("mean", "median") else "sum",
@@ -287,31 +391,118 @@ def parse_question(question: str, dataframe: pd.DataFrame, roles: ColumnRoles) -
     return None
 
 
-def _apply_filters(
-    dataframe: pd.DataFrame, plan: QueryPlan, roles: ColumnRoles
-) -> tuple[pd.DataFrame, list[str]]:
-    working = dataframe
-    applied: list[str] = []
-    for value_filter in plan.filters:
-        if value_filter.column not in working.columns:
-            raise ValueError(f"Unknown filter column: {value_filter.column}")
-        mask = working[value_filter.column].astype(str).isin(value_filter.values)
-        working = working.loc[mask]
-        applied.append(f"{value_filter.column} in ({', '.join(value_filter.values)})")
-    if roles.date and roles.date in working.columns and (plan.year or plan.month):
-        dates = working[roles.date]
-        if plan.year:
-            working = working.loc[dates.dt.year == plan.year]
-            dates = working[roles.date]
-        if plan.month:
-            working = working.loc[dates.dt.month == plan.month]
-        month_name = next(
-            (name.title() for name, number in MONTH_NAMES.items() if number == plan.month and len(name) > 3),
-            None,
-        )
-        when = " ".join(part for part in (month_name, str(plan.year) if plan.year else None) if part)
-        applied.append(f"{roles.date} in {when}")
-    return working, applied
+class QueryExecutor:
+    """Runs plans against one dataset, keeping what repeated questions share.
+
+    Filter columns are factorized into integer codes once, the date column's
+    year and month are extracted once, and each filter's row mask is kept in a
+    bounded LRU. A follow-up question combines cached masks with NumPy ``&``
+    instead of converting and matching every row's text again.
+    """
+
+    def __init__(self, dataframe: pd.DataFrame, roles: ColumnRoles) -> None:
+        self.dataframe = dataframe
+        self.roles = roles
+        self._codes: dict[str, tuple[np.ndarray, pd.Index]] = {}
+        self._date_parts: dict[str, np.ndarray] = {}
+        self._masks: OrderedDict[ValueFilter | tuple[str, int], np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _factorized(self, column: str) -> tuple[np.ndarray, pd.Index]:
+        with self._lock:
+            cached = self._codes.get(column)
+        if cached is not None:
+            return cached
+        values = text_values(self.dataframe[column])
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            computed = values.cat.codes.to_numpy(), values.cat.categories
+        else:
+            computed = pd.factorize(values)
+        # A racing thread computed the same codes; keep whichever was published first.
+        with self._lock:
+            return self._codes.setdefault(column, computed)
+
+    def _date_part(self, part: str) -> np.ndarray:
+        """Each row's calendar year or month in wall-clock time, 0 where the date is missing."""
+        with self._lock:
+            cached = self._date_parts.get(part)
+        if cached is not None:
+            return cached
+        assert self.roles.date is not None
+        dates = self.dataframe[self.roles.date]
+        if isinstance(dates.dtype, pd.DatetimeTZDtype):
+            dates = dates.dt.tz_localize(None)
+        months = dates.to_numpy(dtype="datetime64[ns]").astype("datetime64[M]")
+        missing = np.isnat(months)
+        elapsed = months.view(np.int64)
+        parts = {
+            "year": np.where(missing, 0, elapsed // 12 + 1970),
+            "month": np.where(missing, 0, elapsed % 12 + 1),
+        }
+        # Both parts are published together, so a reader never sees one without the other.
+        with self._lock:
+            for name, values in parts.items():
+                self._date_parts.setdefault(name, values)
+            return self._date_parts[part]
+
+    def mask(self, key: ValueFilter | tuple[str, int]) -> np.ndarray:
+        """Rows matching a value filter, or a ``("year", 2024)``-style date part."""
+        with self._lock:
+            cached = self._masks.get(key)
+            if cached is not None:
+                self._masks.move_to_end(key)
+                return cached
+        if isinstance(key, ValueFilter):
+            codes, uniques = self._factorized(key.column)
+            # Missing values have code -1, which lands on the appended False.
+            matched = np.append(np.asarray(uniques.isin(key.values), dtype=bool), False)
+            computed = matched[codes]
+        else:
+            part, number = key
+            computed = self._date_part(part) == number
+        computed.flags.writeable = False
+        with self._lock:
+            self._masks[key] = computed
+            while len(self._masks) > MASK_CACHE_ENTRIES:
+                self._masks.popitem(last=False)
+        return computed
+
+    def filtered(
+        self, plan: QueryPlan, columns: Iterable[str | None] = ()
+    ) -> tuple[pd.DataFrame, list[str]]:
+        """The plan's rows and a description of each filter that produced them.
+
+        Filtered rows carry the columns the plan reads, plus any in ``columns``.
+        """
+        masks: list[np.ndarray] = []
+        applied: list[str] = []
+        for value_filter in plan.filters:
+            if value_filter.column not in self.dataframe.columns:
+                raise ValueError(f"Unknown filter column: {value_filter.column}")
+            masks.append(self.mask(value_filter))
+            applied.append(f"{value_filter.column} in ({', '.join(value_filter.values)})")
+        date = self.roles.date
+        if date and date in self.dataframe.columns and (plan.year or plan.month):
+            if plan.year:
+                masks.append(self.mask(("year", plan.year)))
+            if plan.month:
+                masks.append(self.mask(("month", plan.month)))
+            month_name = next(
+                (
+                    name.title()
+                    for name, number in MONTH_NAMES.items()
+                    if number == plan.month and len(name) > 3
+                ),
+                None,
+            )
+            when = " ".join(part for part in (month_name, str(plan.year) if plan.year else None) if part)
+            applied.append(f"{date} in {when}")
+        if not masks:
+            return self.dataframe, applied
+        # Copy only the columns a plan reads, not every column of the matching rows.
+        used = (date, plan.measure, plan.dimension, plan.count_column, *columns)
+        kept = [column for column in dict.fromkeys(used) if column and column in self.dataframe.columns]
+        return self.dataframe.loc[np.logical_and.reduce(masks), kept], applied
 
 
 def _scoped(applied_filters: list[str]) -> str:
@@ -322,17 +513,38 @@ def _aggregate_series(series: pd.Series, aggregation: Aggregation) -> float:
     return float(getattr(series.dropna(), aggregation)())
 
 
+GroupKey = tuple[str | None, Aggregation]
+
+
+def _group_key(plan: QueryPlan) -> GroupKey:
+    """The (measure, aggregation) a rank or breakdown groups; ``(None, "count")`` counts rows."""
+    if plan.aggregation == "count" or not plan.measure:
+        return None, "count"
+    return plan.measure, plan.aggregation
+
+
+def _group_passes(working: pd.DataFrame, dimension: str, plans: list[QueryPlan]) -> dict[GroupKey, pd.Series]:
+    """Group ``working`` by ``dimension`` once and aggregate everything ``plans`` rank or break down."""
+    grouping = working.dropna(subset=[dimension]).groupby(dimension, observed=True)
+    passes: dict[GroupKey, pd.Series] = {}
+    for plan in plans:
+        measure, aggregation = key = _group_key(plan)
+        if key not in passes:
+            passes[key] = grouping.size() if measure is None else grouping[measure].agg(aggregation)
+    return passes
+
+
 def _grouped_frame(
-    dataframe: pd.DataFrame, plan: QueryPlan, value_label: str
+    dataframe: pd.DataFrame,
+    plan: QueryPlan,
+    value_label: str,
+    groups: dict[GroupKey, pd.Series] | None = None,
 ) -> pd.DataFrame:
     assert plan.dimension is not None
-    working = dataframe.dropna(subset=[plan.dimension])
-    if plan.aggregation == "count" or not plan.measure:
-        grouped = working.groupby(plan.dimension, as_index=False).size()
-        grouped.columns = [plan.dimension, value_label]
-    else:
-        grouped = working.groupby(plan.dimension, as_index=False)[plan.measure].agg(plan.aggregation)
-        grouped.columns = [plan.dimension, value_label]
+    if groups is None:
+        groups = _group_passes(dataframe, plan.dimension, [plan])
+    grouped = groups[_group_key(plan)].reset_index()
+    grouped.columns = [plan.dimension, value_label]
     grouped = grouped.sort_values(value_label, ascending=plan.ascending)
     if plan.aggregation in ("sum", "count"):
         total = float(grouped[value_label].sum())
@@ -341,15 +553,39 @@ def _grouped_frame(
     return grouped.reset_index(drop=True)
 
 
-def execute_plan(plan: QueryPlan, dataframe: pd.DataFrame, roles: ColumnRoles) -> QueryAnswer:
-    """Run a validated plan locally and package the auditable answer."""
+def execute_plan(
+    plan: QueryPlan,
+    dataframe: pd.DataFrame,
+    roles: ColumnRoles,
+    executor: QueryExecutor | None = None,
+) -> QueryAnswer:
+    """Run a validated plan locally and package the auditable answer.
+
+    Pass the dataset's ``QueryExecutor`` to reuse its codes and filter masks.
+    """
+    _check_columns(plan, dataframe)
+    if executor is None:
+        executor = QueryExecutor(dataframe, roles)
+    working, applied = executor.filtered(plan)
+    return _execute_scoped(plan, working, applied, roles)
+
+
+def _check_columns(plan: QueryPlan, dataframe: pd.DataFrame) -> None:
     for column in (plan.measure, plan.dimension, plan.count_column):
         if column is not None and column not in dataframe.columns:
             raise ValueError(f"Unknown column in plan: {column}")
 
-    working, applied = _apply_filters(dataframe, plan, roles)
+
+def _execute_scoped(
+    plan: QueryPlan,
+    working: pd.DataFrame,
+    applied: list[str],
+    roles: ColumnRoles,
+    groups: dict[GroupKey, pd.Series] | None = None,
+) -> QueryAnswer:
+    """Answer ``plan`` over its already filtered rows, reusing ``groups`` for ranks and breakdowns."""
     scope = _scoped(applied)
-    if working.empty:
+    if not len(working):
         return QueryAnswer(
             question="",
             plan=plan,
@@ -392,7 +628,7 @@ def execute_plan(plan: QueryPlan, dataframe: pd.DataFrame, roles: ColumnRoles) -
         assert plan.dimension is not None
         label = AGGREGATION_LABELS[plan.aggregation]
         value_label = f"{label} {plan.measure}" if plan.measure and plan.aggregation != "count" else "Rows"
-        grouped = _grouped_frame(working, plan, value_label)
+        grouped = _grouped_frame(working, plan, value_label, groups)
         limit = plan.top_n if plan.intent == "rank" else BREAKDOWN_LIMIT
         table = grouped.head(limit or BREAKDOWN_LIMIT)
         leader = table.iloc[0]
@@ -458,6 +694,50 @@ def execute_plan(plan: QueryPlan, dataframe: pd.DataFrame, roles: ColumnRoles) -
     raise ValueError(f"Unsupported intent: {plan.intent}")
 
 
+class AnswerCache:
+    """Executed answers keyed by (dataset fingerprint, roles, plan), least recently used first out.
+
+    The fingerprint names one version of the data; the app uses the prepared
+    dataset's version plus any focus. A repeated question or suggestion click
+    is then a dictionary lookup instead of a filter and group-by. Answers are
+    shared between callers, so their tables are read-only by convention.
+    """
+
+    def __init__(self, max_entries: int = ANSWER_CACHE_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._answers: OrderedDict[tuple[str, ColumnRoles, QueryPlan], QueryAnswer] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._answers)
+
+    def execute(
+        self,
+        fingerprint: str,
+        plan: QueryPlan,
+        dataframe: pd.DataFrame,
+        roles: ColumnRoles,
+        executor: QueryExecutor | None = None,
+    ) -> QueryAnswer:
+        """``execute_plan``, answered from the cache when this plan already ran on this data."""
+        key = (fingerprint, roles, plan)
+        with self._lock:
+            cached = self._answers.get(key)
+            if cached is not None:
+                self._answers.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+        answer = execute_plan(plan, dataframe, roles, executor)
+        with self._lock:
+            self._answers[key] = answer
+            while len(self._answers) > self.max_entries:
+                self._answers.popitem(last=False)
+        return answer
+
+
 def _execute_growth(
     plan: QueryPlan,
     working: pd.DataFrame,
@@ -490,12 +770,16 @@ def _execute_growth(
         frame = working[[roles.date, plan.dimension] + ([measure] if measure else [])].dropna(
             subset=[roles.date, plan.dimension]
         )
-        frame = frame.assign(Period=frame[roles.date].dt.to_period(grain).dt.to_timestamp())
+        frame = frame.assign(Period=period_start(frame[roles.date], grain))
         frame = frame[frame["Period"].isin([previous_period, current_period])]
         if measure:
-            pivot = frame.groupby([plan.dimension, "Period"])[measure].sum().unstack(fill_value=0.0)
+            pivot = (
+                frame.groupby([plan.dimension, "Period"], observed=True)[measure]
+                .sum()
+                .unstack(fill_value=0.0)
+            )
         else:
-            pivot = frame.groupby([plan.dimension, "Period"]).size().unstack(fill_value=0)
+            pivot = frame.groupby([plan.dimension, "Period"], observed=True).size().unstack(fill_value=0)
         if previous_period not in pivot.columns or current_period not in pivot.columns:
             return QueryAnswer(
                 question="",
@@ -568,13 +852,29 @@ def _phrase(applied_filters: list[str]) -> str:
     return f" for {'; '.join(applied_filters)}" if applied_filters else ""
 
 
-def answer_question(question: str, dataframe: pd.DataFrame, roles: ColumnRoles) -> QueryAnswer | None:
-    """Parse and execute in one step; None means the rules could not read it."""
-    plan = parse_question(question, dataframe, roles)
+@traced
+def answer_question(
+    question: str,
+    dataframe: pd.DataFrame,
+    roles: ColumnRoles,
+    index: QuestionIndex | None = None,
+    executor: QueryExecutor | None = None,
+    cache: AnswerCache | None = None,
+    fingerprint: str | None = None,
+) -> QueryAnswer | None:
+    """Parse and execute in one step; None means the rules could not read it.
+
+    With both a ``cache`` and the dataset's ``fingerprint``, a plan that
+    already ran on this data is answered from the cache.
+    """
+    plan = parse_question(question, dataframe, roles, index)
     if plan is None:
         return None
     try:
-        result = execute_plan(plan, dataframe, roles)
+        if cache is not None and fingerprint is not None:
+            result = cache.execute(fingerprint, plan, dataframe, roles, executor)
+        else:
+            result = execute_plan(plan, dataframe, roles, executor)
     except ValueError:
         return None
     return QueryAnswer(
@@ -587,6 +887,88 @@ def answer_question(question: str, dataframe: pd.DataFrame, roles: ColumnRoles)
     )
 
 
+@dataclass(frozen=True)
+class BatchAnswers:
+    """Answers to a pack of questions, in question order, and the seconds spent on all of them."""
+
+    answers: tuple[QueryAnswer | None, ...]
+    seconds: float
+    distinct_plans: int
+    group_passes: int
+
+
+@traced
+def answer_questions(
+    questions: Sequence[str],
+    dataframe: pd.DataFrame,
+    roles: ColumnRoles,
+    index: QuestionIndex | None = None,
+    executor: QueryExecutor | None = None,
+) -> BatchAnswers:
+    """Answer many questions at once; each answer equals what ``answer_question`` returns.
+
+    Questions are parsed against one index and identical plans run once.
+    Plans with the same filters share one filtered frame, and the ranks and
+    breakdowns among them share one group-by per segment column.
+    """
+    started = time.perf_counter()
+    if index is None:
+        index = build_question_index(dataframe, roles)
+    if executor is None:
+        executor = QueryExecutor(dataframe, roles)
+    plans = [parse_question(question, dataframe, roles, index) for question in questions]
+
+    scopes: dict[tuple[object, ...], list[QueryPlan]] = {}
+    for plan in dict.fromkeys(plan for plan in plans if plan is not None):
+        scopes.setdefault((plan.filters, plan.year, plan.month), []).append(plan)
+
+    results: dict[QueryPlan, QueryAnswer | None] = {}
+    group_passes = 0
+    for scoped in scopes.values():
+        runnable = []
+        for plan in scoped:
+            try:
+                _check_columns(plan, dataframe)
+                runnable.append(plan)
+            except ValueError:
+                results[plan] = None
+        if not runnable:
+            continue
+        columns = [
+            column for plan in runnable for column in (plan.measure, plan.dimension, plan.count_column)
+        ]
+        try:
+            working, applied = executor.filtered(runnable[0], columns)
+        except ValueError:
+            results.update(dict.fromkeys(runnable))
+            continue
+
+        segmented: dict[str, list[QueryPlan]] = {}
+        for plan in runnable:
+            if plan.intent in ("rank", "breakdown") and plan.dimension and len(working):
+                segmented.setdefault(plan.dimension, []).append(plan)
+        groups = {column: _group_passes(working, column, members) for column, members in segmented.items()}
+        group_passes += len(groups)
+
+        for plan in runnable:
+            shared = groups.get(plan.dimension) if plan.intent in ("rank", "breakdown") else None
+            try:
+                results[plan] = _execute_scoped(plan, working, applied, roles, shared)
+            except ValueError:
+                results[plan] = None
+
+    answers = tuple(
+        None if plan is None or results[plan] is None else replace(results[plan], question=question)
+        for question, plan in zip(questions, plans, strict=True)
+    )
+    return BatchAnswers(
+        answers=answers,
+        seconds=time.perf_counter() - started,
+        distinct_plans=len(results),
+        group_passes=group_passes,
+    )
+
+
 def suggested_questions(dataframe: pd.DataFrame, roles: ColumnRoles) -> list[str]:
     """Offer starter questions that the deterministic engine can definitely answer."""
     suggestions: list[str] = []
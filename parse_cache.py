@@ -0,0 +1,182 @@
+"""Content-addressed, size-bounded disk cache for parsed and cleaned uploads.
+
+An entry is keyed by the SHA-256 of the upload bytes together with the reader
+options, so a re-upload of the same file, or another replica sharing the cache
+directory, skips parsing and cleaning. The cleaned frame is stored as Feather
+(Arrow IPC) beside a JSON record of its cleaning audit. Entries are evicted
+least-recently-used once the directory outgrows its byte budget.
+
+The cache persists uploaded data, so it is off unless an operator sets
+``ADA_PARSE_CACHE_DIR``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import warnings
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import pandas as pd
+
+from analysis import CleaningReport
+from business_insights import PeriodTotals
+from file_io import CsvDialect, arrow_text
+
+# Bumped whenever reading or cleaning changes what an entry holds, so older entries miss.
+CACHE_FORMAT = 8
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CachedParse:
+    dataframe: pd.DataFrame
+    cleaning_report: CleaningReport
+    truncated_rows: int
+    csv_dialect: CsvDialect | None = None
+    period_totals: dict[str, PeriodTotals] = field(default_factory=dict)
+
+
+def cache_key(
+    contents: bytes,
+    filename: str,
+    *,
+    sheet_name: str | None,
+    row_limit: int,
+    columns: Sequence[str] | None = None,
+    arrow_dtypes: bool = False,
+    memory_budget: int | None = None,
+    sampling: str = "head",
+) -> str:
+    """Digest of the upload bytes plus every option that changes the parsed result."""
+    options = json.dumps(
+        {
+            "format": CACHE_FORMAT,
+            "content": hashlib.sha256(contents).hexdigest(),
+            "suffix": Path(filename).suffix.lower(),
+            "sheet": sheet_name,
+            "rows": row_limit,
+            "columns": list(columns) if columns is not None else None,
+            "arrow": arrow_dtypes,
+            "memory": memory_budget,
+            "sampling": sampling,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(options.encode()).hexdigest()
+
+
+def _write_atomically(path: Path, write: Callable[[str], object]) -> None:
+    handle, temporary = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    os.close(handle)
+    try:
+        write(temporary)
+        os.replace(temporary, path)
+    except BaseException:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+
+
+@dataclass(frozen=True)
+class ParseCache:
+    directory: Path
+    max_bytes: int = DEFAULT_MAX_BYTES
+
+    @classmethod
+    def from_environment(cls) -> ParseCache | None:
+        """The operator-configured cache, or None when persistence is not enabled."""
+        directory = os.getenv("ADA_PARSE_CACHE_DIR", "").strip()
+        if not directory:
+            return None
+        max_megabytes = os.getenv("ADA_PARSE_CACHE_MAX_MB", "").strip()
+        if not max_megabytes:
+            return cls(Path(directory))
+        try:
+            megabytes = int(max_megabytes)
+        except ValueError:
+            megabytes = 0
+        if megabytes <= 0:
+            # A budget of zero or less would evict every entry on each store.
+            warnings.warn(
+                f"Ignoring ADA_PARSE_CACHE_MAX_MB={max_megabytes!r}: expected a whole number above 0; "
+                f"using {DEFAULT_MAX_BYTES // (1024 * 1024)}.",
+                stacklevel=2,
+            )
+            return cls(Path(directory))
+        return cls(Path(directory), megabytes * 1024 * 1024)
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.directory / f"{key}.feather", self.directory / f"{key}.json"
+
+    def load(self, key: str, *, arrow_dtypes: bool = False) -> CachedParse | None:
+        """The entry under ``key``, or None on a miss; an unreadable entry is dropped."""
+        frame_path, record_path = self._paths(key)
+        try:
+            record = json.loads(record_path.read_text())
+            dataframe = pd.read_feather(frame_path)
+            if arrow_dtypes:
+                arrow_text(dataframe)
+            entry = CachedParse(
+                dataframe=dataframe,
+                cleaning_report=CleaningReport.from_dict(record["cleaning_report"]),
+                truncated_rows=int(record["truncated_rows"]),
+                csv_dialect=CsvDialect(**record["csv_dialect"]) if record.get("csv_dialect") else None,
+                period_totals={
+                    date: PeriodTotals.from_dict(values)
+                    for date, values in record.get("period_totals", {}).items()
+                },
+            )
+            os.utime(frame_path)
+            os.utime(record_path)
+        except (FileNotFoundError, ImportError):
+            return None
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            # A truncated or older-schema entry would fail the same way on every upload.
+            for path in (frame_path, record_path):
+                path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def store(self, key: str, entry: CachedParse) -> bool:
+        """Persist an entry; False when the frame has no columnar representation."""
+        frame_path, record_path = self._paths(key)
+        record = {
+            "cleaning_report": entry.cleaning_report.to_dict(),
+            "truncated_rows": entry.truncated_rows,
+            "csv_dialect": asdict(entry.csv_dialect) if entry.csv_dialect else None,
+            "period_totals": {date: totals.to_dict() for date, totals in entry.period_totals.items()},
+        }
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            _write_atomically(frame_path, entry.dataframe.to_feather)
+            _write_atomically(record_path, lambda path: Path(path).write_text(json.dumps(record)))
+        except (OSError, ValueError, TypeError, ImportError):
+            # Mixed-type object columns cannot be written to Arrow; the entry is simply skipped.
+            frame_path.unlink(missing_ok=True)
+            return False
+        self.evict()
+        return True
+
+    def evict(self) -> None:
+        """Drop least-recently-used entries until the directory fits its byte budget."""
+        entries: list[tuple[float, int, str]] = []
+        for frame_path in self.directory.glob("*.feather"):
+            record_path = frame_path.with_suffix(".json")
+            try:
+                size = frame_path.stat().st_size + (
+                    record_path.stat().st_size if record_path.exists() else 0
+                )
+                entries.append((frame_path.stat().st_mtime, size, frame_path.stem))
+            except OSError:
+                continue
+        total = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            for path in self._paths(key):
+                path.unlink(missing_ok=True)
+            total -= size
@@ -2,12 +2,40 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import secrets
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass, field, replace
+from typing import Any
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
 
-from analysis import CleaningReport, clean_dataframe
-from business_insights import BusinessBrief, ColumnRoles, analyze_business, detect_roles
+from analysis import (
+    CleaningReport,
+    ColumnStats,
+    clean_dataframe,
+    conform_types,
+    frame_stats,
+    ranked_counts,
+)
+from business_insights import (
+    BusinessBrief,
+    ColumnRoles,
+    PeriodTotals,
+    aggregate_cube,
+    analyze_business,
+    combine_period_totals,
+    detect_roles,
+    period_start,
+    period_totals,
+    preferred_frequency,
+    text_values,
+)
+from file_io import CsvDialect, TabularStream, read_tabular_data, stream_tabular_data
+from parse_cache import CachedParse, ParseCache, cache_key
+from tracing import StageRecord
 
 
 @dataclass(frozen=True)
@@ -16,22 +44,481 @@ class PreparedAnalysis:
     cleaning_report: CleaningReport
     detected_roles: ColumnRoles
     truncated_rows: int
+    csv_dialect: CsvDialect | None = None
+    column_stats: dict[str, ColumnStats] = field(default_factory=dict)
+    period_totals: dict[str, PeriodTotals] = field(default_factory=dict)
+    # Names this prepared dataset for in-process caches; it survives pickling, so
+    # Streamlit's cached copies of one upload share it.
+    version: str = field(default_factory=lambda: secrets.token_hex(8))
 
     def analyze(self, roles: ColumnRoles | None = None) -> BusinessBrief:
-        return analyze_business(self.dataframe, roles or self.detected_roles)
+        roles = roles or self.detected_roles
+        totals = self.period_totals.get(roles.date) if roles.date else None
+        cube = aggregate_cube(self.dataframe, roles, version=self.version)
+        return analyze_business(self.dataframe, roles, self.column_stats or None, totals, cube)
 
 
-def prepare_analysis(raw_dataframe: pd.DataFrame, *, row_limit: int) -> PreparedAnalysis:
-    """Bound work, clean data, and detect its likely business schema."""
-    original_rows = len(raw_dataframe)
-    bounded = raw_dataframe.head(row_limit).copy() if original_rows > row_limit else raw_dataframe
-    dataframe, cleaning_report = clean_dataframe(bounded)
+SAMPLING_MODES = ("head", "uniform", "periods")
+SAMPLE_SEED = 0
+# Rows cleaned at a time while drawing a sample from a frame already in memory.
+SAMPLE_CHUNK_ROWS = 50_000
+_NO_DAY = np.iinfo(np.int64).min
+
+
+class _UniformSample:
+    """A seeded uniform sample of a stream of rows: the ``size`` rows with the smallest random keys.
+
+    Rows whose key cannot beat the current sample are dropped on arrival, and
+    the held rows are cut back whenever they pass twice ``size``, so memory
+    stays bounded however long the stream runs. Rows keep their stream order.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._rng = np.random.default_rng(SAMPLE_SEED)
+        self._frames: list[pd.DataFrame] = []
+        self._keys: list[np.ndarray] = []
+        self._held = 0
+        self._threshold = np.inf
+
+    def add(self, frame: pd.DataFrame) -> None:
+        keys = self._rng.random(len(frame))
+        kept = keys < self._threshold
+        self._frames.append(frame if kept.all() else frame.loc[kept])
+        self._keys.append(keys[kept])
+        self._held += int(kept.sum())
+        if self._held > 2 * self.size:
+            self._compact()
+
+    def _compact(self) -> None:
+        frame, keys = pd.concat(self._frames), np.concatenate(self._keys)
+        if len(keys) > self.size:
+            positions = np.sort(np.argpartition(keys, self.size - 1)[: self.size])
+            frame, keys = frame.iloc[positions], keys[positions]
+            self._threshold = keys.max()
+        self._frames, self._keys, self._held = [frame], [keys], len(keys)
+
+    def rows(self) -> pd.DataFrame:
+        self._compact()
+        return self._frames[0]
+
+
+class _RecentDays:
+    """Every row of the most recent days whose rows, counted together, fit in ``size``.
+
+    Counts only grow as rows arrive, so a day that no longer fits never will
+    again and its rows are dropped at once. Any whole periods that fit are
+    made of such days, so they can be chosen once the stream has ended.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._frames: list[pd.DataFrame] = []
+        self._days: list[np.ndarray] = []
+        self._cutoff = _NO_DAY + 1
+
+    def add(self, frame: pd.DataFrame, days: np.ndarray) -> None:
+        kept = days >= self._cutoff
+        self._frames.append(frame.loc[kept])
+        self._days.append(days[kept])
+        values, counts = np.unique(np.concatenate(self._days), return_counts=True)
+        fits = np.cumsum(counts[::-1]) <= self.size
+        cutoff = values[::-1][fits][-1] if fits.any() else values[-1] + 1 if len(values) else self._cutoff
+        if cutoff > self._cutoff:
+            self._cutoff = cutoff
+            recent = [held >= cutoff for held in self._days]
+            self._frames = [frame.loc[mask] for frame, mask in zip(self._frames, recent, strict=True)]
+            self._days = [held[mask] for held, mask in zip(self._days, recent, strict=True)]
+
+    def rows(self) -> pd.DataFrame:
+        return pd.concat(self._frames)
+
+
+def _day_numbers(dates: pd.Series) -> np.ndarray:
+    """Wall-clock day of each date, counted from 1970-01-01; ``_NO_DAY`` where there is none."""
+    if not is_datetime64_any_dtype(dates):
+        return np.full(len(dates), _NO_DAY)
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        dates = dates.dt.tz_localize(None)
+    # NaT is the smallest int64, so missing dates land on _NO_DAY.
+    return dates.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]").view(np.int64)
+
+
+def _recent_periods(totals: PeriodTotals, row_limit: int) -> tuple[str, pd.Index] | None:
+    """The most recent whole trend periods (or, if even one is too large, days) that fit."""
+    days = pd.Series(totals.rows.index)
+    span = pd.Series([totals.first, totals.last])
+    for grain in (preferred_frequency(span), "D"):
+        counts = totals.rows.groupby(period_start(days, grain).to_numpy()).sum().sort_index(ascending=False)
+        kept = counts.index[counts.cumsum() <= row_limit]
+        if len(kept):
+            return grain, kept
+    return None
+
+
+def _merged_columns(order: list[str], columns: Sequence[str]) -> list[str]:
+    """Extend a column order with a chunk's columns, each new one placed after its predecessor."""
+    merged = list(order)
+    previous = -1
+    for column in columns:
+        if column in merged:
+            previous = merged.index(column)
+        else:
+            previous += 1
+            merged.insert(previous, column)
+    return merged
+
+
+def _seen_before(seen: np.ndarray, fingerprints: np.ndarray) -> np.ndarray:
+    if not len(seen):
+        return np.zeros(len(fingerprints), dtype=bool)
+    positions = np.searchsorted(seen, fingerprints).clip(max=len(seen) - 1)
+    return seen[positions] == fingerprints
+
+
+def _combined_report(
+    reports: list[CleaningReport],
+    final: CleaningReport,
+    *,
+    raw_rows: int,
+    blank_rows: int,
+    repeated_rows: int,
+    final_rows: int,
+) -> CleaningReport:
+    """One audit for a source cleaned chunk by chunk and a sample cleaned once more."""
+    first = reports[0]
+    decisions = {decision.column: decision for decision in first.type_decisions}
+    decisions.update(
+        (decision.column, decision)
+        for decision in final.type_decisions
+        if decision.decision in ("numeric", "datetime")
+    )
+    seconds: dict[str, float] = {}
+    for report in (*reports, final):
+        for column, spent in report.column_seconds:
+            seconds[column] = seconds.get(column, 0.0) + spent
+    index_columns = max(report.index_columns_removed for report in reports) + final.index_columns_removed
+    return replace(
+        final,
+        original_rows=raw_rows,
+        original_columns=first.original_columns,
+        final_rows=final_rows,
+        duplicate_rows_removed=sum(report.duplicate_rows_removed for report in reports)
+        + repeated_rows
+        + final.duplicate_rows_removed,
+        empty_rows_removed=sum(report.empty_rows_removed for report in reports)
+        + blank_rows
+        + final.empty_rows_removed,
+        empty_columns_removed=max(first.original_columns - index_columns - final.final_columns, 0),
+        index_columns_removed=index_columns,
+        trimmed_text_columns=first.trimmed_text_columns,
+        numeric_columns_inferred=sum(decision.decision == "numeric" for decision in decisions.values()),
+        datetime_columns_inferred=sum(decision.decision == "datetime" for decision in decisions.values()),
+        type_decisions=tuple(decisions.values()),
+        column_seconds=tuple(seconds.items()),
+    )
+
+
+def _clean_sample(
+    chunks: Iterable[pd.DataFrame],
+    *,
+    row_limit: int,
+    sampling: str,
+    infer_types: bool,
+    executor: Executor | None,
+    downcast: bool,
+    sketch_rows: int | None,
+) -> tuple[pd.DataFrame, CleaningReport, int, dict[str, PeriodTotals]]:
+    """Clean a stream of row chunks into a ``row_limit`` sample and exact daily totals of every row.
+
+    The first chunk with data decides every column's type; later chunks are
+    cleaned without inference and converted to those types, so a stretch of
+    stray text cannot drop a chunk out of the totals. Each chunk then adds its
+    totals; a row repeating one from an earlier chunk (by 64-bit row hash) is
+    a duplicate. Only the
+    sample, one chunk, and one hash per distinct row are held at a time. The
+    sample is cleaned once more, so categories and integer downcasts see all
+    of it. Returns the sample, its audit, how many cleaned rows it left out,
+    and the totals (empty when it left out none).
+    """
+    uniform = _UniformSample(row_limit)
+    recent = _RecentDays(row_limit) if sampling == "periods" else None
+    date: str | None = None
+    reports: list[CleaningReport] = []
+    parts: list[dict[str, PeriodTotals]] = []
+    order: list[str] = []
+    kinds: dict[str, str] = {}
+    seen = np.empty(0, dtype=np.uint64)
+    raw_rows = blank_rows = repeated_rows = 0
+    for chunk in chunks:
+        raw_rows += len(chunk)
+        try:
+            cleaned, report = clean_dataframe(
+                chunk, infer_types=infer_types and not reports, executor=executor, encode_categories=False
+            )
+        except ValueError:
+            # Nothing but blank rows in this chunk; later ones may still hold data.
+            blank_rows += len(chunk)
+            continue
+        conform_types(cleaned, kinds)
+        fingerprints = pd.util.hash_pandas_object(cleaned, index=False).to_numpy()
+        repeated = _seen_before(seen, fingerprints)
+        if repeated.any():
+            repeated_rows += int(repeated.sum())
+            cleaned = cleaned.loc[~repeated].reset_index(drop=True)
+            fingerprints = fingerprints[~repeated]
+        fresh = np.unique(fingerprints)
+        seen = np.insert(seen, np.searchsorted(seen, fresh), fresh)
+
+        if recent is not None and not reports:
+            date = detect_roles(cleaned, frame_stats(cleaned, sketch_rows=sketch_rows)).date
+        reports.append(report)
+        parts.append(period_totals(cleaned))
+        order = _merged_columns(order, cleaned.columns)
+        uniform.add(cleaned)
+        if recent is not None and date in cleaned.columns:
+            recent.add(cleaned, _day_numbers(cleaned[date]))
+    if not reports:
+        raise ValueError("No analyzable data remained after removing empty rows and columns.")
+
+    cleaned_rows = sum(report.final_rows for report in reports) - repeated_rows
+    totals = combine_period_totals(parts) if cleaned_rows > row_limit else {}
+    sample = uniform.rows()
+    chosen = _recent_periods(totals[date], row_limit) if recent is not None and date in totals else None
+    if recent is not None and chosen is not None:
+        grain, kept = chosen
+        rows = recent.rows()
+        sample = rows.loc[period_start(rows[date], grain).isin(kept).to_numpy()]
+    sample = sample.reindex(columns=order).reset_index(drop=True)
+    dataframe, final = clean_dataframe(
+        sample, infer_types=infer_types, executor=executor, downcast=downcast, memory_audit=downcast
+    )
+    final_rows = cleaned_rows - (len(sample) - len(dataframe))
+    report = _combined_report(
+        reports,
+        final,
+        raw_rows=raw_rows,
+        blank_rows=blank_rows,
+        repeated_rows=repeated_rows,
+        final_rows=final_rows,
+    )
+    return dataframe, report, final_rows - len(dataframe), totals
+
+
+def _prepared(
+    dataframe: pd.DataFrame,
+    cleaning_report: CleaningReport,
+    truncated_rows: int,
+    totals: dict[str, PeriodTotals],
+    *,
+    memory_budget: int | None,
+    sketch_rows: int | None,
+) -> PreparedAnalysis:
+    """Fit the cleaned frame into ``memory_budget``, then profile it and detect its roles."""
+    frame_bytes, removed = cleaning_report.bytes_after, 0
+    while memory_budget is not None and frame_bytes > memory_budget:
+        # Categories cost the same however many rows use them, so a cut can still miss; measure again.
+        fitting_rows = len(dataframe) * memory_budget // frame_bytes
+        if fitting_rows == 0:
+            raise ValueError("Not even one row of this file fits in the memory available for an analysis.")
+        removed += len(dataframe) - fitting_rows
+        dataframe = dataframe.head(fitting_rows).copy()
+        after = dataframe.memory_usage(index=False, deep=cleaning_report.memory_audited)
+        frame_bytes = int(after.sum())
+    if removed:
+        # The audit describes the frame that is analyzed, not the one that did not fit.
+        truncated_rows += removed
+        cleaning_report = replace(
+            cleaning_report,
+            final_rows=cleaning_report.final_rows - removed,
+            memory_budget_rows_removed=removed,
+            column_memory=tuple(
+                replace(entry, bytes_after=int(after.get(entry.column, 0)))
+                for entry in cleaning_report.column_memory
+            ),
+        )
+    stats = frame_stats(dataframe, sketch_rows=sketch_rows)
     return PreparedAnalysis(
         dataframe=dataframe,
         cleaning_report=cleaning_report,
-        detected_roles=detect_roles(dataframe),
-        truncated_rows=max(original_rows - row_limit, 0),
+        detected_roles=detect_roles(dataframe, stats),
+        truncated_rows=truncated_rows,
+        column_stats=stats,
+        period_totals=totals,
+    )
+
+
+def prepare_analysis(
+    raw_dataframe: pd.DataFrame,
+    *,
+    row_limit: int,
+    source_rows: int | None = None,
+    infer_types: bool = True,
+    executor: Executor | None = None,
+    memory_budget: int | None = None,
+    sketch_rows: int | None = None,
+    sampling: str = "head",
+) -> PreparedAnalysis:
+    """Bound work, clean data, and detect its likely business schema.
+
+    ``source_rows`` is the row count of a file that was already read with a row
+    limit, so the truncation can still be reported. An ``executor`` spreads
+    column cleaning across its workers. With a ``memory_budget`` in bytes,
+    integer columns are downcast, the memory audit counts every byte, and, if the
+    cleaned frame still does not fit, the leading share of rows that fits is kept
+    and the rest counted as truncated.
+    Numeric columns longer than ``sketch_rows`` get sketched column statistics.
+
+    ``sampling`` chooses which rows a frame over ``row_limit`` keeps: the first
+    ones (``head``), a uniform sample, or the most recent whole periods. The
+    sampled modes clean the frame a chunk at a time and keep exact daily
+    totals of every row, so trends, growth and anomalies do not depend on the
+    sample.
+    """
+    if sampling not in SAMPLING_MODES:
+        raise ValueError(f"Unknown sampling mode {sampling!r}; choose one of {', '.join(SAMPLING_MODES)}.")
+    original_rows = max(len(raw_dataframe), source_rows or 0)
+    downcast = memory_budget is not None
+    if sampling != "head" and len(raw_dataframe) > row_limit:
+        chunks = (
+            raw_dataframe.iloc[start : start + SAMPLE_CHUNK_ROWS]
+            for start in range(0, len(raw_dataframe), SAMPLE_CHUNK_ROWS)
+        )
+        dataframe, cleaning_report, left_out, totals = _clean_sample(
+            chunks,
+            row_limit=row_limit,
+            sampling=sampling,
+            infer_types=infer_types,
+            executor=executor,
+            downcast=downcast,
+            sketch_rows=sketch_rows,
+        )
+        truncated_rows = original_rows - len(raw_dataframe) + left_out
+    else:
+        bounded = raw_dataframe.head(row_limit).copy() if original_rows > row_limit else raw_dataframe
+        dataframe, cleaning_report = clean_dataframe(
+            bounded, infer_types=infer_types, executor=executor, downcast=downcast, memory_audit=downcast
+        )
+        truncated_rows, totals = max(original_rows - row_limit, 0), {}
+    return _prepared(
+        dataframe,
+        cleaning_report,
+        truncated_rows,
+        totals,
+        memory_budget=memory_budget,
+        sketch_rows=sketch_rows,
+    )
+
+
+def _stream_upload(
+    contents: bytes,
+    filename: str,
+    sheet_name: str | None,
+    columns: Sequence[str] | None,
+    arrow_dtypes: bool,
+    encoding: str | None = None,
+    **options: Any,
+) -> tuple[TabularStream, tuple[pd.DataFrame, CleaningReport, int, dict[str, PeriodTotals]]]:
+    stream = stream_tabular_data(
+        contents, filename, sheet_name, columns=columns, arrow_dtypes=arrow_dtypes, encoding=encoding
     )
+    return stream, _clean_sample(stream.chunks, infer_types=not stream.typed, **options)
+
+
+def prepare_upload(
+    contents: bytes,
+    filename: str,
+    *,
+    row_limit: int,
+    sheet_name: str | None = None,
+    columns: Sequence[str] | None = None,
+    cache: ParseCache | None = None,
+    arrow_dtypes: bool = False,
+    executor: Executor | None = None,
+    memory_budget: int | None = None,
+    sketch_rows: int | None = None,
+    sampling: str = "head",
+) -> PreparedAnalysis:
+    """Read an upload with the row limit and column projection pushed into the parser.
+
+    With a ``cache``, an upload seen before skips parsing and cleaning entirely.
+    ``arrow_dtypes`` keeps text in Arrow-backed columns from the parser onward.
+    A sampling mode other than ``head`` streams every row through cleaning a
+    chunk at a time, so the sample and the exact period totals see the whole
+    file while memory holds only the sample and one chunk.
+    """
+    if sampling not in SAMPLING_MODES:
+        raise ValueError(f"Unknown sampling mode {sampling!r}; choose one of {', '.join(SAMPLING_MODES)}.")
+    key = None
+    if cache is not None:
+        key = cache_key(
+            contents,
+            filename,
+            sheet_name=sheet_name,
+            row_limit=row_limit,
+            columns=columns,
+            arrow_dtypes=arrow_dtypes,
+            memory_budget=memory_budget,
+            sampling=sampling,
+        )
+        cached = cache.load(key, arrow_dtypes=arrow_dtypes)
+        if cached is not None:
+            stats = frame_stats(cached.dataframe, sketch_rows=sketch_rows)
+            return PreparedAnalysis(
+                dataframe=cached.dataframe,
+                cleaning_report=cached.cleaning_report,
+                detected_roles=detect_roles(cached.dataframe, stats),
+                truncated_rows=cached.truncated_rows,
+                csv_dialect=cached.csv_dialect,
+                column_stats=stats,
+                period_totals=cached.period_totals,
+            )
+
+    if sampling == "head":
+        uploaded = read_tabular_data(
+            contents, filename, sheet_name, row_limit=row_limit, columns=columns, arrow_dtypes=arrow_dtypes
+        )
+        prepared = prepare_analysis(
+            uploaded.dataframe,
+            row_limit=row_limit,
+            source_rows=uploaded.source_rows,
+            infer_types=not uploaded.typed,
+            executor=executor,
+            memory_budget=memory_budget,
+            sketch_rows=sketch_rows,
+        )
+        dialect = uploaded.dialect
+    else:
+        options = {
+            "row_limit": row_limit,
+            "sampling": sampling,
+            "executor": executor,
+            "downcast": memory_budget is not None,
+            "sketch_rows": sketch_rows,
+        }
+        try:
+            stream, sampled = _stream_upload(contents, filename, sheet_name, columns, arrow_dtypes, **options)
+        except UnicodeDecodeError:
+            # The sample looked like UTF-8 but a later byte did not; Latin-1 decodes anything.
+            stream, sampled = _stream_upload(
+                contents, filename, sheet_name, columns, arrow_dtypes, "latin-1", **options
+            )
+        prepared = _prepared(*sampled, memory_budget=memory_budget, sketch_rows=sketch_rows)
+        dialect = stream.dialect
+    if dialect is not None:
+        prepared = replace(prepared, csv_dialect=dialect)
+    if cache is not None and key is not None:
+        cache.store(
+            key,
+            CachedParse(
+                dataframe=prepared.dataframe,
+                cleaning_report=prepared.cleaning_report,
+                truncated_rows=prepared.truncated_rows,
+                csv_dialect=prepared.csv_dialect,
+                period_totals=prepared.period_totals,
+            ),
+        )
+    return prepared
 
 
 def apply_role_selection(
@@ -55,7 +542,7 @@ def focus_options(dataframe: pd.DataFrame, roles: ColumnRoles, limit: int = 40)
     """Values of the active segment, most common first, for drill-down."""
     if not roles.dimension or roles.dimension not in dataframe.columns:
         return []
-    counts = dataframe[roles.dimension].value_counts(dropna=True)
+    counts = ranked_counts(dataframe[roles.dimension])
     return [str(value) for value in counts.head(limit).index]
 
 
@@ -67,7 +554,7 @@ def apply_focus(
     """Drill into one segment value and regroup by the next useful dimension."""
     if not focus or not roles.dimension:
         return dataframe, roles
-    filtered = dataframe[dataframe[roles.dimension].astype(str) == focus]
+    filtered = dataframe[text_values(dataframe[roles.dimension]) == focus]
     if filtered.empty:
         return dataframe, roles
     replacement = next(
@@ -100,11 +587,70 @@ def cleaning_audit_frame(report: CleaningReport) -> pd.DataFrame:
             ["Duplicate rows removed", report.duplicate_rows_removed],
             ["Numeric columns inferred", report.numeric_columns_inferred],
             ["Datetime columns inferred", report.datetime_columns_inferred],
+            ["Columns encoded as categories", report.categorical_columns_encoded],
+            ["Integer columns downcast", report.integer_columns_downcast],
+            ["Rows left out to fit the memory budget", report.memory_budget_rows_removed],
         ],
         columns=["Operation", "Count"],
     )
 
 
+def memory_audit_frame(report: CleaningReport) -> pd.DataFrame:
+    """Each column's memory before and after cleaning, largest saving first."""
+    rows = sorted(report.column_memory, key=lambda entry: entry.bytes_after - entry.bytes_before)
+    return pd.DataFrame(
+        [
+            [
+                entry.column,
+                entry.bytes_before,
+                entry.bytes_after,
+                round((1 - entry.bytes_after / entry.bytes_before) * 100, 1) if entry.bytes_before else 0.0,
+            ]
+            for entry in rows
+        ],
+        columns=["Column", "Bytes before", "Bytes after", "Saved %"],
+    )
+
+
+def trace_frame(records: Sequence[StageRecord]) -> pd.DataFrame:
+    """One row per traced stage in start order, nested stages marked by depth."""
+    return pd.DataFrame(
+        [
+            [
+                "· " * record.depth + record.name,
+                round(record.wall_seconds * 1000, 1),
+                round(record.cpu_seconds * 1000, 1),
+                None if record.peak_bytes is None else round(record.peak_bytes / 1024 / 1024, 1),
+            ]
+            for record in records
+        ],
+        columns=["Stage", "Wall ms", "CPU ms", "Peak MB"],
+    )
+
+
+def type_inference_frame(report: CleaningReport) -> pd.DataFrame:
+    """Which text columns became dates or numbers, judged from how large a sample."""
+    return pd.DataFrame(
+        [[decision.column, decision.sample_rows, decision.decision] for decision in report.type_decisions],
+        columns=["Column", "Sample rows", "Decision"],
+    )
+
+
+def parse_audit_frame(dialect: CsvDialect) -> pd.DataFrame:
+    """The encoding, delimiter, quoting and header choices made when reading a CSV."""
+    delimiters = {",": "Comma", ";": "Semicolon", "\t": "Tab", "|": "Pipe"}
+    return pd.DataFrame(
+        [
+            ["Encoding", "UTF-8" if dialect.encoding.startswith("utf-8") else "Latin-1"],
+            ["Delimiter", delimiters.get(dialect.delimiter, dialect.delimiter)],
+            ["Quote character", dialect.quotechar],
+            ["Preamble lines skipped", str(dialect.skip_rows)],
+            ["Header row", "Yes" if dialect.has_header else "No, columns numbered"],
+        ],
+        columns=["Setting", "Detected"],
+    )
+
+
 def schema_frame(roles: ColumnRoles) -> pd.DataFrame:
     return pd.DataFrame(
         [
@@ -1,9 +1,21 @@
 import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import mock
 
 import numpy as np
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
 
-from analysis import build_markdown_report, clean_dataframe, column_profile, generate_insights
+from analysis import (
+    FINGERPRINT_PRIME,
+    TypeDecision,
+    build_markdown_report,
+    clean_dataframe,
+    column_profile,
+    column_stats,
+    generate_insights,
+    ranked_counts,
+)
 
 
 class CleanDataframeTests(unittest.TestCase):
@@ -29,6 +41,178 @@ class CleanDataframeTests(unittest.TestCase):
         self.assertEqual(report.index_columns_removed, 1)
         self.assertEqual(report.empty_columns_removed, 1)
 
+    def test_fingerprint_deduplication_matches_pandas_even_when_hashes_collide(self):
+        raw = pd.DataFrame(
+            {
+                "Amount": [0.0, -0.0, np.nan, np.nan, 1.0, 1.0, 2.0],
+                "Region": pd.Series([None, None, np.nan, pd.NA, "x", "x", "x"], dtype=object),
+                "Units": [1, 1, 2, 2, 3, 3, 4],
+            }
+        )
+        expected = raw.drop_duplicates().reset_index(drop=True)
+
+        for prime in (FINGERPRINT_PRIME, np.uint64(0)):
+            with mock.patch("analysis.FINGERPRINT_PRIME", prime):
+                cleaned, report = clean_dataframe(raw, infer_types=False, encode_categories=False)
+
+            pd.testing.assert_frame_equal(cleaned, expected)
+            self.assertEqual(report.duplicate_rows_removed, len(raw) - len(expected))
+
+    def test_repetitive_text_columns_become_categories(self):
+        rows = 40
+        raw = pd.DataFrame(
+            {
+                "Region": ["West", "East", None, "East"] * (rows // 4),
+                "Customer": [f"C{index}" for index in range(rows)],
+                "Mixed": ["a", 1] * (rows // 2),
+                "Revenue": range(rows),
+            }
+        )
+
+        cleaned, report = clean_dataframe(raw)
+
+        self.assertEqual(report.categorical_columns_encoded, 1)
+        self.assertEqual(cleaned["Region"].cat.categories.tolist(), ["East", "West"])
+        self.assertEqual(
+            cleaned["Region"].astype(object).fillna("-").tolist(), raw["Region"].fillna("-").tolist()
+        )
+        self.assertEqual(cleaned["Customer"].dtype, object)
+        self.assertEqual(cleaned["Mixed"].dtype, object)
+
+    def test_ranked_counts_match_text_ranking_and_skip_unused_categories(self):
+        text = pd.Series(["zeta", "alpha", "zeta", "alpha", "mid"], name="Segment")
+        categorical = text.astype("category")
+
+        self.assertEqual(ranked_counts(categorical).to_dict(), ranked_counts(text).to_dict())
+        self.assertEqual(ranked_counts(categorical).index.tolist(), ["zeta", "alpha", "mid"])
+        filtered = categorical[categorical != "mid"]
+        self.assertEqual(ranked_counts(filtered, normalize=True).to_dict(), {"zeta": 0.5, "alpha": 0.5})
+
+    def test_typed_sources_skip_inference(self):
+        raw = pd.DataFrame({"Order Date": ["2024-01-01", "2024-01-02"], "Code": [" 10 ", "20"]})
+
+        cleaned, report = clean_dataframe(raw, infer_types=False)
+
+        self.assertEqual(cleaned["Order Date"].tolist(), ["2024-01-01", "2024-01-02"])
+        self.assertEqual(cleaned["Code"].tolist(), ["10", "20"])
+        self.assertEqual(report.numeric_columns_inferred + report.datetime_columns_inferred, 0)
+
+    def test_vectorized_trim_matches_str_strip_cell_for_cell(self):
+        values = [" West\u3000", "East\x1c", None, np.nan, "", " both ", "kept"]
+        mixed = [" a ", 7, b" raw ", None]
+        raw = pd.DataFrame(
+            {
+                "Region": pd.Series(values, dtype=object),
+                "Mixed": pd.Series(mixed + [None] * 3, dtype=object),
+                "Revenue": range(7),
+            }
+        )
+
+        cleaned, report = clean_dataframe(raw)
+
+        expected = [value.strip() or pd.NA if isinstance(value, str) else value for value in values]
+        self.assertEqual(cleaned["Region"].head(2).tolist(), ["West", "East"])
+        self.assertEqual(
+            [type(value) for value in cleaned["Region"]], [type(value) for value in expected]
+        )
+        self.assertEqual(cleaned["Mixed"].head(4).tolist(), ["a", 7, b" raw ", None])
+        self.assertEqual([column for column, _ in report.column_seconds], ["Region", "Mixed"])
+        self.assertTrue(all(seconds >= 0 for _, seconds in report.column_seconds))
+
+    def test_inference_confirms_on_a_sample_before_converting_whole_columns(self):
+        rows = 5_000
+        raw = pd.DataFrame(
+            {
+                "Region": [f"Region {index % 7}" for index in range(rows)],
+                "Amount": [str(index) if index % 12 else "n/a" for index in range(rows)],
+                "Created": [f"2024-01-{index % 28 + 1:02d}" for index in range(rows)],
+            }
+        )
+
+        with (
+            mock.patch("analysis.pd.to_numeric", wraps=pd.to_numeric) as to_numeric,
+            mock.patch("analysis.guess_datetime_format", wraps=guess_datetime_format) as guess,
+        ):
+            cleaned, report = clean_dataframe(raw)
+
+        converted = sorted(len(call.args[0]) for call in to_numeric.call_args_list)
+        self.assertEqual(converted, [1_000, 1_000, rows])
+        self.assertEqual(guess.call_count, 1)
+        self.assertEqual(
+            report.type_decisions,
+            (
+                TypeDecision("Region", 1_000, "text"),
+                TypeDecision("Amount", 1_000, "text after full check"),
+                TypeDecision("Created", 1_000, "datetime"),
+            ),
+        )
+        self.assertEqual(cleaned["Amount"].dtype, object)
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(cleaned["Created"]))
+
+    def test_pooled_cleaning_merges_deterministically(self):
+        raw = pd.DataFrame(
+            {
+                f"{kind} {index}": values
+                for index in range(4)
+                for kind, values in (
+                    ("Region", [" West", "East ", "South", "West"]),
+                    ("Amount", ["1", " 2", "3", "4"]),
+                    ("Order Date", ["2024-01-01", "2024-01-02", "bad", "2024-01-04"]),
+                )
+            }
+        )
+        sequential, sequential_report = clean_dataframe(raw)
+
+        for pool in (ThreadPoolExecutor(max_workers=4), ProcessPoolExecutor(max_workers=2)):
+            with pool:
+                pooled, pooled_report = clean_dataframe(raw, executor=pool)
+
+            pd.testing.assert_frame_equal(pooled, sequential)
+            self.assertEqual(pooled_report, sequential_report)
+            self.assertEqual(
+                [column for column, _ in pooled_report.column_seconds],
+                [column for column, _ in sequential_report.column_seconds],
+            )
+
+    def test_downcasting_shrinks_integers_exactly_and_reports_memory(self):
+        raw = pd.DataFrame(
+            {
+                "Units": [1, 2, 120, 4],
+                "Big": [1, 2, 3, 2**40],
+                "Price": [1.5, 2.25, 3.0, 4.0],
+                "Empty": [None, None, None, None],
+            }
+        )
+
+        cleaned, report = clean_dataframe(raw, downcast=True, memory_audit=True)
+
+        self.assertEqual(cleaned["Units"].dtype, "int8")
+        self.assertEqual(cleaned["Big"].dtype, "int64")
+        self.assertEqual(cleaned["Price"].dtype, "float64")
+        self.assertEqual(cleaned["Units"].sum(), 127)
+        self.assertEqual(report.integer_columns_downcast, 1)
+        memory = {entry.column: entry for entry in report.column_memory}
+        self.assertEqual((memory["Units"].bytes_before, memory["Units"].bytes_after), (32, 4))
+        self.assertEqual(memory["Empty"].bytes_after, 0)
+        self.assertEqual(report.bytes_after, int(cleaned.memory_usage(index=False, deep=True).sum()))
+        self.assertEqual(clean_dataframe(raw)[0]["Units"].dtype, "int64")
+        self.assertFalse(clean_dataframe(raw)[1].memory_audited)
+
+    def test_column_stats_match_pandas(self):
+        numbers = pd.Series([5.0, 1.0, None, 3.0, 3.0, 0.0, -0.0, 250.0, 3.0, 1.0], name="Amount")
+        text = pd.Series(["b", "a", None, "b", "c"], name="Tier")
+
+        stats = column_stats(numbers)
+        counted = column_stats(text)
+
+        self.assertEqual((stats.null_count, stats.distinct), (1, numbers.nunique()))
+        self.assertEqual(stats.quartiles, tuple(numbers.quantile([0.25, 0.5, 0.75])))
+        self.assertEqual((stats.minimum, stats.maximum, stats.example), (0.0, 250.0, 5.0))
+        self.assertEqual(stats.outliers, 1)
+        self.assertEqual(stats.top_values[:2], ((3.0, 3), (0.0, 2)))
+        self.assertEqual(counted.top_values, (("b", 2), ("a", 1), ("c", 1)))
+        self.assertEqual((counted.non_null, counted.distinct, counted.unique_ratio), (4, 3, 0.75))
+
     def test_empty_input_is_rejected(self):
         with self.assertRaises(ValueError):
             clean_dataframe(pd.DataFrame())
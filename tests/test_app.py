@@ -1,4 +1,7 @@
+import os
+import tracemalloc
 import unittest
+from unittest import mock
 
 from streamlit.testing.v1 import AppTest
 
@@ -13,7 +16,33 @@ class AppSmokeTests(unittest.TestCase):
             ["Executive brief", "Ask ADA", "Live dashboard", "Evidence ledger", "Data room"],
         )
         self.assertEqual(len(app.get("plotly_chart")), 6)
-        self.assertEqual(len(app.dataframe), 4)
+        self.assertEqual(len(app.dataframe), 5)
+
+    def test_malformed_settings_warn_and_fall_back(self):
+        settings = {
+            "ADA_CLEANING_WORKERS": "two",
+            "ADA_MEMORY_BUDGET_MB": "-1",
+            "ADA_SKETCH_ROWS": "1e5",
+            "ADA_SAMPLING": "random",
+        }
+        with mock.patch.dict(os.environ, settings), self.assertWarns(UserWarning) as caught:
+            app = AppTest.from_file("app.py", default_timeout=45).run()
+
+        self.assertFalse(app.exception)
+        self.assertEqual(len(app.tabs), 5)
+        messages = " ".join(str(warning.message) for warning in caught.warnings)
+        self.assertIn("ADA_CLEANING_WORKERS='two'", messages)
+        self.assertIn("ADA_SAMPLING='random'", messages)
+
+    def test_trace_shows_stages_in_the_data_room_when_enabled(self):
+        self.addCleanup(tracemalloc.stop)
+        with mock.patch.dict(os.environ, {"ADA_TRACE": "1"}):
+            app = AppTest.from_file("app.py", default_timeout=45).run()
+
+        self.assertFalse(app.exception)
+        self.assertEqual(len(app.dataframe), 6)
+        stages = {record.name for record in app.session_state["ada_trace"].latest()}
+        self.assertLessEqual({"analyze_business", "render_dashboard"}, stages)
 
     def test_drill_down_focuses_the_whole_analysis(self):
         app = AppTest.from_file("app.py", default_timeout=45).run()
@@ -44,6 +73,28 @@ class AppSmokeTests(unittest.TestCase):
         self.assertEqual(len(history), 1)
         self.assertIsNone(history[0]["result"])
 
+    def test_ask_ada_does_not_reuse_answers_across_same_shaped_uploads(self):
+        def upload(scale):
+            rows = "\n".join(
+                f"2024-{month:02d}-01,{region},{month * scale}"
+                for month in range(1, 13)
+                for region in ("North", "South", "East")
+            )
+            return ("sales.csv", f"Date,Region,Revenue\n{rows}\n".encode(), "text/csv")
+
+        app = AppTest.from_file("app.py", default_timeout=45).run()
+        app.segmented_control[0].set_value("Upload your file").run()
+        answers = []
+        for scale in (1, 1000):
+            app.file_uploader[0].set_value(upload(scale)).run()
+            app.chat_input[0].set_value("total revenue").run()
+            self.assertFalse(app.exception)
+            history = app.session_state["chat_history"]
+            self.assertEqual(len(history), 1)
+            answers.append(history[0]["result"].answer)
+
+        self.assertNotEqual(answers[0], answers[1])
+
     def test_upload_mode_waits_for_a_file(self):
         app = AppTest.from_file("app.py", default_timeout=45).run()
         app.segmented_control[0].set_value("Upload your file").run()
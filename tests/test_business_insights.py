@@ -1,18 +1,27 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
+import numpy as np
 import pandas as pd
 
+import business_insights
+from analysis import frame_stats
 from business_insights import (
+    aggregate_cube,
     analyze_business,
     build_business_report,
     detect_roles,
     driver_frame,
     format_number,
     heatmap_frame,
+    period_start,
+    period_totals,
     segment_frame,
     trend_frame,
 )
 from demo_data import make_demo_data
+from tracing import Trace, activate
 
 
 class RoleDetectionTests(unittest.TestCase):
@@ -58,6 +67,88 @@ class BusinessAnalysisTests(unittest.TestCase):
         self.assertTrue(brief.recommendations)
         self.assertTrue(brief.headline)
 
+    def test_threaded_evidence_matches_the_sequential_brief_and_is_traced(self):
+        sequential = analyze_business(self.dataframe, self.roles)
+        trace = Trace(memory=False)
+        trace.new_run()
+        activate(trace)
+        self.addCleanup(activate, None)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            threaded = analyze_business(self.dataframe, self.roles, executor=pool)
+
+        self.assertEqual(repr(threaded), repr(sequential))
+        stages = trace.latest()
+        builders = {record.name: record.depth for record in stages if record.name.endswith("_evidence")}
+        self.assertEqual(
+            set(builders),
+            {
+                f"{name}_evidence"
+                for name in ("growth", "driver", "segment", "anomaly", "relationship", "outlier", "quality")
+            },
+        )
+        self.assertEqual(set(builders.values()), {1})
+
+    def test_sketched_statistics_keep_roles_and_disclose_their_error(self):
+        stats = frame_stats(self.dataframe, sketch_rows=100)
+
+        brief = analyze_business(self.dataframe, detect_roles(self.dataframe, stats), stats)
+        outliers = next(item for item in brief.evidence if item.kind == "outliers")
+
+        self.assertEqual(detect_roles(self.dataframe, stats), self.roles)
+        self.assertIn("KLL sketch, within ±1.65% of rank", outliers.calculation)
+        self.assertEqual(stats["Revenue"].top_values, ())
+        self.assertAlmostEqual(
+            stats["Revenue"].distinct,
+            self.dataframe["Revenue"].nunique(),
+            delta=3 * stats["Revenue"].distinct_error * self.dataframe["Revenue"].nunique(),
+        )
+
+    def test_trend_from_exact_daily_totals_matches_the_rows(self):
+        totals = period_totals(self.dataframe)["Order Date"]
+
+        for frequency in (None, "W", "Q"):
+            expected = trend_frame(self.dataframe, self.roles, frequency)
+            from_totals = trend_frame(self.dataframe.head(10), self.roles, frequency, totals=totals)
+            pd.testing.assert_frame_equal(from_totals, expected, check_exact=False)
+
+    def test_shared_cube_serves_the_brief_and_charts_without_regrouping(self):
+        expected = [
+            repr(analyze_business(self.dataframe, self.roles)),
+            trend_frame(self.dataframe, self.roles),
+            segment_frame(self.dataframe, self.roles),
+            driver_frame(self.dataframe, self.roles),
+            heatmap_frame(self.dataframe, self.roles),
+        ]
+        cube = aggregate_cube(self.dataframe, self.roles)
+
+        with mock.patch.object(business_insights, "aggregate_cube", wraps=aggregate_cube) as rebuilt:
+            shared = [
+                repr(analyze_business(self.dataframe, self.roles, cube=cube)),
+                trend_frame(self.dataframe, self.roles, cube=cube),
+                segment_frame(self.dataframe, self.roles, cube=cube),
+                driver_frame(self.dataframe, self.roles, cube=cube),
+                heatmap_frame(self.dataframe, self.roles, cube=cube),
+            ]
+
+        self.assertEqual(rebuilt.call_count, 0)
+        self.assertEqual(shared[0], expected[0])
+        for actual, frame in zip(shared[1:], expected[1:], strict=True):
+            pd.testing.assert_frame_equal(actual, frame)
+
+    def test_heatmap_grain_follows_the_top_segments_span(self):
+        days = pd.date_range("2023-01-01", periods=700, freq="D")
+        rows = [(days[i % 90], f"Big{i % 8}", 100.0) for i in range(800)]
+        rows += [(days[i * 7], "Small", 1.0) for i in range(100)]
+        frame = pd.DataFrame(rows, columns=["Order Date", "Region", "Revenue"])
+        roles = detect_roles(frame)
+        cube = aggregate_cube(frame, roles)
+
+        heat = heatmap_frame(frame, roles, cube=cube)
+
+        self.assertEqual(cube.grain, "M")
+        self.assertEqual(len(heat), 8)
+        self.assertEqual(heat.columns[1] - heat.columns[0], pd.Timedelta(weeks=1))
+
     def test_trend_and_segment_frames_are_chart_ready(self):
         trend = trend_frame(self.dataframe, self.roles)
         segments = segment_frame(self.dataframe, self.roles)
@@ -130,5 +221,42 @@ class BusinessAnalysisTests(unittest.TestCase):
         self.assertEqual(format_number(12_000, "Units"), "12.0K")
 
 
+class PeriodStartTests(unittest.TestCase):
+    def setUp(self):
+        nanoseconds = np.random.default_rng(4).integers(-(2**61), 2**61, 5_000)
+        self.dates = pd.Series(pd.to_datetime(nanoseconds), name="Order Date")
+        self.dates[::37] = pd.NaT
+
+    def test_matches_to_period_for_every_grain_unit_and_time_zone(self):
+        dense = pd.Series(pd.date_range("1968-11-03 07:00", periods=5_000, freq="5h"), name="Order Date")
+        dense[::11] = pd.NaT
+        variants = (
+            self.dates,
+            dense,
+            self.dates.astype("datetime64[s]"),
+            self.dates.dt.tz_localize("UTC").dt.tz_convert("America/New_York"),
+        )
+        for dates in variants:
+            for grain in ("D", "W", "M", "Q", "Y"):
+                with self.subTest(dtype=str(dates.dtype), grain=grain):
+                    expected = dates.dt.tz_localize(None) if dates.dt.tz else dates
+                    expected = expected.dt.to_period(grain).dt.to_timestamp()
+                    pd.testing.assert_series_equal(period_start(dates, grain), expected)
+
+    def test_versioned_keys_are_derived_once_and_read_only(self):
+        with mock.patch.object(
+            business_insights, "_period_starts", wraps=business_insights._period_starts
+        ) as derived:
+            first = period_start(self.dates, "M", version="v1")
+            again = period_start(self.dates, "M", version="v1")
+            period_start(self.dates, "M")
+            period_start(self.dates, "M", version="v2")
+
+        self.assertEqual(derived.call_count, 3)
+        self.assertTrue(np.shares_memory(first.to_numpy(), again.to_numpy()))
+        with self.assertRaises(ValueError):
+            again.to_numpy()[0] = np.datetime64("2020-01-01")
+
+
 if __name__ == "__main__":
     unittest.main()
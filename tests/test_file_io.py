@@ -1,11 +1,24 @@
 from __future__ import annotations
 
+import gzip
 import unittest
+import zipfile
 from io import BytesIO
+from unittest import mock
 
 import pandas as pd
+import zstandard
+from openpyxl import Workbook
 
-from file_io import list_excel_sheets, read_tabular_file
+from file_io import (
+    CsvDialect,
+    detect_encoding,
+    iter_csv_chunks,
+    list_excel_sheets,
+    read_tabular_data,
+    read_tabular_file,
+    stream_tabular_data,
+)
 
 
 class FileParsingTests(unittest.TestCase):
@@ -21,6 +34,105 @@ class FileParsingTests(unittest.TestCase):
         self.assertEqual(result.columns.tolist(), ["Region", "Revenue"])
         self.assertEqual(len(result), 2)
 
+    def test_sniffs_the_dialect_once_and_parses_with_the_c_engine(self) -> None:
+        contents = b"Sales export\nGenerated 2025\n\nRegion\tNote\tRevenue\nWest\t'a\tb'\t1\nEast\tc\t2\n"
+
+        with mock.patch("file_io.pd.read_csv", wraps=pd.read_csv) as read_csv:
+            result = read_tabular_data(contents, "sales.csv")
+
+        self.assertEqual(read_csv.call_count, 1)
+        self.assertEqual(read_csv.call_args.kwargs["engine"], "c")
+        self.assertEqual(result.dialect, CsvDialect("utf-8-sig", "\t", "'", 3, True))
+        self.assertEqual(result.dataframe.columns.tolist(), ["Region", "Note", "Revenue"])
+        self.assertEqual(result.dataframe["Note"].tolist(), ["a\tb", "c"])
+
+    def test_numeric_first_row_is_read_as_data(self) -> None:
+        result = read_tabular_data(b"1,2\n3,4\n", "values.csv")
+
+        self.assertFalse(result.dialect.has_header)
+        self.assertEqual(len(result.dataframe), 2)
+
+    def test_trailing_delimiters_do_not_read_as_a_preamble(self) -> None:
+        result = read_tabular_data(b"a,b\n1,2,\n3,4,\n", "values.csv")
+
+        self.assertEqual(result.dialect.skip_rows, 0)
+        self.assertEqual(result.dataframe.columns.tolist(), ["a", "b"])
+        self.assertEqual(result.dataframe["a"].tolist(), [1, 3])
+
+    def test_ragged_rows_keep_the_first_record_as_header(self) -> None:
+        result = read_tabular_data(b"Region,Revenue,Notes\nWest,1,\nEast,2,x,y", "sales.csv")
+
+        self.assertEqual(result.dataframe.columns.tolist(), ["Region", "Revenue", "Notes"])
+        self.assertEqual(result.dataframe["Region"].tolist(), ["West", "East"])
+
+    def test_year_labels_are_read_as_a_header(self) -> None:
+        result = read_tabular_data(b"2023,2024\n100,120\n130,140\n", "pivot.csv")
+
+        self.assertTrue(result.dialect.has_header)
+        self.assertEqual(result.dataframe.columns.tolist(), ["2023", "2024"])
+        self.assertEqual(len(result.dataframe), 2)
+
+    def test_streams_bounded_chunks_up_to_the_row_limit(self) -> None:
+        contents = b"Region,Revenue\n" + b"".join(f"R{index},{index}\n".encode() for index in range(10))
+
+        with mock.patch("file_io.CSV_CHUNK_ROWS", 3):
+            chunks = list(iter_csv_chunks(contents, row_limit=7))
+            result = read_tabular_data(contents, "sales.csv", row_limit=7)
+
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 1])
+        self.assertEqual(len(result.dataframe), 7)
+        self.assertEqual(result.source_rows, 10)
+        self.assertEqual(result.dataframe["Revenue"].tolist(), list(range(7)))
+
+    def test_pushes_column_projection_into_the_csv_parser(self) -> None:
+        contents = b"Region,Notes,Revenue\nWest,a,1\nEast,b,2\nSouth,c,3\n"
+
+        result = read_tabular_data(contents, "sales.csv", row_limit=2, columns=["Region", "Revenue"])
+
+        self.assertEqual(result.dataframe.columns.tolist(), ["Region", "Revenue"])
+        self.assertEqual(len(result.dataframe), 2)
+        self.assertEqual(result.source_rows, 3)
+
+    def test_chunked_read_keeps_whole_file_column_types(self) -> None:
+        contents = b"Zip,Revenue\n02134,10\n02139,20\nSW1A,30\n"
+
+        with (
+            mock.patch("file_io.CSV_CHUNK_ROWS", 2),
+            mock.patch("file_io.pd.read_csv", wraps=pd.read_csv) as read_csv,
+        ):
+            result = read_tabular_file(contents, "sales.csv")
+
+        self.assertEqual(result["Zip"].tolist(), ["02134", "02139", "SW1A"])
+        self.assertEqual(result["Revenue"].tolist(), [10, 20, 30])
+        # Only the column that changed type between chunks is parsed a second time.
+        self.assertEqual(read_csv.call_args.kwargs["usecols"], ["Zip"])
+
+    def test_chunked_read_keeps_text_in_renamed_and_projected_columns(self) -> None:
+        contents = b"Zip,Notes,Zip,Revenue\n1,a,02134,10\n2,b,02139,20\n3,c,SW1A,30\n"
+
+        with mock.patch("file_io.CSV_CHUNK_ROWS", 2):
+            result = read_tabular_file(contents, "sales.csv", columns=["Zip", "Zip.1", "Revenue"])
+
+        self.assertEqual(result.columns.tolist(), ["Zip", "Zip.1", "Revenue"])
+        self.assertEqual(result["Zip"].tolist(), [1, 2, 3])
+        self.assertEqual(result["Zip.1"].tolist(), ["02134", "02139", "SW1A"])
+
+    def test_detects_encoding_from_a_sample(self) -> None:
+        self.assertEqual(detect_encoding("Région,1\n".encode()), "utf-8-sig")
+        self.assertEqual(detect_encoding("Région,1\n".encode("latin-1")), "latin-1")
+
+        result = read_tabular_file("Region,Revenue\nRégion,1\n".encode("latin-1"), "sales.csv")
+
+        self.assertEqual(result.loc[0, "Region"], "Région")
+
+    def test_recovers_from_non_utf8_bytes_past_the_sample(self) -> None:
+        contents = b"Region,Revenue\nWest,1\n" + "Zürich,2\n".encode("latin-1")
+
+        with mock.patch("file_io.CSV_SAMPLE_BYTES", 8):
+            result = read_tabular_file(contents, "sales.csv")
+
+        self.assertEqual(result["Region"].tolist(), ["West", "Zürich"])
+
     def test_reads_first_excel_worksheet(self) -> None:
         output = BytesIO()
         source = pd.DataFrame({"Product": ["Core", "Plus"], "Revenue": [800, 1200]})
@@ -57,12 +169,190 @@ class FileParsingTests(unittest.TestCase):
         self.assertEqual(chosen.columns.tolist(), ["Team", "Tickets"])
         self.assertEqual(default.columns.tolist(), ["Region", "Revenue"])
 
+    def test_bounds_excel_rows_and_reports_the_sheet_size(self) -> None:
+        output = BytesIO()
+        source = pd.DataFrame({"Product": ["Core"] * 6, "Revenue": range(6), "Notes": ["x"] * 6})
+        with pd.ExcelWriter(output, engine="openpyxl") as writer:
+            source.to_excel(writer, index=False)
+
+        result = read_tabular_data(
+            output.getvalue(), "business.xlsx", row_limit=4, columns=["Product", "Revenue"]
+        )
+
+        pd.testing.assert_frame_equal(result.dataframe, source[["Product", "Revenue"]].head(4))
+        self.assertEqual(result.source_rows, 6)
+
+    def _rewritten(self, contents: bytes, rewrite) -> bytes:
+        output = BytesIO()
+        with zipfile.ZipFile(BytesIO(contents)) as source, zipfile.ZipFile(output, "w") as target:
+            for info in source.infolist():
+                name, data = rewrite(info.filename, source.read(info))
+                target.writestr(name, data)
+        return output.getvalue()
+
+    def test_counts_excel_rows_when_the_sheet_dimension_is_missing_or_stale(self) -> None:
+        output = BytesIO()
+        pd.DataFrame({"Product": ["Core"] * 6, "Revenue": range(6)}).to_excel(output, index=False)
+        for dimension in (b"", b'<dimension ref="A1:B2"/>'):
+            with self.subTest(dimension=dimension):
+                workbook = self._rewritten(
+                    output.getvalue(),
+                    lambda name, data, dimension=dimension: (
+                        name,
+                        data.replace(b'<dimension ref="A1:B7" />', dimension)
+                        if name.endswith("sheet1.xml")
+                        else data,
+                    ),
+                )
+
+                result = read_tabular_data(workbook, "business.xlsx", row_limit=4)
+
+                self.assertEqual(len(result.dataframe), 4)
+                self.assertEqual(result.source_rows, 6)
+
+    def test_lists_worksheets_of_a_workbook_at_the_package_root(self) -> None:
+        moved = {"xl/workbook.xml": "workbook.xml", "xl/_rels/workbook.xml.rels": "_rels/workbook.xml.rels"}
+        workbook = self._rewritten(
+            self._multi_sheet_workbook(),
+            lambda name, data: (
+                moved.get(name, name),
+                data.replace(b"xl/workbook.xml", b"workbook.xml") if name == "_rels/.rels" else data,
+            ),
+        )
+
+        self.assertEqual(list_excel_sheets(workbook, "book.xlsx"), ["Sales", "Operations"])
+
+    def test_streamed_worksheet_matches_pandas_parsing(self) -> None:
+        workbook = Workbook()
+        sheet = workbook.active
+        for row in (
+            ["Name", "Zip", "Amount", None, "Amount", "Paid"],
+            ["Acme", "02134", 1, None, 5, True],
+            [None] * 6,
+            ["Globex", "123", 2, None, 6.5, None],
+            ["Initech", None, 3, None, None, False, "extra"],
+            [None] * 3,
+        ):
+            sheet.append(row)
+        output = BytesIO()
+        workbook.save(output)
+
+        result = read_tabular_file(output.getvalue(), "book.xlsx")
+        expected = pd.read_excel(BytesIO(output.getvalue()))
+
+        pd.testing.assert_frame_equal(result.drop(columns="Zip"), expected.drop(columns="Zip"))
+        # Text cells stay text; pandas would coerce them to floats and drop the leading zero.
+        self.assertEqual(result["Zip"].dropna().tolist(), ["02134", "123"])
+
+    def test_unknown_worksheet_is_rejected(self) -> None:
+        with self.assertRaisesRegex(ValueError, "Worksheet named 'Missing' not found"):
+            read_tabular_file(self._multi_sheet_workbook(), "book.xlsx", sheet_name="Missing")
+
     def test_corrupt_workbook_raises_a_friendly_error(self) -> None:
         with self.assertRaisesRegex(ValueError, "not a valid Excel workbook"):
             list_excel_sheets(b"definitely not a zip", "book.xlsx")
         with self.assertRaisesRegex(ValueError, "not a valid Excel workbook"):
             read_tabular_file(b"definitely not a zip", "book.xlsx")
 
+    def test_reads_parquet_and_feather_with_projection_and_limit(self) -> None:
+        source = pd.DataFrame(
+            {
+                "Order Date": pd.to_datetime(["2025-01-01", "2025-01-02", "2025-01-03"]),
+                "Region": ["West", "East", "South"],
+                "Revenue": [10.5, 20.0, 30.25],
+            }
+        )
+        for suffix, write in ((".parquet", source.to_parquet), (".feather", source.to_feather)):
+            output = BytesIO()
+            write(output)
+
+            result = read_tabular_data(
+                output.getvalue(), f"orders{suffix}", row_limit=2, columns=["Order Date", "Revenue"]
+            )
+
+            self.assertTrue(result.typed)
+            self.assertEqual(result.source_rows, 3)
+            pd.testing.assert_frame_equal(result.dataframe, source[["Order Date", "Revenue"]].head(2))
+
+    def test_stored_index_becomes_a_column(self) -> None:
+        output = BytesIO()
+        pd.DataFrame({"Revenue": [1, 2]}, index=pd.Index(["West", "East"], name="Region")).to_parquet(output)
+
+        result = read_tabular_file(output.getvalue(), "orders.parquet")
+
+        self.assertEqual(result.columns.tolist(), ["Region", "Revenue"])
+
+    def test_arrow_dtypes_apply_to_every_reader(self) -> None:
+        source = pd.DataFrame({"Region": ["West", None], "Revenue": [1, 2]})
+        parquet, workbook = BytesIO(), BytesIO()
+        source.to_parquet(parquet)
+        source.to_excel(workbook, index=False)
+        uploads = {
+            "sales.csv": source.to_csv(index=False).encode(),
+            "sales.parquet": parquet.getvalue(),
+            "sales.xlsx": workbook.getvalue(),
+        }
+
+        for filename, contents in uploads.items():
+            result = read_tabular_file(contents, filename, arrow_dtypes=True)
+
+            self.assertIsInstance(result["Region"].dtype, pd.StringDtype, filename)
+            self.assertTrue(pd.isna(result.loc[1, "Region"]), filename)
+            self.assertEqual(result["Revenue"].dtype.kind, "i", filename)
+            # The dtype is chosen per reader; no process-wide pandas option is switched on.
+            self.assertFalse(pd.get_option("future.infer_string"))
+
+    def test_reads_compressed_csv_as_a_stream(self) -> None:
+        contents = b"Region;Revenue\nWest;1200\nEast;900\n"
+        archive = BytesIO()
+        with zipfile.ZipFile(archive, "w") as writer:
+            writer.writestr("sales.csv", contents)
+
+        uploads = (
+            (gzip.compress(contents), "sales.CSV.GZ"),
+            (zstandard.ZstdCompressor().compress(contents), "sales.csv.zst"),
+            (archive.getvalue(), "sales.zip"),
+        )
+        for payload, filename in uploads:
+            result = read_tabular_data(payload, filename)
+
+            self.assertFalse(result.typed)
+            self.assertEqual(result.dataframe.columns.tolist(), ["Region", "Revenue"])
+            self.assertEqual(result.dataframe["Revenue"].sum(), 2100)
+
+    def test_compressed_csv_is_capped_once_decompressed(self) -> None:
+        contents = b"Region,Revenue\n" + b"West,1200\n" * 200_000
+        uploads = (
+            (gzip.compress(contents), "sales.csv.gz"),
+            (zstandard.ZstdCompressor().compress(contents), "sales.csv.zst"),
+        )
+        with mock.patch("file_io.MAX_DECOMPRESSED_BYTES", 1024 * 1024):
+            for payload, filename in uploads:
+                with self.subTest(filename):
+                    with self.assertRaisesRegex(ValueError, "more than 1 MB when decompressed"):
+                        read_tabular_data(payload, filename, row_limit=10)
+                    with self.assertRaisesRegex(ValueError, "when decompressed"):
+                        list(stream_tabular_data(payload, filename).chunks)
+
+            self.assertEqual(read_tabular_data(contents, "sales.csv").source_rows, 200_000)
+
+    def test_zip_with_several_files_is_rejected(self) -> None:
+        archive = BytesIO()
+        with zipfile.ZipFile(archive, "w") as writer:
+            writer.writestr("sales.csv", "Region,Revenue\nWest,1\n")
+            writer.writestr("notes.txt", "not a table")
+
+        with self.assertRaisesRegex(ValueError, "exactly one CSV file"):
+            read_tabular_file(archive.getvalue(), "sales.zip")
+
+    def test_corrupt_columnar_and_compressed_files_raise_friendly_errors(self) -> None:
+        with self.assertRaisesRegex(ValueError, "not a valid Parquet file"):
+            read_tabular_file(b"not parquet", "orders.parquet")
+        with self.assertRaisesRegex(ValueError, "not a valid Feather file"):
+            read_tabular_file(b"not feather", "orders.feather")
+        with self.assertRaisesRegex(ValueError, "could not be parsed as CSV"):
+            read_tabular_file(b"not gzip", "orders.csv.gz")
+
     def test_rejects_empty_and_unsupported_files(self) -> None:
         with self.assertRaisesRegex(ValueError, "empty"):
             read_tabular_file(b"", "sales.csv")
@@ -1,18 +1,47 @@
+import functools
+import threading
 import unittest
+from dataclasses import replace
+from unittest import mock
 
+import numpy as np
+import pandas as pd
+
+import nlq
 from business_insights import detect_roles
 from demo_data import make_demo_data
-from nlq import QueryPlan, answer_question, execute_plan, parse_question, suggested_questions
-from pipeline import prepare_analysis
+from nlq import (
+    AnswerCache,
+    QueryExecutor,
+    QueryPlan,
+    ValueFilter,
+    answer_question,
+    answer_questions,
+    build_question_index,
+    execute_plan,
+    parse_question,
+    suggested_questions,
+)
+from pipeline import PreparedAnalysis, prepare_analysis
+
+
+@functools.cache
+def prepared_demo() -> PreparedAnalysis:
+    return prepare_analysis(make_demo_data(rows=900), row_limit=900)
 
 
-class NLQParsingTests(unittest.TestCase):
+class DemoDataTestCase(unittest.TestCase):
+    """Every test class here reads the same 900 prepared demo rows, prepared once."""
+
     @classmethod
     def setUpClass(cls):
-        prepared = prepare_analysis(make_demo_data(rows=900), row_limit=900)
+        prepared = prepared_demo()
         cls.dataframe = prepared.dataframe
         cls.roles = prepared.detected_roles
 
+
+class NLQParsingTests(DemoDataTestCase):
+
     def ask(self, question: str):
         result = answer_question(question, self.dataframe, self.roles)
         self.assertIsNotNone(result, f"engine could not answer: {question}")
@@ -114,6 +143,187 @@ class NLQParsingTests(unittest.TestCase):
         plan = parse_question("monthly revenue trend", frame, roles)
         self.assertNotEqual(plan.intent if plan else None, "trend")
 
+    def test_prebuilt_index_gives_the_same_plans(self):
+        index = build_question_index(self.dataframe, self.roles)
+        questions = [
+            "top 3 products by revenue in march 2024",
+            "how many customers per region",
+            "which region declined the most?",
+            "bottom 12 products by average profit",
+            "weekly units",
+            "revenues across channels",
+        ]
+
+        with mock.patch.object(nlq, "build_question_index") as rebuild:
+            indexed = [parse_question(question, self.dataframe, self.roles, index) for question in questions]
+
+        rebuild.assert_not_called()
+        rebuilt = [parse_question(question, self.dataframe, self.roles) for question in questions]
+        self.assertEqual(indexed, rebuilt)
+
+    def test_wide_schema_matches_longest_column_and_values(self):
+        columns = {f"Metric {number} Amount": [float(row) for row in range(40)] for number in range(300)}
+        columns["Metric 12 Amount Net"] = [float(row % 7) for row in range(40)]
+        columns["Store"] = ["North Hub", "South Hub", "East Hub", "West Hub"] * 10
+        frame = pd.DataFrame(columns)
+        roles = detect_roles(frame)
+        index = build_question_index(frame, roles)
+
+        plan = parse_question("total metric 12 amount net for north hub", frame, roles, index)
+
+        self.assertEqual(plan.measure, "Metric 12 Amount Net")
+        self.assertEqual([(item.column, item.values) for item in plan.filters], [("Store", ("North Hub",))])
+        self.assertEqual(parse_question("top 1234 stores", frame, roles, index).top_n, 1)
+
+    def test_high_cardinality_text_columns_become_filters(self):
+        rows = 20_000
+        frame = pd.DataFrame(
+            {
+                "Customer": [f"Client {row % 5_000:04d}" for row in range(rows)],
+                "Reference": [str(2_000 + row % 5_000) for row in range(rows)],
+                "Region": ["North", "South"] * (rows // 2),
+                "Revenue": [float(row % 97) for row in range(rows)],
+            }
+        )
+        roles = detect_roles(frame)
+        index = build_question_index(frame, roles)
+
+        result = answer_question("total revenue for client 0042 in north", frame, roles, index)
+        plan = parse_question("revenue in 2024", frame, roles, index)
+
+        self.assertNotIn("Customer", roles.dimensions)
+        self.assertEqual(
+            [(item.column, item.values) for item in result.plan.filters],
+            [("Region", ("North",)), ("Customer", ("Client 0042",))],
+        )
+        self.assertIn("4 rows", result.answer)
+        self.assertEqual((plan.filters, plan.year), ((), 2024))
+
+
+class QueryExecutorTests(DemoDataTestCase):
+    def test_shared_executor_matches_fresh_execution_and_reuses_masks(self):
+        executor = QueryExecutor(self.dataframe, self.roles)
+        questions = [
+            "total revenue in south",
+            "top 2 products by revenue in march 2024 for partner",
+            "how many orders in south in 2024",
+            "which channel grew fastest in south",
+        ]
+
+        for question in questions:
+            plan = parse_question(question, self.dataframe, self.roles)
+            shared = execute_plan(plan, self.dataframe, self.roles, executor)
+            fresh = execute_plan(plan, self.dataframe, self.roles)
+            self.assertEqual((shared.answer, shared.calculation), (fresh.answer, fresh.calculation), question)
+
+        south = ValueFilter(column="Region", values=("South",))
+        self.assertIs(executor.mask(south), executor.mask(south))
+        self.assertFalse(executor.mask(south).flags.writeable)
+
+    def test_date_parts_follow_wall_clock_time_and_skip_missing_dates(self):
+        utc = pd.Series(pd.to_datetime(["2024-01-01 03:30", None, "2024-01-01 06:30", "1969-12-15 12:00"]))
+        dates = utc.dt.tz_localize("UTC").dt.tz_convert("America/New_York")
+        frame = pd.DataFrame({"Order Date": dates, "Revenue": [1.0, 2.0, 4.0, 8.0]})
+        executor = QueryExecutor(frame, detect_roles(frame))
+
+        for part in ("year", "month"):
+            expected = getattr(dates.dt, part)
+            for number in expected.dropna().unique():
+                mask = executor.mask((part, int(number)))
+                self.assertEqual(mask.tolist(), (expected == number).tolist(), (part, number))
+
+    def test_date_parts_are_published_together_under_concurrent_use(self):
+        executor = QueryExecutor(self.dataframe, self.roles)
+        where = np.where
+        calls = []
+        answers = []
+
+        def interleaved(*arguments):
+            calls.append(threading.current_thread())
+            main_calls = [thread for thread in calls if thread is threading.main_thread()]
+            if threading.current_thread() is threading.main_thread() and len(main_calls) == 2:
+                # Between the year and month parts, another session asks for a month.
+                other = threading.Thread(target=lambda: answers.append(executor.mask(("month", 3))))
+                other.start()
+                other.join()
+            return where(*arguments)
+
+        with mock.patch.object(np, "where", side_effect=interleaved):
+            year = executor.mask(("year", 2024))
+
+        months = self.dataframe[self.roles.date].dt.month
+        self.assertEqual(len(answers), 1)
+        self.assertEqual(answers[0].tolist(), (months == 3).tolist())
+        self.assertEqual(year.tolist(), (self.dataframe[self.roles.date].dt.year == 2024).tolist())
+
+    def test_mask_cache_is_bounded(self):
+        executor = QueryExecutor(self.dataframe, self.roles)
+        regions = self.dataframe["Region"].unique()
+
+        with mock.patch.object(nlq, "MASK_CACHE_ENTRIES", 2):
+            for region in regions:
+                executor.mask(ValueFilter(column="Region", values=(str(region),)))
+
+        self.assertEqual(len(executor._masks), 2)
+
+
+class AnswerCacheTests(DemoDataTestCase):
+    def test_repeated_plans_are_served_from_the_cache(self):
+        cache = AnswerCache()
+
+        def ask(question, fingerprint):
+            return answer_question(question, self.dataframe, self.roles, cache=cache, fingerprint=fingerprint)
+
+        with mock.patch.object(nlq, "execute_plan", wraps=nlq.execute_plan) as executed:
+            first = ask("Total revenue", "v1")
+            again = ask("total REVENUE?", "v1")
+            other = ask("Total revenue", "v2")
+
+        self.assertEqual(executed.call_count, 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self.assertEqual(again.answer, first.answer)
+        self.assertEqual(again.question, "total REVENUE?")
+        self.assertEqual(other.answer, first.answer)
+
+    def test_roles_are_part_of_the_key_and_old_answers_are_evicted(self):
+        cache = AnswerCache(max_entries=2)
+        revenue = parse_question("total revenue", self.dataframe, self.roles)
+        profit = parse_question("total profit", self.dataframe, self.roles)
+        dated, undated = self.roles, replace(self.roles, date=None)
+
+        for plan, roles in ((revenue, dated), (revenue, undated), (profit, dated), (revenue, dated)):
+            cache.execute("v1", plan, self.dataframe, roles)
+
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 4, 2))
+
+
+class BatchAnswerTests(DemoDataTestCase):
+    def test_batch_matches_one_by_one_and_shares_work(self):
+        questions = [
+            "top 2 products by revenue in south",
+            "average profit by product in south",
+            "how many orders in south",
+            "Top 2 products by revenue in South",
+            "monthly revenue trend",
+            "which region grew fastest?",
+            "what is the meaning of life",
+        ]
+
+        batch = answer_questions(questions, self.dataframe, self.roles)
+
+        for question, batched in zip(questions, batch.answers, strict=True):
+            single = answer_question(question, self.dataframe, self.roles)
+            if single is None:
+                self.assertIsNone(batched)
+                continue
+            self.assertEqual(batched.question, question)
+            self.assertEqual((batched.answer, batched.calculation), (single.answer, single.calculation))
+            if single.table is not None:
+                pd.testing.assert_frame_equal(batched.table, single.table)
+        self.assertEqual(batch.distinct_plans, 5)
+        self.assertEqual(batch.group_passes, 1)
+        self.assertGreater(batch.seconds, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,133 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+from demo_data import make_demo_data
+from parse_cache import DEFAULT_MAX_BYTES, CachedParse, ParseCache, cache_key
+from pipeline import prepare_analysis, prepare_upload
+
+
+class ParseCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.cache = ParseCache(Path(self.directory.name))
+        self.contents = make_demo_data(rows=120).to_csv(index=False).encode()
+
+    def _entry(self, rows: int = 60) -> CachedParse:
+        prepared = prepare_analysis(make_demo_data(rows=rows), row_limit=rows)
+        return CachedParse(prepared.dataframe, prepared.cleaning_report, prepared.truncated_rows)
+
+    def test_key_covers_content_and_reader_options(self):
+        base = cache_key(self.contents, "orders.csv", sheet_name=None, row_limit=100)
+
+        self.assertEqual(base, cache_key(self.contents, "copy.CSV", sheet_name=None, row_limit=100))
+        changed = self.contents + b"\n"
+        self.assertNotEqual(base, cache_key(changed, "orders.csv", sheet_name=None, row_limit=100))
+        self.assertNotEqual(base, cache_key(self.contents, "orders.csv", sheet_name="Sales", row_limit=100))
+        self.assertNotEqual(base, cache_key(self.contents, "orders.csv", sheet_name=None, row_limit=50))
+
+    def test_round_trips_the_cleaned_frame_and_audit(self):
+        entry = self._entry()
+
+        self.assertTrue(self.cache.store("abc", entry))
+        loaded = self.cache.load("abc")
+
+        pd.testing.assert_frame_equal(loaded.dataframe, entry.dataframe)
+        self.assertEqual(loaded.cleaning_report, entry.cleaning_report)
+        self.assertEqual(loaded.cleaning_report.column_seconds, entry.cleaning_report.column_seconds)
+        self.assertIsNone(self.cache.load("missing"))
+
+    def test_corrupt_or_outdated_entries_are_dropped_as_misses(self):
+        records = {
+            "truncated": '{"cleaning_report": {',
+            "renamed": '{"report": {}, "truncated_rows": 0}',
+            "outdated": '{"cleaning_report": {"rows": 3}, "truncated_rows": 0}',
+            "listed": "[]",
+        }
+        for key, record in records.items():
+            with self.subTest(key):
+                self.assertTrue(self.cache.store(key, self._entry(rows=20)))
+                frame_path, record_path = self.cache._paths(key)
+                record_path.write_text(record)
+
+                self.assertIsNone(self.cache.load(key))
+                self.assertFalse(frame_path.exists() or record_path.exists())
+
+    def test_round_trips_the_exact_period_totals_of_a_sample(self):
+        prepared = prepare_analysis(make_demo_data(rows=400), row_limit=100, sampling="uniform")
+        entry = CachedParse(
+            prepared.dataframe,
+            prepared.cleaning_report,
+            prepared.truncated_rows,
+            period_totals=prepared.period_totals,
+        )
+
+        self.assertTrue(self.cache.store("sampled", entry))
+        loaded = self.cache.load("sampled").period_totals["Order Date"]
+        stored = prepared.period_totals["Order Date"]
+
+        pd.testing.assert_frame_equal(loaded.sums, stored.sums, check_freq=False)
+        pd.testing.assert_series_equal(loaded.rows, stored.rows, check_freq=False)
+        self.assertEqual((loaded.first, loaded.last), (stored.first, stored.last))
+
+    def test_evicts_least_recently_used_entries_over_budget(self):
+        for key in ("old", "recent", "newest"):
+            self.cache.store(key, self._entry())
+        for age, key in enumerate(("newest", "recent", "old")):
+            for path in self.cache.directory.glob(f"{key}.*"):
+                os.utime(path, (1_000 - age, 1_000 - age))
+        self.cache.load("old")
+        entry_size = max(
+            sum(path.stat().st_size for path in self.cache.directory.glob(f"{key}.*"))
+            for key in ("old", "recent", "newest")
+        )
+
+        ParseCache(self.cache.directory, max_bytes=entry_size * 2).evict()
+
+        remaining = {path.stem for path in self.cache.directory.glob("*.feather")}
+        self.assertEqual(remaining, {"old", "newest"})
+
+    def test_frames_without_a_columnar_form_are_skipped(self):
+        mixed = CachedParse(pd.DataFrame({"Value": [1, "two"]}), self._entry().cleaning_report, 0)
+
+        self.assertFalse(self.cache.store("mixed", mixed))
+        self.assertIsNone(self.cache.load("mixed"))
+
+    def test_repeat_upload_skips_parsing_and_cleaning(self):
+        first = prepare_upload(self.contents, "orders.csv", row_limit=100, cache=self.cache)
+
+        with (
+            mock.patch("pipeline.read_tabular_data") as reader,
+            mock.patch("pipeline.clean_dataframe") as cleaner,
+        ):
+            second = prepare_upload(self.contents, "orders.csv", row_limit=100, cache=self.cache)
+
+        reader.assert_not_called()
+        cleaner.assert_not_called()
+        pd.testing.assert_frame_equal(second.dataframe, first.dataframe)
+        self.assertEqual(second.truncated_rows, 20)
+        self.assertEqual(second.detected_roles, first.detected_roles)
+        self.assertEqual(second.csv_dialect, first.csv_dialect)
+
+    def test_cache_is_disabled_unless_configured(self):
+        with mock.patch.dict(os.environ, {"ADA_PARSE_CACHE_DIR": ""}):
+            self.assertIsNone(ParseCache.from_environment())
+        with mock.patch.dict(
+            os.environ, {"ADA_PARSE_CACHE_DIR": self.directory.name, "ADA_PARSE_CACHE_MAX_MB": "8"}
+        ):
+            self.assertEqual(ParseCache.from_environment().max_bytes, 8 * 1024 * 1024)
+        for malformed in ("eight", "-8", "0"):
+            settings = {"ADA_PARSE_CACHE_DIR": self.directory.name, "ADA_PARSE_CACHE_MAX_MB": malformed}
+            with self.subTest(malformed), mock.patch.dict(os.environ, settings):
+                with self.assertWarnsRegex(UserWarning, "ADA_PARSE_CACHE_MAX_MB"):
+                    cache = ParseCache.from_environment()
+                self.assertEqual(cache.max_bytes, DEFAULT_MAX_BYTES)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,27 @@
+import gzip
+import pickle
 import unittest
+from unittest import mock
 
+import pandas as pd
+
+import analysis
+import business_insights
+import pipeline
+from analysis import clean_dataframe, column_profile, generate_insights
+from business_insights import analyze_business, period_totals
 from demo_data import make_demo_data
+from file_io import read_tabular_file
+from nlq import answer_question, suggested_questions
 from pipeline import (
     apply_focus,
     apply_role_selection,
     cleaning_audit_frame,
     focus_options,
+    memory_audit_frame,
+    parse_audit_frame,
     prepare_analysis,
+    prepare_upload,
     schema_frame,
 )
 
@@ -22,6 +37,173 @@ class PipelineTests(unittest.TestCase):
         self.assertEqual(prepared.detected_roles.measure, "Revenue")
         self.assertTrue(prepared.analyze().headline)
 
+    def test_prepare_analysis_reports_rows_a_bounded_reader_skipped(self):
+        raw = make_demo_data(rows=50)
+
+        prepared = prepare_analysis(raw, row_limit=50, source_rows=80)
+
+        self.assertEqual(len(prepared.dataframe), 50)
+        self.assertEqual(prepared.truncated_rows, 30)
+
+    def test_prepare_upload_pushes_the_row_limit_into_the_reader(self):
+        contents = make_demo_data(rows=80).to_csv(index=False).encode()
+
+        prepared = prepare_upload(contents, "orders.csv", row_limit=50)
+
+        self.assertEqual(len(prepared.dataframe), 50)
+        self.assertEqual(prepared.truncated_rows, 30)
+        self.assertEqual(prepared.detected_roles.measure, "Revenue")
+
+    def test_memory_budget_downcasts_without_changing_results(self):
+        raw = make_demo_data(rows=400)
+
+        default = prepare_analysis(raw, row_limit=500)
+        budgeted = prepare_analysis(raw, row_limit=500, memory_budget=10 * 1024 * 1024)
+        audit = memory_audit_frame(budgeted.cleaning_report)
+
+        self.assertEqual(budgeted.dataframe["Units"].dtype, "int8")
+        self.assertEqual(budgeted.truncated_rows, 0)
+        self.assertTrue(budgeted.cleaning_report.memory_audited)
+        self.assertFalse(default.cleaning_report.memory_audited)
+        self.assertLess(budgeted.cleaning_report.bytes_after, budgeted.cleaning_report.bytes_before)
+        self.assertEqual(audit.columns.tolist(), ["Column", "Bytes before", "Bytes after", "Saved %"])
+        self.assertEqual(repr(budgeted.analyze()), repr(default.analyze()))
+        for question in suggested_questions(default.dataframe, default.detected_roles):
+            self.assertEqual(
+                repr(answer_question(question, budgeted.dataframe, budgeted.detected_roles)),
+                repr(answer_question(question, default.dataframe, default.detected_roles)),
+            )
+
+    def test_memory_budget_keeps_the_leading_rows_that_fit(self):
+        raw = make_demo_data(rows=400)
+        full = prepare_analysis(raw, row_limit=500, memory_budget=10 * 1024 * 1024)
+
+        budget = full.cleaning_report.bytes_after // 4
+
+        prepared = prepare_analysis(raw, row_limit=500, memory_budget=budget)
+        kept = len(prepared.dataframe)
+
+        # A quarter of the bytes holds a little under a quarter of the rows: categories are a fixed cost.
+        self.assertTrue(80 < kept < 100, kept)
+        self.assertEqual(prepared.truncated_rows, 400 - kept)
+        report = prepared.cleaning_report
+        self.assertEqual(report.final_rows, kept)
+        self.assertEqual(report.memory_budget_rows_removed, 400 - kept)
+        analyzed_bytes = prepared.dataframe.memory_usage(index=False, deep=True).sum()
+        self.assertEqual(report.bytes_after, int(analyzed_bytes))
+        self.assertLessEqual(report.bytes_after, budget)
+        audit = dict(cleaning_audit_frame(report).to_numpy().tolist())
+        self.assertEqual(audit["Rows left out to fit the memory budget"], 400 - kept)
+        pd.testing.assert_frame_equal(prepared.dataframe, full.dataframe.head(kept))
+        with self.assertRaises(ValueError):
+            prepare_analysis(raw, row_limit=500, memory_budget=1)
+
+    def test_one_analysis_scans_each_column_once(self):
+        def counted(method):
+            return mock.patch.object(pd.Series, method, autospec=True, side_effect=getattr(pd.Series, method))
+
+        with mock.patch("analysis.column_stats", wraps=analysis.column_stats) as scan:
+            prepared = prepare_analysis(make_demo_data(rows=300), row_limit=300)
+            with counted("nunique") as nunique, counted("quantile") as quantile:
+                prepared.analyze()
+                column_profile(prepared.dataframe, prepared.column_stats)
+                generate_insights(prepared.dataframe, stats=prepared.column_stats)
+
+        self.assertEqual(scan.call_count, len(prepared.dataframe.columns))
+        self.assertEqual(nunique.call_count, 0)
+        self.assertEqual(quantile.call_count, 0)
+
+    def test_prepared_version_survives_pickling_and_keys_period_reuse(self):
+        prepared = prepare_analysis(make_demo_data(rows=300), row_limit=300)
+        other = prepare_analysis(make_demo_data(rows=300), row_limit=300)
+        restored = pickle.loads(pickle.dumps(prepared))
+
+        derive = business_insights._period_starts
+        with mock.patch("business_insights._period_starts", wraps=derive) as derived:
+            prepared.analyze()
+            restored.analyze()
+
+        self.assertEqual(restored.version, prepared.version)
+        self.assertNotEqual(other.version, prepared.version)
+        self.assertEqual(derived.call_count, 1)
+
+    def test_samples_keep_exact_trends_that_truncation_loses(self):
+        raw = make_demo_data(rows=3_000).sort_values("Order Date", kind="stable").reset_index(drop=True)
+        full = prepare_analysis(raw, row_limit=10_000)
+        growth = next(item for item in full.analyze().evidence if item.kind == "trend")
+
+        head = prepare_analysis(raw, row_limit=600)
+        uniform = prepare_analysis(raw, row_limit=600, sampling="uniform")
+        periods = prepare_analysis(raw, row_limit=600, sampling="periods")
+
+        self.assertLess(head.dataframe["Order Date"].max(), full.dataframe["Order Date"].max())
+        self.assertEqual(len(uniform.dataframe), 600)
+        self.assertTrue(uniform.dataframe["Order Date"].is_monotonic_increasing)
+        self.assertEqual(uniform.truncated_rows, len(full.dataframe) - 600)
+        self.assertLessEqual(len(periods.dataframe), 600)
+        self.assertEqual(periods.dataframe["Order Date"].max(), full.dataframe["Order Date"].max())
+        for sampled in (uniform, periods):
+            evidence = next(item for item in sampled.analyze().evidence if item.kind == "trend")
+            self.assertEqual(evidence.value, growth.value)
+            self.assertIn("not only the sample", evidence.calculation)
+        pd.testing.assert_frame_equal(
+            prepare_analysis(raw, row_limit=600, sampling="uniform").dataframe, uniform.dataframe
+        )
+        with self.assertRaises(ValueError):
+            prepare_analysis(raw, row_limit=600, sampling="tail")
+
+    def test_sampled_kpis_total_every_row_and_label_the_sample(self):
+        raw = make_demo_data(rows=3_000)
+        full = prepare_analysis(raw, row_limit=10_000).analyze()
+        sampled = prepare_analysis(raw, row_limit=600, sampling="uniform").analyze()
+        full_kpis = {kpi.label: kpi for kpi in full.kpis}
+        kpis = {kpi.label: kpi for kpi in sampled.kpis}
+
+        self.assertEqual(kpis["Total Revenue"].value, full_kpis["Total Revenue"].value)
+        self.assertEqual(kpis["Total Revenue"].context, "Across all 3,000 dated records")
+        self.assertIn("in the sample", kpis["Average Revenue"].context)
+
+    def test_sampled_uploads_are_cleaned_one_bounded_chunk_at_a_time(self):
+        raw = make_demo_data(rows=3_000)
+        contents = gzip.compress(pd.concat([raw, raw.head(300)]).to_csv(index=False).encode())
+        with mock.patch("pipeline.SAMPLE_CHUNK_ROWS", 500):
+            expected = prepare_analysis(raw, row_limit=600, sampling="periods")
+
+        with (
+            mock.patch("file_io.CSV_CHUNK_ROWS", 500),
+            mock.patch("pipeline.clean_dataframe", wraps=pipeline.clean_dataframe) as clean,
+        ):
+            prepared = prepare_upload(contents, "orders.csv.gz", row_limit=600, sampling="periods")
+
+        self.assertLessEqual(max(len(call.args[0]) for call in clean.call_args_list), 600)
+        pd.testing.assert_frame_equal(prepared.dataframe, expected.dataframe)
+        self.assertEqual(prepared.truncated_rows, expected.truncated_rows)
+        self.assertEqual(prepared.cleaning_report.duplicate_rows_removed, 300)
+        totals, exact = prepared.period_totals["Order Date"], expected.period_totals["Order Date"]
+        pd.testing.assert_frame_equal(totals.sums, exact.sums)
+        pd.testing.assert_series_equal(totals.rows, exact.rows)
+
+    def test_sampled_totals_hold_when_one_chunk_reads_a_column_as_text(self):
+        raw = make_demo_data(rows=3_000)
+        raw["Revenue"] = raw["Revenue"].astype(object)
+        raw.loc[range(1_000, 1_500, 10), "Revenue"] = "unknown"
+        # Rows from the text-typed chunk repeat in a later chunk where Revenue reads as numbers.
+        repeats = raw.iloc[1_001:1_101].loc[lambda frame: frame["Revenue"] != "unknown"]
+        contents = pd.concat([raw, repeats]).to_csv(index=False).encode()
+        whole, _ = clean_dataframe(read_tabular_file(contents, "orders.csv"))
+        exact = period_totals(whole)["Order Date"]
+
+        with mock.patch("file_io.CSV_CHUNK_ROWS", 500):
+            prepared = prepare_upload(contents, "orders.csv", row_limit=600, sampling="uniform")
+
+        totals = prepared.period_totals["Order Date"]
+        pd.testing.assert_frame_equal(totals.sums[exact.sums.columns], exact.sums)
+        pd.testing.assert_series_equal(totals.rows, exact.rows)
+        self.assertEqual(prepared.cleaning_report.duplicate_rows_removed, len(repeats))
+        self.assertEqual(prepared.cleaning_report.final_rows, len(whole))
+        kpis = {kpi.label: kpi for kpi in prepared.analyze().kpis}
+        self.assertEqual(kpis["Total Revenue"].context, f"Across all {len(whole):,} dated records")
+
     def test_role_overrides_preserve_detected_candidates(self):
         prepared = prepare_analysis(make_demo_data(rows=100), row_limit=100)
 
@@ -57,6 +239,21 @@ class PipelineTests(unittest.TestCase):
         self.assertEqual(focused_roles.dimension, "Region")
         self.assertEqual(focused_roles.measure, prepared.detected_roles.measure)
 
+    def test_categorical_dimensions_drill_down_like_text(self):
+        prepared = prepare_analysis(make_demo_data(rows=600), row_limit=600)
+        roles = prepared.detected_roles
+        text = prepared.dataframe.astype(
+            {column: object for column in prepared.dataframe.select_dtypes("category").columns}
+        )
+
+        self.assertGreater(prepared.cleaning_report.categorical_columns_encoded, 0)
+        self.assertEqual(focus_options(prepared.dataframe, roles), focus_options(text, roles))
+        for focus in focus_options(text, roles):
+            encoded = apply_focus(prepared.dataframe, roles, focus)
+            plain = apply_focus(text, roles, focus)
+            self.assertEqual(focus_options(*encoded), focus_options(*plain))
+            self.assertEqual(repr(analyze_business(*encoded)), repr(analyze_business(*plain)))
+
     def test_focus_is_a_no_op_for_missing_or_unknown_values(self):
         prepared = prepare_analysis(make_demo_data(rows=200), row_limit=200)
 
@@ -75,6 +272,42 @@ class PipelineTests(unittest.TestCase):
         self.assertEqual(schema.columns.tolist(), ["Role", "Column"])
         self.assertIn("Primary metric", schema["Role"].tolist())
 
+    def test_csv_parse_choices_are_reported(self):
+        contents = "Export: Q1 sales\nRégion;Revenue\nWest;1200\n".encode("latin-1")
+
+        prepared = prepare_upload(contents, "sales.csv", row_limit=10)
+        settings = dict(parse_audit_frame(prepared.csv_dialect).to_numpy().tolist())
+
+        self.assertEqual(settings["Encoding"], "Latin-1")
+        self.assertEqual(settings["Delimiter"], "Semicolon")
+        self.assertEqual(settings["Preamble lines skipped"], "1")
+        self.assertEqual(prepared.dataframe.columns.tolist(), ["Région", "Revenue"])
+
+    def test_arrow_dtypes_keep_text_in_arrow_and_change_no_result(self):
+        contents = make_demo_data(rows=400).to_csv(index=False).encode()
+
+        default = prepare_upload(contents, "orders.csv", row_limit=500)
+        arrow = prepare_upload(contents, "orders.csv", row_limit=500, arrow_dtypes=True)
+
+        self.assertIsInstance(arrow.dataframe["Order ID"].dtype, pd.StringDtype)
+        self.assertIsInstance(arrow.dataframe["Region"].cat.categories.dtype, pd.StringDtype)
+        pd.testing.assert_frame_equal(
+            arrow.dataframe, default.dataframe, check_dtype=False, check_categorical=False
+        )
+        self.assertEqual(arrow.cleaning_report, default.cleaning_report)
+        self.assertEqual(arrow.detected_roles, default.detected_roles)
+        self.assertEqual(repr(arrow.analyze()), repr(default.analyze()))
+        self.assertEqual(
+            focus_options(arrow.dataframe, arrow.detected_roles),
+            focus_options(default.dataframe, default.detected_roles),
+        )
+        questions = suggested_questions(default.dataframe, default.detected_roles) + ["revenue in West"]
+        for question in questions:
+            self.assertEqual(
+                repr(answer_question(question, arrow.dataframe, arrow.detected_roles)),
+                repr(answer_question(question, default.dataframe, default.detected_roles)),
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
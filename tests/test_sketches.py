@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+
+from sketches import KLL_RANK_ERROR, SKETCH_CHUNK_ROWS, HyperLogLog, KLLSketch
+
+
+def feed(sketch, values):
+    for start in range(0, len(values), SKETCH_CHUNK_ROWS):
+        sketch.update(values[start : start + SKETCH_CHUNK_ROWS])
+    return sketch
+
+
+class HyperLogLogTests(unittest.TestCase):
+    def test_estimates_stay_within_three_standard_errors(self):
+        rng = np.random.default_rng(3)
+        for distinct in (10, 5_000, 300_000):
+            values = rng.choice(rng.normal(size=distinct), 400_000)
+            sketch = feed(HyperLogLog(), values)
+
+            error = sketch.estimate() / len(np.unique(values)) - 1
+
+            self.assertLess(abs(error), 3 * sketch.relative_error, distinct)
+
+    def test_signed_zeros_count_once_and_order_does_not_matter(self):
+        values = np.array([0.0, -0.0, 1.0, 2.0, 2.0])
+
+        forward = feed(HyperLogLog(), values)
+        backward = feed(HyperLogLog(), values[::-1].copy())
+
+        self.assertAlmostEqual(forward.estimate(), 3, delta=0.01)
+        np.testing.assert_array_equal(forward.registers, backward.registers)
+
+
+class KLLSketchTests(unittest.TestCase):
+    def test_quantiles_stay_within_the_disclosed_rank_error(self):
+        rng = np.random.default_rng(5)
+        values = np.concatenate([rng.lognormal(3, 1, 600_000), rng.integers(0, 50, 400_000)])
+        rng.shuffle(values)
+        ordered = np.sort(values)
+
+        estimates = feed(KLLSketch(), values).quantiles((0.1, 0.25, 0.5, 0.75, 0.9))
+
+        for probability, estimate in zip((0.1, 0.25, 0.5, 0.75, 0.9), estimates, strict=True):
+            low = np.searchsorted(ordered, estimate, "left") / len(values)
+            high = np.searchsorted(ordered, estimate, "right") / len(values)
+            self.assertLessEqual(low - KLL_RANK_ERROR, probability)
+            self.assertGreaterEqual(high + KLL_RANK_ERROR, probability)
+
+    def test_memory_is_bounded_and_results_repeat(self):
+        values = np.random.default_rng(9).normal(size=500_000)
+
+        first = feed(KLLSketch(), values)
+        second = feed(KLLSketch(), values)
+
+        self.assertEqual(first.count, len(values))
+        self.assertLess(sum(len(level) for level in first._levels), 1_000)
+        self.assertEqual(first.quantiles((0.25, 0.75)), second.quantiles((0.25, 0.75)))
+        self.assertTrue(np.isnan(KLLSketch().quantiles((0.5,))[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
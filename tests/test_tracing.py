@@ -0,0 +1,90 @@
+import contextvars
+import json
+import threading
+import tracemalloc
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from tracing import Trace, activate, stage, traced
+
+
+@traced
+def allocate(megabytes: int) -> int:
+    return int(np.ones(megabytes * 1024 * 1024 // 8).sum())
+
+
+class TracingTests(unittest.TestCase):
+    def tearDown(self):
+        activate(None)
+        tracemalloc.stop()
+
+    def test_disabled_stages_record_nothing_and_return_results(self):
+        trace = Trace()
+
+        with stage("outer"):
+            result = allocate(1)
+
+        self.assertEqual(result, 1024 * 1024 // 8)
+        self.assertEqual(len(trace.records), 0)
+
+    def test_nested_stages_report_depth_time_and_peak_bytes(self):
+        trace = Trace()
+        trace.new_run()
+        activate(trace)
+
+        with stage("outer"):
+            allocate(8)
+            allocate(2)
+
+        records = trace.latest()
+        outer, first, second = records
+        self.assertEqual([record.name for record in records], ["outer", "allocate", "allocate"])
+        self.assertEqual([record.depth for record in records], [0, 1, 1])
+        self.assertGreaterEqual(first.peak_bytes, 8 * 1024 * 1024)
+        self.assertLess(second.peak_bytes, 4 * 1024 * 1024)
+        self.assertGreaterEqual(outer.peak_bytes, first.peak_bytes)
+        self.assertGreaterEqual(outer.wall_seconds, first.wall_seconds + second.wall_seconds)
+
+    def test_runs_are_kept_apart_and_export_as_json(self):
+        trace = Trace(memory=False)
+        activate(trace)
+        for _ in range(2):
+            trace.new_run()
+            allocate(1)
+
+        exported = json.loads(trace.to_json())
+
+        self.assertEqual(exported["run"], 2)
+        self.assertEqual([entry["run"] for entry in exported["stages"]], [1, 2])
+        self.assertIsNone(exported["stages"][0]["peak_bytes"])
+        self.assertEqual(len(trace.latest()), 1)
+
+    def test_tracing_is_per_thread(self):
+        trace = Trace(memory=False)
+        activate(trace)
+
+        worker = threading.Thread(target=allocate, args=(1,))
+        worker.start()
+        worker.join()
+
+        self.assertEqual(len(trace.records), 0)
+
+
+    def test_pool_work_in_a_copied_context_nests_under_its_stage(self):
+        trace = Trace(memory=False)
+        trace.new_run()
+        activate(trace)
+
+        with ThreadPoolExecutor(max_workers=2) as pool, stage("outer"):
+            futures = [pool.submit(contextvars.copy_context().run, allocate, 1) for _ in range(2)]
+            results = [future.result() for future in futures]
+
+        self.assertEqual(results, [1024 * 1024 // 8] * 2)
+        records = trace.latest()
+        self.assertEqual([record.name for record in records], ["outer", "allocate", "allocate"])
+        self.assertEqual([record.depth for record in records], [0, 1, 1])
+
+if __name__ == "__main__":
+    unittest.main()
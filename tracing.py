@@ -0,0 +1,138 @@
+"""Per-stage wall time, CPU time, and peak allocation, recorded into a per-session trace.
+
+Pipeline stages are marked with ``@traced`` or ``with stage(...)``. Nothing is
+recorded unless a ``Trace`` has been activated for the current thread, so a
+disabled stage costs one context-variable lookup. Work handed to a thread pool
+records into the same trace, nested under the stage that submitted it, when it
+runs in a copy of the submitting context (``contextvars.copy_context().run``). Peak bytes come from
+``tracemalloc``, which also sees NumPy and pandas buffers; it is started only
+by a trace that measures memory, and it is process-wide, so concurrent
+sessions share its peaks. CPU time is the process's, for the same reason.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import time
+import tracemalloc
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, ParamSpec, TypeVar
+
+TRACE_RECORDS = 500
+
+_ACTIVE: ContextVar[Trace | None] = ContextVar("ada_trace", default=None)
+# The stages open in this context, outermost first; a copied context starts from its parent's.
+_OPEN: ContextVar[tuple[_OpenStage, ...]] = ContextVar("ada_trace_open", default=())
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class StageRecord:
+    run: int
+    name: str
+    depth: int
+    start_seconds: float
+    wall_seconds: float
+    cpu_seconds: float
+    peak_bytes: int | None
+
+
+@dataclass
+class _OpenStage:
+    start_bytes: int
+    peak: int
+
+
+class Trace:
+    """The most recent ``TRACE_RECORDS`` stages of one session, grouped by script run."""
+
+    def __init__(self, *, memory: bool = True) -> None:
+        self.memory = memory
+        self.run = 0
+        self.records: deque[StageRecord] = deque(maxlen=TRACE_RECORDS)
+        self._run_started = time.perf_counter()
+
+    def new_run(self) -> None:
+        self.run += 1
+        self._run_started = time.perf_counter()
+
+    def latest(self) -> list[StageRecord]:
+        """The current run's stages in the order they started."""
+        current = [record for record in self.records if record.run == self.run]
+        return sorted(current, key=lambda record: record.start_seconds)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        current = 0
+        parents = _OPEN.get()
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            current, peak = tracemalloc.get_traced_memory()
+            if parents:
+                # Fold the enclosing stage's peak so far in before this stage resets it.
+                parents[-1].peak = max(parents[-1].peak, peak)
+            tracemalloc.reset_peak()
+        opened = _OpenStage(start_bytes=current, peak=current)
+        depth = len(parents)
+        token = _OPEN.set((*parents, opened))
+        started, cpu_started = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - started, time.process_time() - cpu_started
+            _OPEN.reset(token)
+            peak_bytes = None
+            if self.memory:
+                opened.peak = max(opened.peak, tracemalloc.get_traced_memory()[1])
+                peak_bytes = opened.peak - opened.start_bytes
+                if parents:
+                    parents[-1].peak = max(parents[-1].peak, opened.peak)
+            self.records.append(
+                StageRecord(
+                    run=self.run,
+                    name=name,
+                    depth=depth,
+                    start_seconds=started - self._run_started,
+                    wall_seconds=wall,
+                    cpu_seconds=cpu,
+                    peak_bytes=peak_bytes,
+                )
+            )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"run": self.run, "stages": [asdict(record) for record in self.records]}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+
+def activate(trace: Trace | None) -> None:
+    """Record this thread's stages into ``trace`` from now on; ``None`` disables tracing."""
+    _ACTIVE.set(trace)
+
+
+def stage(name: str) -> AbstractContextManager[None]:
+    trace = _ACTIVE.get()
+    return nullcontext() if trace is None else trace.stage(name)
+
+
+def traced(function: Callable[P, R]) -> Callable[P, R]:
+    """Record every call of ``function`` as a stage named after it."""
+
+    @functools.wraps(function)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        trace = _ACTIVE.get()
+        if trace is None:
+            return function(*args, **kwargs)
+        with trace.stage(function.__name__):
+            return function(*args, **kwargs)
+
+    return wrapper
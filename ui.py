@@ -11,10 +11,14 @@ import plotly.graph_objects as go
 import streamlit as st
 
 from ai_insights import AINarrative
+from analysis import ColumnStats, frame_stats
 from anomalies import detect_anomalies
 from business_insights import (
+    AggregateCube,
     BusinessBrief,
     ColumnRoles,
+    PeriodTotals,
+    aggregate_cube,
     driver_frame,
     heatmap_frame,
     segment_frame,
@@ -22,6 +26,7 @@ from business_insights import (
 )
 from forecasting import build_forecast
 from nlq import QueryAnswer
+from tracing import traced
 
 ACCENT = "#635BFF"
 LIME = "#C7F36B"
@@ -205,9 +210,17 @@ def style_chart(figure: go.Figure, *, height: int = 390) -> go.Figure:
     return figure
 
 
-def render_dashboard(dataframe: pd.DataFrame, roles: ColumnRoles) -> None:
-    trend = trend_frame(dataframe, roles)
-    segments = segment_frame(dataframe, roles)
+@traced
+def render_dashboard(
+    dataframe: pd.DataFrame,
+    roles: ColumnRoles,
+    stats: dict[str, ColumnStats] | None = None,
+    totals: PeriodTotals | None = None,
+    cube: AggregateCube | None = None,
+) -> None:
+    cube = cube or aggregate_cube(dataframe, roles)
+    trend = trend_frame(dataframe, roles, totals=totals, cube=cube)
+    segments = segment_frame(dataframe, roles, cube=cube)
     chart_columns = st.columns(2, gap="medium")
     with chart_columns[0]:
         if not trend.empty:
@@ -290,7 +303,7 @@ def render_dashboard(dataframe: pd.DataFrame, roles: ColumnRoles) -> None:
 
     movement_columns = st.columns(2, gap="medium")
     with movement_columns[0]:
-        drivers = driver_frame(dataframe, roles)
+        drivers = driver_frame(dataframe, roles, cube=cube)
         if not drivers.empty:
             waterfall = go.Figure(
                 go.Waterfall(
@@ -313,7 +326,7 @@ def render_dashboard(dataframe: pd.DataFrame, roles: ColumnRoles) -> None:
             )
 
     with movement_columns[1]:
-        heat = heatmap_frame(dataframe, roles)
+        heat = heatmap_frame(dataframe, roles, cube=cube)
         if not heat.empty and len(heat.columns) >= 2:
             heatmap = go.Figure(
                 go.Heatmap(
@@ -336,7 +349,8 @@ def render_dashboard(dataframe: pd.DataFrame, roles: ColumnRoles) -> None:
                 unsafe_allow_html=True,
             )
 
-    numeric = [column for column in roles.numeric if dataframe[column].nunique(dropna=True) > 2]
+    stats = stats or frame_stats(dataframe)
+    numeric = [column for column in roles.numeric if stats[column].distinct > 2]
     lower_columns = st.columns(2, gap="medium")
     with lower_columns[0]:
         if roles.measure:
@@ -392,8 +406,12 @@ def _chat_answer_figure(result: QueryAnswer) -> go.Figure | None:
     return style_chart(figure, height=320)
 
 
-def render_chat_answer(result: QueryAnswer) -> None:
-    """Render one answered question with its table, chart, and calculation."""
+def render_chat_answer(result: QueryAnswer, sample_rows: int | None = None) -> None:
+    """Render one answered question with its table, chart, and calculation.
+
+    ``sample_rows`` marks an answer computed over a sample of the file, so its
+    sums and counts are not mistaken for whole-file figures.
+    """
     if result.plan.source == "ai":
         st.markdown(
             '<span class="ai-plan-badge">AI-planned · executed locally · schema only</span>',
@@ -406,8 +424,9 @@ def render_chat_answer(result: QueryAnswer) -> None:
     if result.table is not None and not result.table.empty:
         with st.expander("See the numbers"):
             st.dataframe(result.table, hide_index=True, width="stretch")
+    scope = f" · over a {sample_rows:,}-row sample of the file" if sample_rows is not None else ""
     st.markdown(
-        f'<p class="calculation chat-calc">CALC · {escape(result.calculation)}</p>',
+        f'<p class="calculation chat-calc">CALC · {escape(result.calculation)}{scope}</p>',
         unsafe_allow_html=True,
     )
 